@@ -0,0 +1,90 @@
+"""Store audit_logs.details as JSONB with a GIN index
+
+Revision ID: 034_audit_details_jsonb
+Revises: 033_dedupe_chunks_unique_index
+Create Date: 2026-10-17
+
+Every writer json.dumps()'d a dict into a TEXT column, so details could
+neither be queried nor indexed without a cast per row. Rows that are not
+valid JSON (the confidential-access trigger wrote a bare sentence) are kept
+as JSON strings. The trigger is updated to write a JSON object.
+"""
+
+from alembic import op
+
+revision = "034_audit_details_jsonb"
+down_revision = "033_dedupe_chunks_unique_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE sowknow.audit_logs
+        ALTER COLUMN details TYPE jsonb
+        USING CASE
+            WHEN details IS NULL THEN NULL
+            WHEN details IS JSON THEN details::jsonb
+            ELSE to_jsonb(details)
+        END
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_audit_logs_details_gin
+        ON sowknow.audit_logs USING GIN (details jsonb_path_ops)
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sowknow.log_confidential_access()
+        RETURNS TRIGGER LANGUAGE plpgsql AS $func$
+        BEGIN
+            IF NEW.bucket::text IN ('confidential', 'CONFIDENTIAL') THEN
+                INSERT INTO sowknow.audit_logs
+                    (user_id, action, resource_type, resource_id,
+                     details, ip_address)
+                VALUES (
+                    NULLIF(current_setting('app.user_id', true), '')::uuid,
+                    'confidential_accessed'::sowknow.auditaction,
+                    'document',
+                    NEW.id::text,
+                    jsonb_build_object('message', 'Confidential document accessed'),
+                    current_setting('app.client_ip', true)
+                );
+            END IF;
+            RETURN NEW;
+        END;
+        $func$
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sowknow.log_confidential_access()
+        RETURNS TRIGGER LANGUAGE plpgsql AS $func$
+        BEGIN
+            IF NEW.bucket::text IN ('confidential', 'CONFIDENTIAL') THEN
+                INSERT INTO sowknow.audit_logs
+                    (user_id, action, resource_type, resource_id,
+                     details, ip_address)
+                VALUES (
+                    NULLIF(current_setting('app.user_id', true), '')::uuid,
+                    'confidential_accessed'::sowknow.auditaction,
+                    'document',
+                    NEW.id::text,
+                    'Confidential document accessed',
+                    current_setting('app.client_ip', true)
+                );
+            END IF;
+            RETURN NEW;
+        END;
+        $func$
+    """)
+    op.execute("DROP INDEX IF EXISTS sowknow.idx_audit_logs_details_gin")
+    op.execute("""
+        ALTER TABLE sowknow.audit_logs
+        ALTER COLUMN details TYPE text
+        USING CASE
+            WHEN jsonb_typeof(details) = 'string' THEN details #>> '{}'
+            ELSE details::text
+        END
+    """)
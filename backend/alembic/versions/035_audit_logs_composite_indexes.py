@@ -0,0 +1,46 @@
+"""Replace single-column audit_logs user_id/action indexes with (col, created_at DESC)
+
+Revision ID: 035_audit_logs_composite_indexes
+Revises: 034_audit_details_jsonb
+Create Date: 2026-10-18
+
+The admin audit view filters by user_id or action within a created_at window
+and orders newest-first. Composite (col, created_at DESC) indexes answer that
+with a bounded index range scan and no sort, and still serve plain equality
+lookups on user_id / action, so the single-column indexes are dropped.
+Earlier migrations created those under two naming schemes (007 and 011).
+"""
+
+from alembic import op
+
+revision = "035_audit_logs_composite_indexes"
+down_revision = "034_audit_details_jsonb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_audit_logs_user_time
+        ON sowknow.audit_logs (user_id, created_at DESC)
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_audit_logs_action_time
+        ON sowknow.audit_logs (action, created_at DESC)
+    """)
+
+    for name in (
+        "ix_audit_logs_user_id",
+        "ix_audit_logs_action",
+        "ix_sowknow_audit_logs_user_id",
+        "ix_sowknow_audit_logs_action",
+    ):
+        op.execute(f"DROP INDEX IF EXISTS sowknow.{name}")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_user_id ON sowknow.audit_logs (user_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_action ON sowknow.audit_logs (action)")
+    op.execute("DROP INDEX IF EXISTS sowknow.ix_audit_logs_action_time")
+    op.execute("DROP INDEX IF EXISTS sowknow.ix_audit_logs_user_time")
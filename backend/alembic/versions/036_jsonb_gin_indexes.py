@@ -0,0 +1,41 @@
+"""Add GIN (jsonb_path_ops) indexes on entities.aliases and timeline_events.entity_ids
+
+Revision ID: 036_jsonb_gin_indexes
+Revises: 035_audit_logs_composite_indexes
+Create Date: 2026-10-18
+
+Both columns are filtered with JSONB containment (@>): alias resolution in
+the smart-folder entity resolver and per-entity timelines. Without an index
+each lookup is a sequential scan that parses every row's JSONB value.
+jsonb_path_ops supports only containment/jsonpath operators, which is all
+these queries use, and builds a noticeably smaller index than jsonb_ops.
+
+The indexes are built CONCURRENTLY outside the migration transaction so the
+build does not hold a write lock on either table.
+"""
+
+from alembic import op
+
+revision = "036_jsonb_gin_indexes"
+down_revision = "035_audit_logs_composite_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_entities_aliases_gin
+            ON sowknow.entities USING GIN (aliases jsonb_path_ops)
+        """)
+
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_timeline_events_entity_ids_gin
+            ON sowknow.timeline_events USING GIN (entity_ids jsonb_path_ops)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_timeline_events_entity_ids_gin")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_entities_aliases_gin")
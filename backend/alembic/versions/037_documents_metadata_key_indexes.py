@@ -0,0 +1,40 @@
+"""Add expression indexes on documents.metadata sha256_hash / document_type
+
+Revision ID: 037_documents_metadata_key_indexes
+Revises: 036_jsonb_gin_indexes
+Create Date: 2026-10-18
+
+Upload de-duplication looks documents up by metadata->>'sha256_hash' and the
+document list / journal search filter on metadata->>'document_type'. Both
+were sequential scans re-parsing every row's metadata. B-tree indexes on the
+extracted text serve the equality lookups directly and give the planner
+per-key statistics (ANALYZE collects stats for expression indexes).
+"""
+
+from alembic import op
+
+revision = "037_documents_metadata_key_indexes"
+down_revision = "036_jsonb_gin_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_metadata_sha256
+            ON sowknow.documents ((metadata ->> 'sha256_hash'))
+        """)
+
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_metadata_document_type
+            ON sowknow.documents ((metadata ->> 'document_type'))
+        """)
+
+    op.execute("ANALYZE sowknow.documents")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_documents_metadata_document_type")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_documents_metadata_sha256")
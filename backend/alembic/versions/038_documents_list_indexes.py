@@ -0,0 +1,48 @@
+"""Replace documents bucket / (bucket, status) indexes with created_at DESC composites
+
+Revision ID: 038_documents_list_indexes
+Revises: 037_documents_metadata_key_indexes
+Create Date: 2026-10-18
+
+GET /documents filters on bucket (always, for non-admin users) and optionally
+status, then orders by created_at DESC with LIMIT/OFFSET. With separate
+(bucket, status) and (created_at) indexes Postgres picks one and sorts the
+rest. (bucket, created_at DESC) and (bucket, status, created_at DESC) return
+the page straight from the index, and their prefixes still serve plain bucket
+and bucket+status lookups, so ix_documents_bucket and ix_documents_bucket_status
+(001) are dropped. No INCLUDE columns: the endpoint returns whole rows, so an
+index-only scan is not reachable and the extra width would only cost writes.
+"""
+
+from alembic import op
+
+revision = "038_documents_list_indexes"
+down_revision = "037_documents_metadata_key_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_bucket_created
+            ON sowknow.documents (bucket, created_at DESC)
+        """)
+
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_bucket_status_created
+            ON sowknow.documents (bucket, status, created_at DESC)
+        """)
+
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_documents_bucket_status")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_documents_bucket")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_bucket ON sowknow.documents (bucket)")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_bucket_status ON sowknow.documents (bucket, status)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_documents_bucket_status_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_documents_bucket_created")
@@ -0,0 +1,48 @@
+"""Index processing_queue by document and add partial indexes for live rows
+
+Revision ID: 039_processing_queue_indexes
+Revises: 038_documents_list_indexes
+Create Date: 2026-10-18
+
+- (document_id, task_type): every per-document lookup (document detail,
+  task recovery, anomaly sweeps) and the ON DELETE CASCADE from documents
+  were sequential scans; the FK column had no index.
+- (created_at) WHERE status = 'pending' and (started_at) WHERE status =
+  'in_progress': the admin queue stats list pending tasks and pick the
+  longest-running one. The partial indexes only contain live rows, so they
+  stay small as completed rows accumulate.
+"""
+
+from alembic import op
+
+revision = "039_processing_queue_indexes"
+down_revision = "038_documents_list_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_processing_queue_document_task
+            ON sowknow.processing_queue (document_id, task_type)
+        """)
+
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_processing_queue_pending
+            ON sowknow.processing_queue (created_at)
+            WHERE status = 'pending'
+        """)
+
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_processing_queue_inflight
+            ON sowknow.processing_queue (started_at)
+            WHERE status = 'in_progress'
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_processing_queue_inflight")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_processing_queue_pending")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_processing_queue_document_task")
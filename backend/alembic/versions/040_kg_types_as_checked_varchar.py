@@ -0,0 +1,65 @@
+"""Store entity_type / relation_type as VARCHAR + CHECK instead of native enums
+
+Revision ID: 040_kg_types_as_checked_varchar
+Revises: 039_processing_queue_indexes
+Create Date: 2026-10-18
+
+Entity and relation types come from LLM extraction and are the value sets
+most likely to grow. As native enums every addition needs ALTER TYPE ... ADD
+VALUE, which cannot be used in the transaction that adds it and cannot be
+reverted. As VARCHAR(32) with a named CHECK, adding a value is a constraint
+swap in an ordinary migration. The types are only used by these columns, so
+they are dropped.
+"""
+
+from alembic import op
+
+revision = "040_kg_types_as_checked_varchar"
+down_revision = "039_processing_queue_indexes"
+branch_labels = None
+depends_on = None
+
+ENTITY_TYPES = (
+    "person", "organization", "location", "concept", "event", "date", "product", "project", "other",
+)
+RELATION_TYPES = (
+    "works_at", "founded", "ceo_of", "employee_of", "client_of", "partner_of", "related_to",
+    "mentioned_with", "located_in", "happened_on", "created_on", "references", "part_of",
+    "owned_by", "member_of", "other",
+)
+
+# (table, column, enum type, CHECK constraint, values)
+COLUMNS = (
+    ("entities", "entity_type", "entitytype", "ck_entities_entity_type", ENTITY_TYPES),
+    (
+        "entity_relationships", "relation_type", "relationtype",
+        "ck_entity_relationships_relation_type", RELATION_TYPES,
+    ),
+)
+
+
+def _in_list(values: tuple[str, ...]) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def upgrade() -> None:
+    for table, column, enum_type, constraint, values in COLUMNS:
+        op.execute(f"""
+            ALTER TABLE sowknow.{table}
+            ALTER COLUMN {column} TYPE varchar(32) USING {column}::text
+        """)
+        op.execute(f"""
+            ALTER TABLE sowknow.{table}
+            ADD CONSTRAINT {constraint} CHECK ({column} IN ({_in_list(values)}))
+        """)
+        op.execute(f"DROP TYPE IF EXISTS sowknow.{enum_type}")
+
+
+def downgrade() -> None:
+    for table, column, enum_type, constraint, values in COLUMNS:
+        op.execute(f"CREATE TYPE sowknow.{enum_type} AS ENUM ({_in_list(values)})")
+        op.execute(f"ALTER TABLE sowknow.{table} DROP CONSTRAINT IF EXISTS {constraint}")
+        op.execute(f"""
+            ALTER TABLE sowknow.{table}
+            ALTER COLUMN {column} TYPE sowknow.{enum_type} USING {column}::sowknow.{enum_type}
+        """)
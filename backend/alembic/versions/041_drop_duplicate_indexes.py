@@ -0,0 +1,59 @@
+"""Drop auto-named indexes that duplicate explicitly declared ones
+
+Revision ID: 041_drop_duplicate_indexes
+Revises: 040_kg_types_as_checked_varchar
+Create Date: 2026-10-18
+
+Several models declared both ``Column(..., index=True)`` and an explicit
+``Index(...)`` on the same column, so a schema built by create_all (startup
+DDL) maintained two identical B-trees per column. The models now declare
+each index once; this drops the auto-named ``ix_sowknow_*`` twins where they
+exist. Schemas built purely by migrations never had them, so every drop is
+IF EXISTS.
+
+ix_sowknow_document_chunks_embedding_vector was a B-tree on the 1024-dim
+vector itself (next to the ivfflat index); besides being useless for
+similarity search, its entries exceed the B-tree row size limit.
+"""
+
+from alembic import op
+
+revision = "041_drop_duplicate_indexes"
+down_revision = "040_kg_types_as_checked_varchar"
+branch_labels = None
+depends_on = None
+
+DUPLICATES = (
+    "ix_sowknow_document_tags_tag_name",
+    "ix_sowknow_document_chunks_embedding_vector",
+    "ix_sowknow_articles_content_hash",
+    "ix_sowknow_collections_user_id",
+    "ix_sowknow_collection_items_document_id",
+    "ix_sowknow_collection_items_collection_id",
+    "ix_sowknow_collection_chat_sessions_collection_id",
+    "ix_sowknow_collection_chat_sessions_user_id",
+    "ix_sowknow_entities_entity_type",
+    "ix_sowknow_entities_name",
+    "ix_sowknow_entity_relationships_source_id",
+    "ix_sowknow_entity_relationships_target_id",
+    "ix_sowknow_entity_relationships_relation_type",
+    "ix_sowknow_entity_mentions_entity_id",
+    "ix_sowknow_entity_mentions_document_id",
+    "ix_sowknow_timeline_events_event_date",
+    "ix_sowknow_milestones_entity_id",
+    "ix_sowknow_milestones_date",
+    "ix_sowknow_pattern_insights_entity_id",
+    "ix_sowknow_pattern_insights_insight_type",
+    "ix_sowknow_tags_tag_name",
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in DUPLICATES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS sowknow.{name}")
+
+
+def downgrade() -> None:
+    # The explicitly named indexes cover the same columns; nothing to restore.
+    pass
@@ -0,0 +1,42 @@
+"""Drop the IVFFlat chunk index that startup DDL kept recreating
+
+Revision ID: 042_drop_chunk_ivfflat_index
+Revises: 041_drop_duplicate_indexes
+Create Date: 2026-10-18
+
+Migrations 010/024 replaced ix_document_chunks_embedding_vector (IVFFlat)
+with ix_document_chunks_embedding_hnsw, but the DocumentChunk model still
+declared the IVFFlat index, so create_all at startup rebuilt it next to the
+HNSW one. It used the default vector_l2_ops opclass, which the cosine
+(<=>) searches cannot use, so every chunk insert paid for an index no query
+read. The models now declare the HNSW indexes; this drops the leftover.
+"""
+
+from alembic import op
+
+revision = "042_drop_chunk_ivfflat_index"
+down_revision = "041_drop_duplicate_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_document_chunks_embedding_vector")
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_embedding_hnsw
+            ON sowknow.document_chunks
+            USING hnsw (embedding_vector vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_articles_embedding_hnsw
+            ON sowknow.articles
+            USING hnsw (embedding_vector vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+        """)
+
+
+def downgrade() -> None:
+    # The IVFFlat index was never usable by the cosine searches; nothing to restore.
+    pass
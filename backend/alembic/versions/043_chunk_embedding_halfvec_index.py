@@ -0,0 +1,46 @@
+"""Index chunk embeddings as halfvec
+
+Revision ID: 043_chunk_embedding_halfvec_index
+Revises: 042_drop_chunk_ivfflat_index
+Create Date: 2026-10-18
+
+Rebuilds the document_chunks HNSW index over embedding_vector::halfvec(1024)
+instead of the FP32 column: half the index size, so more of the graph stays
+in shared buffers and each hop reads half the bytes. The column itself stays
+FP32; semantic search takes its candidates from the halfvec index and
+re-ranks them by exact FP32 distance. Needs pgvector >= 0.7 (the
+pgvector/pgvector:pg16 image ships 0.8).
+"""
+
+from alembic import op
+
+revision = "043_chunk_embedding_halfvec_index"
+down_revision = "042_drop_chunk_ivfflat_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("SET maintenance_work_mem = '512MB'")
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_embedding_halfvec_hnsw
+            ON sowknow.document_chunks
+            USING hnsw ((embedding_vector::halfvec(1024)) halfvec_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_document_chunks_embedding_hnsw")
+        op.execute("RESET maintenance_work_mem")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("SET maintenance_work_mem = '512MB'")
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_embedding_hnsw
+            ON sowknow.document_chunks
+            USING hnsw (embedding_vector vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sowknow.ix_document_chunks_embedding_halfvec_hnsw")
+        op.execute("RESET maintenance_work_mem")
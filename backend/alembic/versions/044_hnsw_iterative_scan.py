@@ -0,0 +1,29 @@
+"""Enable HNSW iterative index scans
+
+Revision ID: 044_hnsw_iterative_scan
+Revises: 043_chunk_embedding_halfvec_index
+Create Date: 2026-10-18
+
+Semantic search filters chunks by the documents' bucket after the HNSW scan,
+and a plain scan stops after hnsw.ef_search (100, migration 024) rows. For a
+user without confidential access every confidential neighbour among those
+rows is discarded, so they get fewer candidates than they asked for. With
+iterative scans (pgvector >= 0.8) the index keeps walking the graph until
+the filtered LIMIT is met. relaxed_order is enough because search re-ranks
+the candidates by exact FP32 distance anyway.
+"""
+
+from alembic import op
+
+revision = "044_hnsw_iterative_scan"
+down_revision = "043_chunk_embedding_halfvec_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER DATABASE sowknow SET hnsw.iterative_scan = relaxed_order")
+
+
+def downgrade() -> None:
+    op.execute("ALTER DATABASE sowknow RESET hnsw.iterative_scan")
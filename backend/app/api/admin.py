@@ -3,7 +3,6 @@ Admin API endpoints for user management, dashboard, stats, and audit logging
 """
 
 import asyncio
-import json
 import logging
 import os
 import uuid
@@ -70,7 +69,7 @@ async def create_audit_log(
             action=action,
             resource_type=resource_type,
             resource_id=str(resource_id) if resource_id else None,
-            details=json.dumps(details) if details else None,
+            details=details or None,
             ip_address=request.client.host if request else None,
             user_agent=request.headers.get("user-agent") if request else None,
         )
@@ -78,7 +77,7 @@ async def create_audit_log(
         await db.commit()
     except Exception as e:
         await db.rollback()
-        print(f"Audit logging failed: {str(e)}")
+        logger.warning("Audit logging failed: %s", e)
 
 
 # ============================================================================
@@ -137,11 +136,8 @@ async def list_users(
     result = await db.execute(stmt.order_by(User.created_at.desc()).offset(offset).limit(page_size))
     users = result.scalars().all()
 
-    return UserListResponse(
-        users=[UserManagementResponse.model_validate(user) for user in users],
-        total=total,
-        page=page,
-        page_size=page_size,
+    return UserListResponse.model_validate(
+        {"users": users, "total": total, "page": page, "page_size": page_size}, from_attributes=True
     )
 
 
@@ -473,22 +469,34 @@ async def get_system_stats(
         r = await db.execute(stmt)
         return r.scalar_one()
 
-    total_documents = await count(select(func.count(Document.id)))
-    public_documents = await count(select(func.count(Document.id)).where(Document.bucket == DocumentBucket.PUBLIC))
-    confidential_documents = await count(
-        select(func.count(Document.id)).where(Document.bucket == DocumentBucket.CONFIDENTIAL)
-    )
-    indexed_documents = await count(select(func.count(Document.id)).where(Document.status == DocumentStatus.INDEXED))
-    processing_documents = await count(
-        select(func.count(Document.id)).where(Document.status == DocumentStatus.PROCESSING)
-    )
-    error_documents = await count(select(func.count(Document.id)).where(Document.status == DocumentStatus.ERROR))
+    # One pass over documents with FILTER aggregates instead of a scan per figure.
+    doc_counts = (
+        await db.execute(
+            select(
+                func.count(),
+                func.count().filter(Document.bucket == DocumentBucket.PUBLIC),
+                func.count().filter(Document.bucket == DocumentBucket.CONFIDENTIAL),
+                func.count().filter(Document.status == DocumentStatus.INDEXED),
+                func.count().filter(Document.status == DocumentStatus.PROCESSING),
+                func.count().filter(Document.status == DocumentStatus.ERROR),
+                func.count().filter(Document.created_at >= today),
+            ).select_from(Document)
+        )
+    ).one()
+    (
+        total_documents,
+        public_documents,
+        confidential_documents,
+        indexed_documents,
+        processing_documents,
+        error_documents,
+        uploads_today,
+    ) = doc_counts
 
     from app.models.document import DocumentChunk, DocumentTag
 
     total_chunks = await count(select(func.count(DocumentChunk.id)))
     total_tags = await count(select(func.count(DocumentTag.id)))
-    uploads_today = await count(select(func.count(Document.id)).where(Document.created_at >= today))
     total_users = await count(select(func.count(User.id)))
     active_sessions = await count(
         select(func.count(ChatSession.id)).where(ChatSession.updated_at >= datetime.utcnow() - timedelta(hours=24))
@@ -516,20 +524,32 @@ async def get_extended_admin_stats(
 ) -> AdminStatsResponse:
     """Get extended admin statistics (Admin only)."""
 
-    async def count(stmt) -> int:
-        r = await db.execute(stmt)
-        return r.scalar_one()
-
-    total_users = await count(select(func.count(User.id)))
-    active_users = await count(select(func.count(User.id)).where(User.is_active == True))
-    admin_count = await count(select(func.count(User.id)).where(User.role == UserRole.ADMIN))
-    superuser_count = await count(select(func.count(User.id)).where(User.role == UserRole.SUPERUSER))
-    regular_user_count = await count(select(func.count(User.id)).where(User.role == UserRole.USER))
-    confidential_access_users = await count(select(func.count(User.id)).where(User.can_access_confidential == True))
-    total_audit_logs = await count(select(func.count(AuditLog.id)))
+    (
+        total_users,
+        active_users,
+        admin_count,
+        superuser_count,
+        regular_user_count,
+        confidential_access_users,
+    ) = (
+        await db.execute(
+            select(
+                func.count(),
+                func.count().filter(User.is_active == True),
+                func.count().filter(User.role == UserRole.ADMIN),
+                func.count().filter(User.role == UserRole.SUPERUSER),
+                func.count().filter(User.role == UserRole.USER),
+                func.count().filter(User.can_access_confidential == True),
+            ).select_from(User)
+        )
+    ).one()
 
     week_ago = datetime.utcnow() - timedelta(days=7)
-    recent_admin_actions = await count(select(func.count(AuditLog.id)).where(AuditLog.created_at >= week_ago))
+    total_audit_logs, recent_admin_actions = (
+        await db.execute(
+            select(func.count(), func.count().filter(AuditLog.created_at >= week_ago)).select_from(AuditLog)
+        )
+    ).one()
 
     health_status = {
         "database": "healthy",
@@ -573,31 +593,26 @@ async def get_queue_stats(
 ) -> QueueStats:
     """Get processing queue statistics."""
 
-    async def count(stmt) -> int:
-        r = await db.execute(stmt)
-        return r.scalar_one()
-
-    pending_tasks = await count(
-        select(func.count(ProcessingQueue.id)).where(ProcessingQueue.status == TaskStatus.PENDING)
-    )
-    in_progress_tasks = await count(
-        select(func.count(ProcessingQueue.id)).where(ProcessingQueue.status == TaskStatus.IN_PROGRESS)
-    )
-    completed_tasks = await count(
-        select(func.count(ProcessingQueue.id)).where(ProcessingQueue.status == TaskStatus.COMPLETED)
-    )
-    failed_tasks = await count(
-        select(func.count(ProcessingQueue.id)).where(ProcessingQueue.status == TaskStatus.FAILED)
-    )
+    pending_tasks, in_progress_tasks, completed_tasks, failed_tasks = (
+        await db.execute(
+            select(
+                func.count().filter(ProcessingQueue.status == TaskStatus.PENDING),
+                func.count().filter(ProcessingQueue.status == TaskStatus.IN_PROGRESS),
+                func.count().filter(ProcessingQueue.status == TaskStatus.COMPLETED),
+                func.count().filter(ProcessingQueue.status == TaskStatus.FAILED),
+            ).select_from(ProcessingQueue)
+        )
+    ).one()
 
-    pending_result = await db.execute(select(ProcessingQueue).where(ProcessingQueue.status == TaskStatus.PENDING))
-    pending_with_created = pending_result.scalars().all()
+    # Only the timestamps are needed; ix_processing_queue_pending covers them.
+    pending_created = (
+        await db.execute(select(ProcessingQueue.created_at).where(ProcessingQueue.status == TaskStatus.PENDING))
+    ).scalars().all()
 
-    if pending_with_created:
-        total_wait_minutes = sum(
-            (datetime.utcnow() - task.created_at).total_seconds() / 60 for task in pending_with_created
-        )
-        average_wait_time = total_wait_minutes / len(pending_with_created)
+    if pending_created:
+        now = datetime.utcnow()
+        total_wait_minutes = sum((now - created_at).total_seconds() / 60 for created_at in pending_created)
+        average_wait_time = total_wait_minutes / len(pending_created)
     else:
         average_wait_time = None
 
@@ -1403,12 +1418,10 @@ async def pipeline_diagnostics(
         queues = {"error": str(e)}
 
     # 2. Document status counts
-    doc_counts: dict[str, int] = {}
-    for status in DocumentStatus:
-        cnt = await db.execute(
-            select(func.count(Document.id)).where(Document.status == status)
-        )
-        doc_counts[status.value] = cnt.scalar_one() or 0
+    doc_counts: dict[str, int] = {doc_status.value: 0 for doc_status in DocumentStatus}
+    rows = await db.execute(select(Document.status, func.count()).group_by(Document.status))
+    for doc_status, cnt in rows:
+        doc_counts[doc_status.value] = cnt
 
     # 3. Stuck documents per stage (RUNNING longer than 2× hard_timeout)
     from app.models.pipeline import STAGE_RETRY_CONFIG
@@ -26,13 +26,13 @@ import asyncio
 from datetime import timedelta
 
 import redis
-from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
+from app.core.env import load_env_once
 from app.database import get_db
 from app.limiter import limiter
 from app.middleware.csrf import generate_csrf_token
@@ -59,7 +59,7 @@ from app.utils.security import (
     verify_password,
 )
 
-load_dotenv()
+load_env_once()
 
 logger = logging.getLogger(__name__)
 
@@ -4,11 +4,12 @@ Chat API endpoints for AI-powered conversations with RAG
 
 import json
 import logging
+from datetime import datetime
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -24,6 +25,7 @@ from app.schemas.chat import (
     ChatSessionListResponse,
     ChatSessionResponse,
 )
+from app.schemas.pagination import decode_cursor, encode_cursor
 from app.services.chat_service import chat_service
 from app.services.input_guard import input_guard
 
@@ -82,7 +84,8 @@ async def list_chat_sessions(
     )
     total = count_result.scalar_one()
 
-    return ChatSessionListResponse(sessions=[ChatSessionResponse.model_validate(s) for s in sessions], total=total)
+    # One pydantic-core call validates the whole page from the ORM rows.
+    return ChatSessionListResponse.model_validate({"sessions": sessions, "total": total}, from_attributes=True)
 
 
 @router.get("/sessions/{session_id}", response_model=ChatSessionResponse)
@@ -247,10 +250,17 @@ async def get_session_messages(
     session_id: UUID,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> ChatMessageListResponse:
-    """Get messages in a session with offset-based pagination."""
+    """Get messages in a session.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` to seek past it on
+    (created_at, id) instead of counting ``offset`` rows from the start; the
+    cost of a page then no longer grows with its depth. ``offset`` is still
+    honoured when no cursor is given.
+    """
     # Verify session ownership
     session_result = await db.execute(
         select(ChatSession).where(ChatSession.id == session_id, ChatSession.user_id == current_user.id)
@@ -260,13 +270,23 @@ async def get_session_messages(
     if not session:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
 
-    result = await db.execute(
+    query = (
         select(ChatMessage)
         .where(ChatMessage.session_id == session_id)
-        .order_by(ChatMessage.created_at.asc())
-        .offset(offset)
+        .order_by(ChatMessage.created_at.asc(), ChatMessage.id.asc())
         .limit(limit)
     )
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+            after = (datetime.fromisoformat(position["created_at"]), UUID(position["id"]))
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        query = query.where(tuple_(ChatMessage.created_at, ChatMessage.id) > after)
+    else:
+        query = query.offset(offset)
+
+    result = await db.execute(query)
     messages = result.scalars().all()
 
     count_result = await db.execute(
@@ -274,7 +294,14 @@ async def get_session_messages(
     )
     total = count_result.scalar_one()
 
-    return ChatMessageListResponse(messages=[ChatMessageResponse.model_validate(m) for m in messages], total=total)
+    next_cursor = None
+    if messages and len(messages) == limit:
+        last = messages[-1]
+        next_cursor = encode_cursor({"created_at": last.created_at.isoformat(), "id": str(last.id)})
+
+    return ChatMessageListResponse.model_validate(
+        {"messages": messages, "total": total, "next_cursor": next_cursor}, from_attributes=True
+    )
 
 
 @router.delete("/sessions/{session_id}")
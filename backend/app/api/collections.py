@@ -79,7 +79,7 @@ async def create_audit_log(
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
-            details=json.dumps(details) if details else None,
+            details=details or None,
         )
         db.add(audit_entry)
         await db.commit()
@@ -196,7 +196,12 @@ async def list_collections(
     )
     collections = result.scalars().all()
 
-    return CollectionListResponse(collections=collections, total=total, page=page, page_size=page_size)
+    return CollectionListResponse(
+        collections=[CollectionResponse.from_orm_trusted(c) for c in collections],
+        total=total,
+        page=page,
+        page_size=page_size,
+    )
 
 
 @router.get("/stats", response_model=CollectionStatsResponse)
@@ -282,10 +287,10 @@ async def get_collection(
     # Enrich items with document info
     enriched_items = []
     for item in items:
-        item_dict = CollectionItemResponse.model_validate(item).model_dump()
+        item_response = CollectionItemResponse.from_orm_trusted(item)
         # Add basic document info
         if item.document:
-            item_dict["document"] = {
+            item_response.document = {
                 "id": str(item.document.id),
                 "filename": item.document.filename,
                 "mime_type": getattr(item.document, "mime_type", None),
@@ -293,15 +298,12 @@ async def get_collection(
                 "created_at": item.document.created_at.isoformat(),
             }
         if item.article:
-            item_dict["article_id"] = str(item.article.id)
-            item_dict["article_title"] = item.article.title
-            item_dict["article_summary"] = item.article.summary
-        enriched_items.append(item_dict)
-
-    return CollectionDetailResponse(
-        **CollectionResponse.model_validate(collection).model_dump(),
-        items=enriched_items,
-    )
+            item_response.article_id = str(item.article.id)
+            item_response.article_title = item.article.title
+            item_response.article_summary = item.article.summary
+        enriched_items.append(item_response)
+
+    return CollectionDetailResponse.from_orm_trusted(collection, items=enriched_items)
 
 
 @router.get("/{collection_id}/status")
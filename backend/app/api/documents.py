@@ -126,7 +126,7 @@ async def list_documents(
             stmt = stmt.where(Document.original_filename.ilike(f"%{search}%"))
 
     if document_type:
-        stmt = stmt.where(Document.document_metadata["document_type"].astext == document_type)
+        stmt = stmt.where(Document.metadata_document_type == document_type)
 
     if tag:
         stmt = stmt.where(
@@ -159,7 +159,7 @@ async def list_documents(
             )
 
     return DocumentListResponse(
-        documents=[DocumentResponse.model_validate(doc) for doc in documents],
+        documents=[DocumentResponse.from_orm_trusted(doc) for doc in documents],
         total=total,
         page=page,
         page_size=page_size,
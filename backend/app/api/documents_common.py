@@ -5,7 +5,6 @@ Extracted from documents.py to enable sub-router splitting without circular impo
 """
 
 import asyncio
-import json
 import logging
 import os
 import uuid
@@ -130,7 +129,7 @@ async def create_audit_log(
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
-            details=json.dumps(details) if details else None,
+            details=details or None,
             ip_address=ip_address,
             user_agent=user_agent,
         )
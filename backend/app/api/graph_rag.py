@@ -5,7 +5,6 @@ Provides endpoints for graph-augmented retrieval, synthesis,
 temporal reasoning, and progressive revelation.
 """
 
-import json
 import logging
 from typing import Any
 from uuid import UUID
@@ -64,7 +63,7 @@ async def create_audit_log(
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
-            details=json.dumps(details) if details else None,
+            details=details or None,
         )
         db.add(audit_entry)
         await db.commit()
@@ -2,6 +2,7 @@
 Comprehensive health check endpoints (PRD §11.4).
 
 /api/v1/health        — checks all infrastructure components
+/api/v1/health/deep   — internal state for Guardian probes
 /api/v1/health/celery — Celery worker status
 """
 
@@ -12,40 +13,95 @@ from datetime import UTC, datetime
 from typing import Any
 
 import httpx
+import redis
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
+from app.core.redis_url import safe_redis_url
+from app.database import probe_engine
+from app.utils.security import create_access_token, decode_token
+from app.utils.ttl_cache import AsyncTTLCache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 _CHECK_TIMEOUT = 5.0
 
+# Probe results are shared for a short window so liveness probes, nginx and
+# the frontend poller don't each fan out to Postgres/Redis/Vault/NATS.
+# Concurrent misses wait for a single in-flight probe.
+_HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "10"))
+# A failed refresh may fall back to the last good probe for this long past
+# its expiry; after that the failure is reported.
+_HEALTH_MAX_STALE = 3 * _HEALTH_CACHE_TTL
+_health_cache = AsyncTTLCache()
+
 
 async def _check_database() -> str:
+    # Dedicated probe pool, so request-pool saturation can't fail this check;
+    # the timeout covers connection checkout as well as the query.
     try:
-        from app.database import engine
-
-        async with engine.connect() as conn:
-            await asyncio.wait_for(
-                conn.execute(text("SELECT 1")),
-                timeout=_CHECK_TIMEOUT,
-            )
+        async with asyncio.timeout(_CHECK_TIMEOUT):
+            async with probe_engine.connect() as conn:
+                await conn.scalar(text("SELECT 1"))
         return "ok"
     except Exception as exc:
         logger.warning("Health check: database failed: %s", exc)
         return "error"
 
 
-async def _check_redis() -> str:
-    try:
-        import redis as _redis
+# Probe clients are reused across checks so each poll doesn't pay a fresh
+# TCP connect; closed from the app lifespan on shutdown.
+_redis_client: redis.Redis | None = None
+_http_client: httpx.AsyncClient | None = None
+
 
-        from app.core.redis_url import safe_redis_url
+def _get_redis() -> redis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(
+            safe_redis_url(),
+            socket_timeout=_CHECK_TIMEOUT,
+            socket_connect_timeout=_CHECK_TIMEOUT,
+        )
+    return _redis_client
 
-        r = _redis.from_url(safe_redis_url(), socket_timeout=int(_CHECK_TIMEOUT))
-        r.ping()
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=_CHECK_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30.0),
+        )
+    return _http_client
+
+
+async def close_probe_clients() -> None:
+    """Close the shared probe clients (lifespan shutdown)."""
+    global _redis_client, _http_client
+    if _redis_client is not None:
+        try:
+            _redis_client.close()
+        except Exception:
+            pass
+        _redis_client = None
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _redis_ping() -> None:
+    _get_redis().ping()
+
+
+async def _check_redis() -> str:
+    # The sync client would block the event loop (and serialize the other
+    # gathered probes behind it), so ping from a worker thread.
+    try:
+        await asyncio.to_thread(_redis_ping)
         return "ok"
     except Exception as exc:
         logger.warning("Health check: redis failed: %s", exc)
@@ -62,15 +118,11 @@ async def _check_vault() -> str:
     if not vault_addr:
         return "disabled"
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{vault_addr}/v1/sys/health",
-                timeout=_CHECK_TIMEOUT,
-            )
-            # 200=active, 429=standby, 472=DR secondary, 473=perf standby
-            if resp.status_code in (200, 429, 472, 473):
-                return "ok"
-            return "error"
+        resp = await _get_http_client().get(f"{vault_addr}/v1/sys/health")
+        # 200=active, 429=standby, 472=DR secondary, 473=perf standby
+        if resp.status_code in (200, 429, 472, 473):
+            return "ok"
+        return "error"
     except Exception as exc:
         logger.warning("Health check: vault failed: %s", exc)
         return "unavailable"
@@ -92,15 +144,7 @@ async def _check_nats() -> str:
         return "unavailable"
 
 
-@router.get("", include_in_schema=False)
-async def comprehensive_health() -> JSONResponse:
-    """
-    PRD §11.4 comprehensive health check.
-
-    Runs all infrastructure checks concurrently. Returns flat status
-    object with per-component results. HTTP 503 when critical services
-    (database, redis) are down; 200 otherwise.
-    """
+async def _run_health_checks() -> tuple[dict[str, Any], int]:
     results = await asyncio.gather(
         _check_database(),
         _check_redis(),
@@ -134,9 +178,79 @@ async def comprehensive_health() -> JSONResponse:
     }
 
     http_code = status.HTTP_200_OK if critical_ok else status.HTTP_503_SERVICE_UNAVAILABLE
+    return response, http_code
+
+
+@router.get("", include_in_schema=False)
+async def comprehensive_health() -> JSONResponse:
+    """
+    PRD §11.4 comprehensive health check.
+
+    Runs all infrastructure checks concurrently. Returns flat status
+    object with per-component results. HTTP 503 when critical services
+    (database, redis) are down; 200 otherwise. Results are cached for
+    HEALTH_CACHE_TTL seconds (default 10); ``checked_at`` reports when the
+    probes actually ran.
+    """
+    response, http_code = await _health_cache.get_or_set("health", _HEALTH_CACHE_TTL, _run_health_checks)
     return JSONResponse(content=response, status_code=http_code)
 
 
+async def _deep_db_state() -> dict[str, Any]:
+    """DB connectivity, active connections and last document write."""
+    state: dict[str, Any] = {}
+    async with probe_engine.connect() as conn:
+        row = await conn.execute(
+            text(
+                "SELECT now(), (SELECT count(*) FROM pg_stat_activity WHERE datname = current_database())"
+            )
+        )
+        db_row = row.fetchone()
+        state["db_connected"] = True
+        state["active_connections"] = db_row[1] if db_row else 0
+        # Last document write as staleness indicator
+        try:
+            last = await conn.execute(text("SELECT MAX(updated_at) FROM sowknow.documents"))
+            last_row = last.fetchone()
+            if last_row and last_row[0]:
+                state["last_write"] = last_row[0].isoformat()
+        except Exception:
+            pass
+    return state
+
+
+def _celery_ping() -> bool:
+    """Blocking broadcast ping (5s timeout) — call from a worker thread."""
+    from app.celery_app import celery_app
+
+    inspect = celery_app.control.inspect(timeout=5)
+    return bool(inspect.ping())
+
+
+async def _probe_deep_db() -> dict[str, Any]:
+    return await _health_cache.get_or_set(
+        "deep_db", _HEALTH_CACHE_TTL, _deep_db_state, max_stale=_HEALTH_MAX_STALE
+    )
+
+
+async def _probe_celery_ping() -> bool:
+    return await _health_cache.get_or_set(
+        "celery_ping", _HEALTH_CACHE_TTL, lambda: asyncio.to_thread(_celery_ping), max_stale=_HEALTH_MAX_STALE
+    )
+
+
+async def _celery_inspect() -> tuple[dict[str, Any], dict[str, Any]]:
+    """Active and reserved tasks per worker (two blocking broadcasts, run concurrently)."""
+    from app.celery_app import celery_app
+
+    inspect = celery_app.control.inspect(timeout=5.0)
+    active_workers, reserved = await asyncio.gather(
+        asyncio.to_thread(inspect.active),
+        asyncio.to_thread(inspect.reserved),
+    )
+    return active_workers or {}, reserved or {}
+
+
 @router.get("/deep", include_in_schema=False)
 async def deep_health(db=None) -> JSONResponse:
     """
@@ -144,6 +258,10 @@ async def deep_health(db=None) -> JSONResponse:
 
     Returns internal state: DB connectivity, active connections, last write,
     Celery ping, and JWT validity. HTTP 503 when DB is unreachable.
+
+    The DB and Celery legs are cached like ``/health``. If a refresh fails
+    the last good result is reused (for at most three TTLs) and listed under
+    ``stale``; a stale DB leg still counts as disconnected.
     """
 
     result = {
@@ -154,50 +272,30 @@ async def deep_health(db=None) -> JSONResponse:
         "jwt_valid": False,
     }
 
-    # DB connectivity + active connections
-    try:
-        from app.database import engine
-
-        async with engine.connect() as conn:
-            row = await conn.execute(
-                text(
-                    "SELECT now(), (SELECT count(*) FROM pg_stat_activity WHERE datname = current_database())"
-                )
-            )
-            db_row = row.fetchone()
-            result["db_connected"] = True
-            result["active_connections"] = db_row[1] if db_row else 0
-            # Last document write as staleness indicator
-            try:
-                last = await conn.execute(text("SELECT MAX(updated_at) FROM sowknow.documents"))
-                last_row = last.fetchone()
-                if last_row and last_row[0]:
-                    result["last_write"] = last_row[0].isoformat()
-            except Exception:
-                pass
-    except Exception:
-        pass
+    # DB and Celery legs are independent network round-trips; run them
+    # concurrently so the probe takes max(), not sum(), of the two.
+    db_state, celery_ok = await asyncio.gather(
+        _probe_deep_db(),
+        _probe_celery_ping(),
+        return_exceptions=True,
+    )
+    if isinstance(db_state, dict):
+        result.update(db_state)
+    result["celery_ping"] = celery_ok is True
+    stale = [key for key in ("deep_db", "celery_ping") if _health_cache.is_stale(key)]
+    if stale:
+        result["stale"] = stale
+        if "deep_db" in stale:
+            result["db_connected"] = False
 
     # JWT validity
     try:
-        from app.utils.security import create_access_token, decode_token
-
         test_token = create_access_token({"sub": "guardian-probe", "type": "access"})
         decoded = decode_token(test_token)
         result["jwt_valid"] = decoded is not None and decoded.get("sub") == "guardian-probe"
     except Exception:
         pass
 
-    # Celery ping (non-blocking, 5s timeout)
-    try:
-        from app.celery_app import celery_app
-
-        inspect = celery_app.control.inspect(timeout=5)
-        workers = inspect.ping()
-        result["celery_ping"] = bool(workers)
-    except Exception:
-        pass
-
     status_code = 200 if result["db_connected"] else 503
     return JSONResponse(content=result, status_code=status_code)
 
@@ -206,8 +304,6 @@ async def deep_health(db=None) -> JSONResponse:
 async def auth_check() -> JSONResponse:
     """Verify JWT issuance and verification for Guardian probes."""
     try:
-        from app.utils.security import create_access_token, decode_token
-
         token = create_access_token({"sub": "guardian-probe"})
         decoded = decode_token(token)
         valid = decoded is not None and decoded.get("sub") == "guardian-probe"
@@ -224,14 +320,13 @@ async def celery_health_check() -> dict[str, Any]:
     """
     Check Celery worker availability.
 
-    Returns 200 when at least one worker is active, 503 otherwise.
+    Returns 200 when at least one worker is active, 503 otherwise. The
+    inspect broadcasts are cached for HEALTH_CACHE_TTL seconds.
     """
-    from app.celery_app import celery_app
-
     try:
-        inspect = celery_app.control.inspect(timeout=5.0)
-        active_workers = inspect.active() or {}
-        reserved = inspect.reserved() or {}
+        active_workers, reserved = await _health_cache.get_or_set(
+            "celery_inspect", _HEALTH_CACHE_TTL, _celery_inspect, max_stale=_HEALTH_MAX_STALE
+        )
 
         worker_count = len(active_workers)
         if worker_count == 0:
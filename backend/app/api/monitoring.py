@@ -10,6 +10,7 @@ host cron scripts. If you expose the API to untrusted networks, add admin/auth
 requirements and update scripts/monitor-alerts.sh to use a service token.
 """
 
+import asyncio
 import logging
 import os
 import time
@@ -17,21 +18,46 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 
 from app.core.redis_url import safe_redis_url
 from app.services.cache_monitor import cache_monitor
 from app.services.monitoring import (
-    SystemMonitor,
     get_alert_manager,
     get_cost_tracker,
     get_queue_monitor,
+    get_system_monitor,
 )
 from app.services.prometheus_metrics import get_metrics
+from app.utils.ttl_cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["monitoring"])
 
+# /health/detailed and the Prometheus scrape both read Redis INFO; share the
+# (blocking) call for a few seconds and keep it off the event loop.
+_REDIS_INFO_TTL = 5.0
+_probe_cache = AsyncTTLCache()
+
+# Rendered Prometheus exposition, shared across scrapers (Prometheus,
+# Grafana, multiple replicas' scrape jobs) for a few seconds.
+_METRICS_CACHE_TTL = 5.0
+# Gauge handles resolved once instead of a registry lookup per update.
+_metrics_registry = get_metrics()
+_DISK_GAUGE = _metrics_registry.gauge("sowknow_disk_usage_percent")
+_QUEUE_GAUGE = _metrics_registry.gauge("sowknow_celery_queue_depth")
+_QUEUE_LABELS = {"queue_name": "celery"}
+_REDIS_GAUGES = (
+    ("used_memory_mb", _metrics_registry.gauge("sowknow_redis_memory_usage_mb")),
+    ("memory_percent", _metrics_registry.gauge("sowknow_redis_memory_usage_percent")),
+    ("connected_clients", _metrics_registry.gauge("sowknow_redis_connected_clients")),
+)
+_METRICS_HEADERS = {
+    "Content-Type": "text/plain; version=0.0.4; charset=utf-8",
+    "Cache-Control": f"public, max-age={int(_METRICS_CACHE_TTL)}",
+}
+
 
 def _get_redis_info() -> dict[str, Any]:
     """Return Redis memory and keyspace information (best-effort)."""
@@ -70,6 +96,12 @@ def _get_redis_info() -> dict[str, Any]:
     return info
 
 
+async def _cached_redis_info() -> dict[str, Any]:
+    return await _probe_cache.get_or_set(
+        "redis_info", _REDIS_INFO_TTL, lambda: asyncio.to_thread(_get_redis_info)
+    )
+
+
 @router.get("/health/embedding")
 async def embedding_health() -> dict:
     """Memory health check for the embedding service."""
@@ -78,46 +110,81 @@ async def embedding_health() -> dict:
     return embedding_service.health_check()
 
 
+# Process environment is fixed for the worker's lifetime; read it once.
+_APP_ENV = os.getenv("APP_ENV", "development")
+_MINIMAX_CONFIGURED = bool(os.getenv("MINIMAX_API_KEY"))
+
+# Fixed part of the /health/detailed "services" block, built once.
+_STATIC_SERVICES: dict[str, str] = {
+    "database": "connected",
+    "redis": "connected",
+    "api": "running",
+    "authentication": "enabled",
+}
+
+
 @router.get("/health/detailed")
-async def health_detailed() -> dict:
+async def health_detailed() -> ORJSONResponse:
     """
     Comprehensive health check with all monitoring metrics.
     Per PRD requirements for detailed health monitoring.
+
+    The payload is handed straight to orjson (datetimes included), skipping
+    FastAPI's jsonable_encoder pass over the nested monitor dicts.
     """
     cost_tracker = get_cost_tracker()
     queue_monitor = get_queue_monitor()
     alert_manager = get_alert_manager()
-    system_monitor = SystemMonitor()
+    system_monitor = get_system_monitor()
+
+    # The monitors are blocking (psutil sampling, Redis, DB); run them on
+    # worker threads concurrently so the endpoint costs max(), not sum().
+    (
+        mem_stats,
+        disk_stats,
+        cpu_stats,
+        queue_stats,
+        cost_stats,
+        cost_breakdown,
+        cache_hit_rate,
+        tokens_saved,
+        active_alerts,
+        redis_info,
+    ) = await asyncio.gather(
+        asyncio.to_thread(system_monitor.get_memory_usage),
+        asyncio.to_thread(system_monitor.get_disk_usage),
+        asyncio.to_thread(system_monitor.get_cpu_usage),
+        asyncio.to_thread(queue_monitor.get_worker_status),
+        asyncio.to_thread(cost_tracker.get_stats, days=1),
+        asyncio.to_thread(cost_tracker.get_daily_cost_breakdown),
+        asyncio.to_thread(cache_monitor.get_hit_rate, days=1),
+        asyncio.to_thread(cache_monitor.get_total_tokens_saved, days=1),
+        asyncio.to_thread(alert_manager.get_active_alerts),
+        _cached_redis_info(),
+    )
 
     overall_status = "healthy"
     issues: list[str] = []
 
-    mem_stats = system_monitor.get_memory_usage()
     if mem_stats["percent"] > 80:
         overall_status = "degraded"
         issues.append(f"High memory usage: {mem_stats['percent']}%")
 
-    disk_stats = system_monitor.get_disk_usage()
     if disk_stats.get("alert_high"):
         overall_status = "degraded"
         issues.append(f"High disk usage: {disk_stats.get('percent', 0)}%")
 
-    queue_stats = queue_monitor.get_worker_status()
     if queue_stats.get("congested"):
         overall_status = "degraded"
         issues.append(f"Queue congested: {queue_stats.get('queue_depth', 0)} tasks")
 
-    cost_stats = cost_tracker.get_stats(days=1)
     if cost_stats.get("over_budget"):
         overall_status = "degraded"
         issues.append(f"API cost over budget: ${cost_stats.get('today_cost', 0):.2f}")
 
-    minimax_configured = bool(os.getenv("MINIMAX_API_KEY"))
-    cache_hit_rate = cache_monitor.get_hit_rate(days=1)
     if 0 < cache_hit_rate < 0.5:
         issues.append(f"Low cache hit rate: {cache_hit_rate:.1%}")
 
-    redis_info = _get_redis_info()
     if redis_info["available"] and redis_info.get("memory_percent"):
         if redis_info["memory_percent"] > 0.8:
             overall_status = "degraded"
@@ -125,38 +192,34 @@ async def health_detailed() -> dict:
                 f"High Redis memory usage: {redis_info['memory_percent']:.1%}"
             )
 
-    active_alerts = alert_manager.get_active_alerts()
     if active_alerts:
         overall_status = "degraded"
         issues.append(f"{len(active_alerts)} active alerts")
 
-    return {
+    return ORJSONResponse({
         "status": overall_status,
         "timestamp": time.time(),
-        "environment": os.getenv("APP_ENV", "development"),
+        "environment": _APP_ENV,
         "version": "1.0.0",
         "services": {
-            "database": "connected",
-            "redis": "connected",
-            "api": "running",
-            "authentication": "enabled",
+            **_STATIC_SERVICES,
             "minimax": {
                 "service": "minimax",
-                "status": "healthy" if minimax_configured else "unavailable",
-                "api_configured": minimax_configured,
+                "status": "healthy" if _MINIMAX_CONFIGURED else "unavailable",
+                "api_configured": _MINIMAX_CONFIGURED,
                 "cache_stats": {
                     "total_entries": 0,
                     "active_entries": 0,
                     "ttl_seconds": 3600,
                     "hit_rate_24h": round(cache_hit_rate, 4),
-                    "tokens_saved_24h": cache_monitor.get_total_tokens_saved(days=1),
+                    "tokens_saved_24h": tokens_saved,
                 },
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
             },
         },
         "monitoring": {
             "memory": mem_stats,
-            "cpu": system_monitor.get_cpu_usage(),
+            "cpu": cpu_stats,
             "disk": disk_stats,
             "queue": queue_stats,
             "costs": {
@@ -164,17 +227,17 @@ async def health_detailed() -> dict:
                 "budget_usd": cost_stats.get("daily_budget", 0),
                 "remaining_budget": round(cost_stats.get("budget_remaining", 0), 4),
                 "over_budget": cost_stats.get("over_budget", False),
-                "breakdown": cost_tracker.get_daily_cost_breakdown(),
+                "breakdown": cost_breakdown,
             },
             "cache": {
                 "hit_rate_24h": round(cache_hit_rate, 4),
-                "tokens_saved_24h": cache_monitor.get_total_tokens_saved(days=1),
+                "tokens_saved_24h": tokens_saved,
                 "redis": redis_info,
             },
             "active_alerts": active_alerts,
         },
         "issues": issues if issues else None,
-    }
+    })
 
 
 @router.get("/monitoring/costs")
@@ -198,7 +261,7 @@ async def get_queue_stats() -> dict:
 @router.get("/monitoring/system")
 async def get_system_stats() -> dict:
     """Get system resource statistics."""
-    system_monitor = SystemMonitor()
+    system_monitor = get_system_monitor()
 
     # Also include the 5xx error rate tracked by ErrorRateMiddleware so host
     # monitoring scripts can read it without parsing nginx logs.
@@ -219,10 +282,7 @@ async def get_alerts() -> dict:
     alert_manager = get_alert_manager()
     return {
         "active_alerts": alert_manager.get_active_alerts(),
-        "configured_alerts": [
-            {"name": name, **config.__dict__}
-            for name, config in alert_manager._alerts.items()
-        ],
+        "configured_alerts": alert_manager.get_configured_alerts(),
     }
 
 
@@ -234,42 +294,47 @@ async def prometheus_metrics() -> Response:
     NOTE: /metrics is also mounted directly on the root app in main.py. This
     router-level handler is provided so the monitoring router is self-contained
     and can be mounted under a different prefix if needed.
+
+    The rendered body is cached for _METRICS_CACHE_TTL seconds (``X-Cache``
+    reports HIT/MISS); if a render fails, the last good body is served.
     """
+    rendered = False
+
+    async def render() -> bytes:
+        nonlocal rendered
+        rendered = True
+        return await _render_metrics()
+
+    body = await _probe_cache.get_or_set("metrics", _METRICS_CACHE_TTL, render)
+    return Response(
+        content=body,
+        media_type="text/plain",
+        headers={**_METRICS_HEADERS, "X-Cache": "MISS" if rendered else "HIT"},
+    )
+
+
+async def _render_metrics() -> bytes:
+    """Refresh the system gauges and render the exposition text."""
     metrics = get_metrics()
 
     try:
-        system_monitor = SystemMonitor()
-        mem_stats = system_monitor.get_memory_usage()
-        disk_stats = system_monitor.get_disk_usage()
+        system_monitor = get_system_monitor()
+        disk_stats, queue_depth, redis_info = await asyncio.gather(
+            asyncio.to_thread(system_monitor.get_disk_usage),
+            asyncio.to_thread(get_queue_monitor().get_queue_depth),
+            _cached_redis_info(),
+        )
 
         if "percent" in disk_stats:
-            metrics.gauge("sowknow_disk_usage_percent").set(
-                disk_stats["percent"], {"mount_point": disk_stats.get("path", "/")}
-            )
+            _DISK_GAUGE.set(disk_stats["percent"], {"mount_point": disk_stats.get("path", "/")})
 
-        queue_monitor = get_queue_monitor()
-        queue_depth = queue_monitor.get_queue_depth()
-        metrics.gauge("sowknow_celery_queue_depth").set(queue_depth, {"queue_name": "celery"})
+        _QUEUE_GAUGE.set(queue_depth, _QUEUE_LABELS)
 
-        redis_info = _get_redis_info()
         if redis_info["available"]:
-            if redis_info.get("used_memory_mb") is not None:
-                metrics.gauge("sowknow_redis_memory_usage_mb").set(
-                    redis_info["used_memory_mb"]
-                )
-            if redis_info.get("memory_percent") is not None:
-                metrics.gauge("sowknow_redis_memory_usage_percent").set(
-                    redis_info["memory_percent"]
-                )
-            if redis_info.get("connected_clients") is not None:
-                metrics.gauge("sowknow_redis_connected_clients").set(
-                    redis_info["connected_clients"]
-                )
+            for field, gauge in _REDIS_GAUGES:
+                if redis_info.get(field) is not None:
+                    gauge.set(redis_info[field])
     except Exception as e:
         logger.warning(f"Failed to update system metrics: {e}")
 
-    return Response(
-        content=metrics.export(),
-        media_type="text/plain",
-        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
-    )
+    return metrics.export().encode()
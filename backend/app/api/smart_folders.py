@@ -13,7 +13,8 @@ import logging
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -58,7 +59,7 @@ async def _create_audit_log(
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
-            details=json.dumps(details) if details else None,
+            details=details or None,
         )
         db.add(audit_entry)
         await db.commit()
@@ -495,12 +496,10 @@ async def get_collection_report_status(
     return {"task_id": task_id, "status": result.state.lower(), "result": None}
 
 
-@router.get("/reports/templates")
-async def get_report_templates(
-    current_user: User = Depends(require_superuser_or_admin),
-) -> dict[str, Any]:
-    """Get available report templates and formats."""
-    return {
+# Static payload for /reports/templates — serialized once at import so the
+# handler only copies bytes.
+_REPORT_TEMPLATES_BYTES = orjson.dumps(
+    {
         "formats": [
             {
                 "value": "short",
@@ -553,6 +552,15 @@ async def get_report_templates(
             {"value": "casual", "name": "Casual", "description": "Friendly, conversational"},
         ],
     }
+)
+
+
+@router.get("/reports/templates")
+async def get_report_templates(
+    current_user: User = Depends(require_superuser_or_admin),
+) -> Response:
+    """Get available report templates and formats."""
+    return Response(content=_REPORT_TEMPLATES_BYTES, media_type="application/json")
 
 
 @router.get("/reports/{report_id}")
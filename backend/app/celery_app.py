@@ -4,11 +4,16 @@ Celery application configuration for SOWKNOW async tasks
 
 import os
 
+import orjson
 from celery import Celery
 from celery.schedules import crontab
-from dotenv import load_dotenv
+from kombu.serialization import register
+from kombu.utils.json import JSONEncoder as KombuJSONEncoder
+from kombu.utils.json import object_hook as kombu_object_hook
 
-load_dotenv()
+from app.core.env import load_env_once
+
+load_env_once()
 
 # ---------------------------------------------------------------------------
 # Redis / broker configuration — sourced from authenticated settings.REDIS_URL
@@ -24,6 +29,57 @@ except Exception:
 
     REDIS_URL = safe_redis_url()
 
+# ---------------------------------------------------------------------------
+# Serialisation — orjson-backed JSON. Still a text JSON wire format (no pickle);
+# it just marshals large chunk/report payloads much faster than stdlib json.
+# ---------------------------------------------------------------------------
+
+
+_kombu_encoder = KombuJSONEncoder()
+
+
+def _to_wire(obj):
+    # orjson writes UUID/datetime/date/time as bare strings without consulting
+    # ``default``, so wrap every non-primitive in kombu's {"__type__", "__value__"}
+    # marker first. The wire format then matches kombu's json serializer and
+    # task arguments come back with their original types.
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    if isinstance(obj, dict):
+        return {k: _to_wire(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_to_wire(v) for v in obj]
+    return _to_wire(_kombu_encoder.default(obj))
+
+
+def _from_wire(obj):
+    if isinstance(obj, dict):
+        return kombu_object_hook({k: _from_wire(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return [_from_wire(v) for v in obj]
+    return obj
+
+
+def _orjson_dumps(obj) -> str:
+    return orjson.dumps(_to_wire(obj), option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _orjson_loads(data):
+    return _from_wire(orjson.loads(data))
+
+
+register("orjson", _orjson_dumps, _orjson_loads, "application/x-orjson", "utf-8")
+
+# Two-step rollout: every worker accepts orjson and zstd, but publishers keep
+# sending plain uncompressed JSON until CELERY_TASK_SERIALIZER=orjson and
+# CELERY_TASK_COMPRESSION=zstd are set. Only switch them once all workers run
+# a build that accepts both, or older workers reject the messages
+# (ContentDisallowed / unknown compression).
+# Payloads use kombu's json type markers, so switching keeps UUID, datetime and
+# Decimal task arguments typed exactly as with the json serializer.
+_serializer = os.getenv("CELERY_TASK_SERIALIZER", "json")
+_compression = os.getenv("CELERY_TASK_COMPRESSION", "") or None
+
 # ---------------------------------------------------------------------------
 # Create Celery app
 # ---------------------------------------------------------------------------
@@ -65,6 +121,7 @@ visibility_timeout = int(os.getenv("CELERY_VISIBILITY_TIMEOUT", "9000"))  # 2.5
 task_time_limit = int(os.getenv("CELERY_TASK_TIME_LIMIT", "600"))  # 10 minutes
 _visibility_timeout = visibility_timeout
 _task_time_limit = task_time_limit
+_send_task_events = os.getenv("CELERY_SEND_TASK_EVENTS", "0") == "1"
 
 celery_app.conf.update(
     # Default concurrency — overridden per-worker via CLI flags in docker-compose.
@@ -72,10 +129,14 @@ celery_app.conf.update(
     worker_concurrency=1,
     worker_max_tasks_per_child=30,
     worker_prefetch_multiplier=1,
-    # Serialisation — JSON only; no binary serializers permitted
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # Serialisation — JSON only; no binary serializers permitted. Both the
+    # stdlib and orjson content types are always accepted (see above).
+    task_serializer=_serializer,
+    accept_content=["orjson", "json"],
+    result_serializer=_serializer,
+    result_accept_content=["orjson", "json"],
+    task_compression=_compression,
+    result_compression=_compression,
     timezone="UTC",
     enable_utc=True,
     # Task routing — pipeline stage tasks get per-stage queues
@@ -107,9 +168,11 @@ celery_app.conf.update(
     # re-queued immediately rather than lost.  Combined with acks_late this
     # prevents tasks from vanishing when a worker is restarted by Guardian HC.
     task_reject_on_worker_lost=True,
-    # Send task events so Flower / monitoring dashboards can track runtime state.
-    worker_send_task_events=True,
-    task_send_sent_event=True,
+    # Task events feed Flower-style dashboards. Nothing in the stack consumes
+    # them today, so they are off by default (each state change is otherwise
+    # an extra Redis PUBLISH). Set CELERY_SEND_TASK_EVENTS=1 when attaching one.
+    worker_send_task_events=_send_task_events,
+    task_send_sent_event=_send_task_events,
     # Rate limiting — disabled by default. Slow tasks (entity extraction, LLM
     # calls) are naturally throttled by their own execution time. A global
     # rate limit artificially starves fast pipeline stages (index, finalize)
@@ -121,11 +184,17 @@ celery_app.conf.update(
     # Broker connection — retry on startup to survive Redis restarts
     # (required explicitly before Celery 6 where the default changes)
     broker_connection_retry_on_startup=True,
+    # Reuse broker connections across publishes (API + beat + workers all
+    # enqueue) instead of the default pool of 10.
+    broker_pool_limit=int(os.getenv("CELERY_BROKER_POOL_LIMIT", "50")),
     # Broker transport — visibility timeout must exceed task_time_limit
     broker_transport_options={
         "visibility_timeout": _visibility_timeout,
         "fanout_prefix": True,
         "fanout_patterns": True,
+        # Detect half-open Redis sockets instead of blocking on them
+        "health_check_interval": 30,
+        "socket_keepalive": True,
     },
     # Beat scheduler
     beat_schedule={
@@ -1,6 +1,6 @@
 """Request-scoped context variables for user identity.
 
-These are set by middleware (``set_rls_context``) so that downstream
+These are set by middleware (``RLSContextMiddleware``) so that downstream
 service code can access the current user without threading ``user_id``
 through every function signature.
 """
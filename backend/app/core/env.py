@@ -0,0 +1,23 @@
+"""
+One-shot .env loading.
+
+Several modules (main, database, celery_app, auth, security) need the .env
+values before they read os.environ at import. load_env_once() finds and
+parses the file on first call only, instead of re-walking the directory
+tree and re-reading it per module.
+"""
+
+from dotenv import find_dotenv, load_dotenv
+
+_loaded = False
+
+
+def load_env_once() -> None:
+    """Load the nearest .env into os.environ on first call; no-op afterwards."""
+    global _loaded
+    if _loaded:
+        return
+    # usecwd=False: resolve relative to this package (backend/.env), not
+    # the process working directory.
+    load_dotenv(find_dotenv(usecwd=False))
+    _loaded = True
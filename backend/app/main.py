@@ -1,5 +1,8 @@
+import hashlib
+import importlib
 import logging
 import os
+import re
 import time
 import uuid
 from collections.abc import AsyncIterator
@@ -7,54 +10,33 @@ from contextlib import asynccontextmanager
 from threading import Lock
 from typing import Any
 
-from dotenv import load_dotenv
+import orjson
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy.exc import SQLAlchemyError
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.responses import JSONResponse, RedirectResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-logger = logging.getLogger(__name__)
-
-from app.api import (
-    admin,
-    articles,
-    auth,
-    bookmarks,
-    chat,
-    collections,
-    documents,
-    graph_rag,
-    internal,
-    knowledge_graph,
-    monitoring,
-    notes,
-    pipeline_admin,
-    push,
-    reports,
-    search_agent_router,
-    search_feedback,
-    search_suggest,
-    smart_folders,
-    spaces,
-    subscriptions,
-    tags,
-    tasks,
-    voice,
-)
-from app.api import health as health_router
-from app.api import status as status_router
-from app.database import create_all_tables, engine, init_pgvector
+from app.api.status import _API_STATUS_BYTES
+from app.core.env import load_env_once
+from app.database import create_all_tables, engine, init_pgvector, ping_database, probe_engine
 from app.limiter import limiter
+from app.middleware.cors import FastCORSMiddleware
+from app.middleware.csrf import CSRFMiddleware
+from app.middleware.rls import RLSContextMiddleware
+from app.middleware.transaction import TransactionMiddleware
+from app.middleware.trusted_host import FastTrustedHostMiddleware
 from app.services.prometheus_metrics import get_metrics
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
-load_dotenv()
+load_env_once()
 
 
 class ErrorRateTracker:
@@ -97,67 +79,147 @@ _error_rate_tracker = ErrorRateTracker(window_seconds=300)
 
 
 # ---- Request-ID middleware (T01) ----
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        request.state.request_id = request_id
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
-
-
-class ErrorRateMiddleware(BaseHTTPMiddleware):
+# The middlewares below are pure ASGI rather than BaseHTTPMiddleware: no extra
+# task + memory stream per request, and they only touch the response start
+# message.
+class RequestIDMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("X-Request-ID") or str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class ErrorRateMiddleware:
     """Middleware to track 5xx error rates."""
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        start_time = time.time()
-        response = await call_next(request)
-        duration = time.time() - start_time
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        is_5xx = 500 <= response.status_code < 600
-        _error_rate_tracker.record_request(response.status_code, is_5xx)
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                _error_rate_tracker.record_request(status_code, 500 <= status_code < 600)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
 
 
-class PrometheusHttpMetricsMiddleware(BaseHTTPMiddleware):
+# Resolved once; the middleware updates them on every request.
+_HTTP_REQUESTS_TOTAL = get_metrics().counter("sowknow_http_requests_total")
+_HTTP_REQUEST_DURATION = get_metrics().histogram("sowknow_http_request_duration_seconds")
+
+
+class PrometheusHttpMetricsMiddleware:
     """Middleware to record HTTP request counts and durations in Prometheus."""
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.perf_counter()
-        response = await call_next(request)
+        status_code: int | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        if status_code is None:
+            return
         duration = time.perf_counter() - start_time
 
-        method = request.method
+        method = scope["method"]
         # Use the route path when available to avoid label cardinality blow-up.
-        route = request.scope.get("route")
-        endpoint = getattr(route, "path", request.url.path) if route is not None else request.url.path
-        status = str(response.status_code)
-
-        metrics = get_metrics()
-        metrics.counter("sowknow_http_requests_total").inc(
-            1, {"method": method, "endpoint": endpoint, "status": status}
-        )
-        metrics.histogram("sowknow_http_request_duration_seconds").observe(
-            duration, {"method": method, "endpoint": endpoint}
-        )
+        # The router writes the matched route into this same scope dict.
+        route = scope.get("route")
+        endpoint = getattr(route, "path", scope["path"]) if route is not None else scope["path"]
+        status = str(status_code)
+
+        _HTTP_REQUESTS_TOTAL.inc(1, {"method": method, "endpoint": endpoint, "status": status})
+        _HTTP_REQUEST_DURATION.observe(duration, {"method": method, "endpoint": endpoint})
+
+
+class StaticResponseMiddleware:
+    """Answer GET requests for fixed-content paths with pre-serialized bytes.
+
+    Registered innermost, so host/CORS/CSRF checks, request IDs and metrics
+    still apply; only routing, dependency solving and encoding are skipped.
+    Each body gets an ETag computed once; a matching If-None-Match gets 304.
+    """
+
+    def __init__(self, app: ASGIApp, responses: dict[str, bytes]) -> None:
+        self.app = app
+        self._responses = {}
+        for path, body in responses.items():
+            etag = b'"' + hashlib.blake2b(body, digest_size=8).hexdigest().encode() + b'"'
+            self._responses[path] = (
+                etag,
+                [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"etag", etag),
+                ],
+                body,
+            )
 
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET":
+            cached = self._responses.get(scope["path"])
+            if cached is not None:
+                etag, headers, body = cached
+                if_none_match = next((v for k, v in scope["headers"] if k == b"if-none-match"), None)
+                if if_none_match is not None and (
+                    if_none_match.strip() == b"*" or etag in (t.strip() for t in if_none_match.split(b","))
+                ):
+                    await send({"type": "http.response.start", "status": 304, "headers": [(b"etag", etag)]})
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+                await send({"type": "http.response.start", "status": 200, "headers": list(headers)})
+                await send({"type": "http.response.body", "body": body})
+                return
+        await self.app(scope, receive, send)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    # Startup: Initialize database
-    print("Starting up...")
-    await init_pgvector()  # Initialize pgvector extension
-    await create_all_tables()
-    print("Database tables created/verified")
+    # Startup: Initialize database. Schema is owned by Alembic
+    # (`alembic upgrade head` at deploy time), so production workers only
+    # warm the pool instead of issuing one catalog query per table.
+    logger.info("Starting up...")
+    if _run_ddl:
+        await init_pgvector()  # Initialize pgvector extension
+        await create_all_tables()
+        logger.info("Database tables created/verified")
+    else:
+        try:
+            await ping_database()
+            logger.info("Database connection verified (DDL skipped, RUN_DDL=0)")
+        except Exception as exc:
+            logger.warning("Database ping warning: %s", exc)
 
     # Startup: Validate LLM model configuration (block deprecated/free-tier models in production)
     if _is_production:
@@ -180,87 +242,94 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
                     f"CRITICAL: Deprecated/free-tier model '{model}' configured. "
                     f"Aborting startup. Update .env to use production-grade models."
                 )
-        print("LLM model configuration validated (no deprecated models)")
+        logger.info("LLM model configuration validated (no deprecated models)")
 
     # Startup: Confirm shared LLM HTTP client / connection pool is healthy
     try:
         from app.services.llm_http_client import LLMHTTPClient
 
         client = LLMHTTPClient.get_client()
-        print(
-            f"LLM HTTP client ready (keepalive={client._limits.max_keepalive_connections}, "
-            f"max_connections={client._limits.max_connections})"
+        logger.info(
+            "LLM HTTP client ready (keepalive=%s, max_connections=%s)",
+            client._limits.max_keepalive_connections,
+            client._limits.max_connections,
         )
     except Exception as exc:
-        print(f"LLM HTTP client initialization warning: {exc}")
+        logger.warning("LLM HTTP client initialization warning: %s", exc)
 
     # Startup: Register default monitoring alerts (PRD)
     try:
         from app.services.monitoring import setup_default_alerts
 
         setup_default_alerts()
-        print("Default monitoring alerts registered")
+        logger.info("Default monitoring alerts registered")
     except Exception as exc:
-        print(f"Default alert registration warning: {exc}")
+        logger.warning("Default alert registration warning: %s", exc)
 
     yield
 
     # Shutdown: release resources gracefully
-    print("Shutting down...")
+    logger.info("Shutting down...")
     try:
         await engine.dispose()
-        print("Database connection pool disposed")
+        if probe_engine is not engine:
+            await probe_engine.dispose()
+        logger.info("Database connection pool disposed")
     except Exception as exc:
-        print(f"Error disposing DB pool: {exc}")
+        logger.warning("Error disposing DB pool: %s", exc)
     try:
         import redis as _redis
 
         from app.core.redis_url import safe_redis_url
 
         _redis.from_url(safe_redis_url()).connection_pool.disconnect()
-        print("Redis connection pool closed")
+        logger.info("Redis connection pool closed")
     except Exception as exc:
-        print(f"Error closing Redis pool: {exc}")
+        logger.warning("Error closing Redis pool: %s", exc)
     try:
         from app.services.openrouter_service import close_redis_client as _close_or_redis
 
         _close_or_redis()
-        print("OpenRouter Redis client closed")
+        logger.info("OpenRouter Redis client closed")
     except Exception as exc:
-        print(f"Error closing OpenRouter Redis client: {exc}")
+        logger.warning("Error closing OpenRouter Redis client: %s", exc)
     try:
         from app.services.search_cache import close_redis_client as _close_sc_redis
 
         _close_sc_redis()
-        print("Search cache Redis client closed")
+        logger.info("Search cache Redis client closed")
+    except Exception as exc:
+        logger.warning("Error closing search cache Redis client: %s", exc)
+    try:
+        from app.api.health import close_probe_clients
+
+        await close_probe_clients()
+        logger.info("Health probe clients closed")
     except Exception as exc:
-        print(f"Error closing search cache Redis client: {exc}")
+        logger.warning("Error closing health probe clients: %s", exc)
+    try:
+        from app.network_utils import close_shared_clients
+
+        await close_shared_clients()
+        logger.info("Shared HTTP clients closed")
+    except Exception as exc:
+        logger.warning("Error closing shared HTTP clients: %s", exc)
     try:
         from app.services.llm_http_client import LLMHTTPClient
 
         await LLMHTTPClient.close()
-        print("LLM HTTP client closed")
+        logger.info("LLM HTTP client closed")
     except Exception as exc:
-        print(f"Error closing LLM HTTP client: {exc}")
-    print("Shutdown complete")
-
-
-app = FastAPI(
-    title="SOWKNOW API",
-    description="Multi-Generational Legacy Knowledge System",
-    version="1.0.0",
-    docs_url="/api/docs",
-    redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json",
-    lifespan=lifespan,
-)
+        logger.warning("Error closing LLM HTTP client: %s", exc)
+    logger.info("Shutdown complete")
 
-# Attach rate limiter to app state (T04)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 _is_production = os.getenv("APP_ENV", "development").lower() == "production"
 
+# Run create_all/pgvector DDL on startup only when asked to. Defaults to on
+# outside production so local/dev databases without migrations still work.
+_run_ddl = os.getenv("RUN_DDL", "0" if _is_production else "1") == "1"
+
 
 def _error_response(
     error_type: str, message: str, detail: str | None, http_status: int
@@ -277,7 +346,6 @@ def _error_response(
     return JSONResponse(status_code=http_status, content=body)
 
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
 ) -> JSONResponse:
@@ -290,7 +358,6 @@ async def validation_exception_handler(
     )
 
 
-@app.exception_handler(SQLAlchemyError)
 async def sqlalchemy_exception_handler(
     request: Request, exc: SQLAlchemyError
 ) -> JSONResponse:
@@ -306,7 +373,6 @@ async def sqlalchemy_exception_handler(
     )
 
 
-@app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Catch-all handler so unhandled exceptions never leak tracebacks."""
     return _error_response(
@@ -343,6 +409,14 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
 # Parse environment configuration
 APP_ENV = os.getenv("APP_ENV", "development").lower()
 
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
+
+def _split_csv(value: str) -> tuple[str, ...]:
+    """Split a comma-separated env value in one pass, dropping empty items."""
+    return tuple(filter(None, _CSV_SPLIT.split(value.strip())))
+
+
 # Parse ALLOWED_ORIGINS from environment
 # Format: comma-separated list of origins
 _allowed_origins_str = os.getenv("ALLOWED_ORIGINS", "")
@@ -353,9 +427,7 @@ if APP_ENV == "production":
             "Example: ALLOWED_ORIGINS=https://sowknow.gollamtech.com,https://www.sowknow.gollamtech.com"
         )
     # Split and strip whitespace, filter empty strings
-    ALLOWED_ORIGINS = [
-        origin.strip() for origin in _allowed_origins_str.split(",") if origin.strip()
-    ]
+    ALLOWED_ORIGINS = frozenset(origin.lower() for origin in _split_csv(_allowed_origins_str))
 
     # Security check: reject wildcards in production
     if "*" in ALLOWED_ORIGINS:
@@ -366,15 +438,21 @@ if APP_ENV == "production":
 else:
     # Development defaults
     ALLOWED_ORIGINS = (
-        _allowed_origins_str.split(",")
+        frozenset(origin.lower() for origin in _split_csv(_allowed_origins_str))
         if _allowed_origins_str
-        else [
-            "http://localhost:3000",
-            "http://127.0.0.1:3000",
-            "http://localhost:3001",  # Common alternate port
-        ]
+        else frozenset(
+            {
+                "http://localhost:3000",
+                "http://127.0.0.1:3000",
+                "http://localhost:3001",  # Common alternate port
+            }
+        )
     )
 
+# Preflight cache lifetime. Browsers clamp it (Chromium 2h, Firefox 24h), so
+# the default lets each browser cache preflights as long as it allows.
+CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "86400"))
+
 # Parse ALLOWED_HOSTS from environment
 # Format: comma-separated list of hostnames
 _allowed_hosts_str = os.getenv("ALLOWED_HOSTS", "")
@@ -384,134 +462,49 @@ if APP_ENV == "production":
             "SECURITY ERROR: ALLOWED_HOSTS environment variable is required in production. "
             "Example: ALLOWED_HOSTS=sowknow.gollamtech.com,www.sowknow.gollamtech.com"
         )
-    ALLOWED_HOSTS = [
-        host.strip() for host in _allowed_hosts_str.split(",") if host.strip()
-    ]
+    ALLOWED_HOSTS = _split_csv(_allowed_hosts_str)
 else:
     # Development: Allow any host for local testing
-    ALLOWED_HOSTS = ["*"]
-
-# TrustedHost Middleware - Prevents Host header attacks
-# Only allows requests from configured hosts
-app.add_middleware(TrustedHostMiddleware, allowed_hosts=ALLOWED_HOSTS)
-
-# ProxyHeaders Middleware - Trust X-Forwarded-* headers from nginx.
-# SEC-05: Direct backend access is blocked at the network level, so all
-# requests reaching the app come through the reverse proxy.  Wrapping the
-# app after TrustedHostMiddleware means this runs first on each request,
-# populating request.client and request.url from forwarded headers before
-# rate-limiting, CSRF and logging need the real client IP.
-app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")
-
-# CORS Middleware - Controls cross-origin requests
-# SECURITY: Never use allow_origins=["*"] with allow_credentials=True
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    allow_headers=[
-        "Authorization",
-        "Content-Type",
-        "X-Requested-With",
-        "X-CSRF-Token",
-        "Accept",
-        "Origin",
-        "Access-Control-Request-Method",
-        "Access-Control-Request-Headers",
-    ],
-    expose_headers=["Content-Range", "X-Total-Count", "X-CSRF-Token"],
-    max_age=600,  # Cache preflight responses for 10 minutes
-)
+    ALLOWED_HOSTS = ("*",)
 
-# Request-ID Middleware — injects X-Request-ID into every response (T01)
-app.add_middleware(RequestIDMiddleware)
-
-# CSRF Middleware — double-submit cookie validation on state-changing requests (FP8)
-from app.middleware.csrf import CSRFMiddleware  # noqa: E402
-
-app.add_middleware(CSRFMiddleware)
-
-# Transaction Middleware — auto-commit on 2xx, rollback on 4xx/5xx (T11)
-from app.middleware.transaction import TransactionMiddleware
-
-app.add_middleware(TransactionMiddleware)
-
-# RLS context middleware (P2-9) — sets app.user_id / app.user_role session vars
-from app.middleware.rls import set_rls_context  # noqa: E402
-
-app.add_middleware(BaseHTTPMiddleware, dispatch=set_rls_context)
-
-# Error Rate Tracking Middleware - Tracks 5xx errors per PRD
-app.add_middleware(ErrorRateMiddleware)
-
-# Prometheus HTTP metrics middleware - records request counts and durations
-app.add_middleware(PrometheusHttpMetricsMiddleware)
-
-# Include routers
-app.include_router(auth.router, prefix="/api/v1")
-app.include_router(admin.router, prefix="/api/v1")
-app.include_router(bookmarks.router, prefix="/api/v1")
-app.include_router(notes.router, prefix="/api/v1")
-app.include_router(spaces.router, prefix="/api/v1")
-app.include_router(documents.router, prefix="/api/v1")
-app.include_router(articles.router, prefix="/api/v1")
-app.include_router(collections.router, prefix="/api/v1")
-app.include_router(smart_folders.router, prefix="/api/v1")
-app.include_router(knowledge_graph.router, prefix="/api/v1")
-app.include_router(graph_rag.router, prefix="/api/v1")
-app.include_router(search_agent_router.router, prefix="/api/v1")
-app.include_router(search_suggest.router, prefix="/api/v1")
-app.include_router(search_feedback.router, prefix="/api/v1")
-app.include_router(chat.router, prefix="/api/v1")
-app.include_router(internal.router, prefix="/api/v1")
-app.include_router(tags.router, prefix="/api/v1")
-app.include_router(voice.router, prefix="/api/v1")
-app.include_router(health_router.router, prefix="/api/v1")
-app.include_router(status_router.router, prefix="/api/v1")
-app.include_router(subscriptions.router, prefix="/api/v1")
-app.include_router(tasks.router, prefix="/api/v1")
-app.include_router(push.router, prefix="/api/v1")
-app.include_router(pipeline_admin.router, prefix="/api/v1")
-app.include_router(reports.router, prefix="/api/v1")
-app.include_router(monitoring.router, prefix="/api/v1")
-
-
-@app.get("/health", include_in_schema=False)
 async def root_health() -> RedirectResponse:
     """Redirect root /health to the canonical /api/v1/health endpoint."""
     return RedirectResponse(url="/api/v1/health", status_code=status.HTTP_307_TEMPORARY_REDIRECT)
 
 
-@app.get("/")
-async def root() -> dict[str, Any]:
-    return {
-        "message": "SOWKNOW API is running",
-        "status": "ok",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "/api/v1/health",
-            "api_status": "/api/v1/status",
-            "docs": "/api/docs",
-            "openapi": "/api/openapi.json",
-            "auth": {
-                "login": "/api/v1/auth/login",
-                "register": "/api/v1/auth/register",
-                "me": "/api/v1/auth/me",
-                "refresh": "/api/v1/auth/refresh",
-            },
-            "admin": {
-                "users": "/api/v1/admin/users",
-                "user_detail": "/api/v1/admin/users/{id}",
-                "stats": "/api/v1/admin/stats",
-                "audit": "/api/v1/admin/audit",
-                "dashboard": "/api/v1/admin/dashboard",
-            },
+_ROOT_PAYLOAD: dict[str, Any] = {
+    "message": "SOWKNOW API is running",
+    "status": "ok",
+    "version": "1.0.0",
+    "endpoints": {
+        "health": "/api/v1/health",
+        "api_status": "/api/v1/status",
+        "docs": "/api/docs",
+        "openapi": "/api/openapi.json",
+        "auth": {
+            "login": "/api/v1/auth/login",
+            "register": "/api/v1/auth/register",
+            "me": "/api/v1/auth/me",
+            "refresh": "/api/v1/auth/refresh",
         },
-    }
+        "admin": {
+            "users": "/api/v1/admin/users",
+            "user_detail": "/api/v1/admin/users/{id}",
+            "stats": "/api/v1/admin/stats",
+            "audit": "/api/v1/admin/audit",
+            "dashboard": "/api/v1/admin/dashboard",
+        },
+    },
+}
+_ROOT_BODY = orjson.dumps(_ROOT_PAYLOAD)
+
+
+async def root() -> dict[str, Any]:
+    # Normally answered by StaticResponseMiddleware; kept as a route so "/"
+    # stays in the OpenAPI schema and works if the middleware is removed.
+    return _ROOT_PAYLOAD
 
 
-@app.get("/metrics", include_in_schema=False)
 async def prometheus_metrics() -> Response:
     """Prometheus metrics endpoint for scraping."""
     metrics = get_metrics()
@@ -522,7 +515,163 @@ async def prometheus_metrics() -> Response:
     )
 
 
+# Routers mounted under /api/v1, in registration order.
+_API_V1_ROUTERS = (
+    "auth",
+    "admin",
+    "bookmarks",
+    "notes",
+    "spaces",
+    "documents",
+    "articles",
+    "collections",
+    "smart_folders",
+    "knowledge_graph",
+    "graph_rag",
+    "search_agent_router",
+    "search_suggest",
+    "search_feedback",
+    "chat",
+    "internal",
+    "tags",
+    "voice",
+    "health",
+    "status",
+    "subscriptions",
+    "tasks",
+    "push",
+    "pipeline_admin",
+    "reports",
+    "monitoring",
+)
+
+
+def _add_middleware(app: FastAPI) -> None:
+    """Register the middleware stack (last added runs first)."""
+    # Innermost: serve static bodies ("/", /api/v1/status) without entering the router.
+    app.add_middleware(
+        StaticResponseMiddleware,
+        responses={"/": _ROOT_BODY, "/api/v1/status": _API_STATUS_BYTES},
+    )
+
+    # TrustedHost Middleware - Prevents Host header attacks
+    # Only allows requests from configured hosts. Any "*" entry (the
+    # development default, or one mixed into a host list) makes Starlette
+    # accept every host, so the layer could never reject anything — skip it.
+    # CORS wraps it (added last, below): preflights are answered (with
+    # Access-Control-Max-Age) before the host check, and a 400 from a bad
+    # Host still carries CORS headers the browser can read.
+    if "*" not in ALLOWED_HOSTS:
+        app.add_middleware(FastTrustedHostMiddleware, allowed_hosts=ALLOWED_HOSTS)
+
+    # ProxyHeaders Middleware - Trust X-Forwarded-* headers from nginx.
+    # SEC-05: Direct backend access is blocked at the network level, so all
+    # requests reaching the app come through the reverse proxy.  Wrapping the
+    # app after TrustedHostMiddleware means this runs first on each request,
+    # populating request.client and request.url from forwarded headers before
+    # rate-limiting, CSRF and logging need the real client IP.
+    app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")
+
+    # Request-ID Middleware — injects X-Request-ID into every response (T01)
+    app.add_middleware(RequestIDMiddleware)
+
+    # CSRF Middleware — double-submit cookie validation on state-changing requests (FP8)
+    app.add_middleware(CSRFMiddleware)
+
+    # Transaction Middleware — auto-commit on 2xx, rollback on 4xx/5xx (T11)
+    app.add_middleware(TransactionMiddleware)
+
+    # RLS context middleware (P2-9) — sets app.user_id / app.user_role session vars
+    app.add_middleware(RLSContextMiddleware)
+
+    # Error Rate Tracking Middleware - Tracks 5xx errors per PRD
+    app.add_middleware(ErrorRateMiddleware)
+
+    # Prometheus HTTP metrics middleware - records request counts and durations
+    app.add_middleware(PrometheusHttpMetricsMiddleware)
+
+    # CORS Middleware - Controls cross-origin requests
+    # Outermost: preflight OPTIONS is answered here with pre-encoded headers
+    # before any other middleware (session, RLS, metrics) runs, and every
+    # response, including errors raised further in, gets CORS headers.
+    # SECURITY: Never use allow_origins=["*"] with allow_credentials=True
+    # ALLOWED_ORIGINS is a frozenset, so Starlette's per-request
+    # ``origin in allow_origins`` check is a hash lookup, not a list scan.
+    # FastCORSMiddleware pre-encodes the Access-Control-* response headers.
+    app.add_middleware(
+        FastCORSMiddleware,
+        allow_origins=ALLOWED_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+        # Only headers the frontend actually sets. CORS-safelisted headers
+        # (Accept, Content-Language, ...) are always allowed by Starlette, and
+        # Origin / Access-Control-Request-* are never author request headers.
+        allow_headers=[
+            "Authorization",
+            "Content-Type",
+            "X-Requested-With",
+            "X-CSRF-Token",
+        ],
+        expose_headers=["Content-Range", "X-Total-Count", "X-CSRF-Token"],
+        max_age=CORS_MAX_AGE,
+    )
+
+
+def _include_routers(app: FastAPI) -> None:
+    """Import the API routers and mount them under /api/v1."""
+    for name in _API_V1_ROUTERS:
+        module = importlib.import_module(f"app.api.{name}")
+        app.include_router(module.router, prefix="/api/v1")
+
+
+def create_app() -> FastAPI:
+    """Build the SOWKNOW FastAPI application."""
+    app = FastAPI(
+        title="SOWKNOW API",
+        description="Multi-Generational Legacy Knowledge System",
+        version="1.0.0",
+        docs_url="/api/docs",
+        redoc_url="/api/redoc",
+        openapi_url="/api/openapi.json",
+        lifespan=lifespan,
+        # orjson encodes handler return values straight to bytes (3-10x
+        # faster than stdlib json); routes can still override response_class.
+        default_response_class=ORJSONResponse,
+    )
+
+    # Attach rate limiter to app state (T04)
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
+    app.add_exception_handler(Exception, generic_exception_handler)
+
+    _add_middleware(app)
+    _include_routers(app)
+
+    app.add_api_route("/health", root_health, methods=["GET"], include_in_schema=False)
+    app.add_api_route("/", root, methods=["GET"])
+    app.add_api_route("/metrics", prometheus_metrics, methods=["GET"], include_in_schema=False)
+    return app
+
+
+app = create_app()
+
+
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)  # nosec B104
+    # Import string (not the app object) so uvicorn can fork workers; matches
+    # the compose deployment (2 workers on the VPS). uvloop/httptools come
+    # with uvicorn[standard]; pin them so a missing wheel fails loudly.
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",  # nosec B104
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+        timeout_keep_alive=int(os.getenv("UVICORN_KEEPALIVE", "15")),
+        proxy_headers=True,
+    )
@@ -0,0 +1,131 @@
+"""
+CORS with pre-encoded response headers.
+
+Starlette's CORSMiddleware joins its header values once, but still builds a
+``PlainTextResponse`` (re-encoding every header) for each preflight, scans
+``allow_methods``/``allow_headers`` lists, and re-encodes the simple
+``Access-Control-*`` headers through ``MutableHeaders`` on every
+cross-origin response. This subclass encodes those headers to ASGI byte
+pairs once, checks origins/methods/headers with frozenset lookups, and lets
+requests without an Origin header through without parsing headers at all.
+"""
+
+from collections.abc import Sequence
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _encode(headers: dict[str, str]) -> list[tuple[bytes, bytes]]:
+    return [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+
+
+class FastCORSMiddleware(CORSMiddleware):
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        allow_origin_regex: str | None = None,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600,
+    ) -> None:
+        super().__init__(
+            app,
+            allow_origins=allow_origins,
+            allow_methods=allow_methods,
+            allow_headers=allow_headers,
+            allow_credentials=allow_credentials,
+            allow_origin_regex=allow_origin_regex,
+            expose_headers=expose_headers,
+            max_age=max_age,
+        )
+        # Callers may pass a list; keep origin checks O(1) regardless.
+        self._allow_origins = frozenset(allow_origins)
+        self._allow_methods = frozenset(self.allow_methods)
+        self._allow_headers = frozenset(self.allow_headers)
+        self._preflight_raw = _encode(self.preflight_headers)
+        self._simple_raw = _encode(self.simple_headers)
+        self._simple_keys = frozenset(k for k, _ in self._simple_raw)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Same-origin requests and probes (health checks, Prometheus) carry no
+        # Origin header; spot that on the raw header list and pass straight
+        # through without building a Headers object.
+        if scope["type"] != "http" or not any(k == b"origin" for k, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if scope["method"] == "OPTIONS" and "access-control-request-method" in headers:
+            await self._preflight(headers, send)
+            return
+        await self.simple_response(scope, receive, send, request_headers=headers)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self._allow_origins:
+            return True
+        return self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin) is not None
+
+    async def _preflight(self, request_headers: Headers, send: Send) -> None:
+        origin = request_headers["origin"]
+        raw = list(self._preflight_raw)
+        failures = []
+
+        if self.is_allowed_origin(origin=origin):
+            if self.preflight_explicit_allow_origin:
+                raw.append((b"access-control-allow-origin", origin.encode("latin-1")))
+        else:
+            failures.append("origin")
+
+        if request_headers["access-control-request-method"] not in self._allow_methods:
+            failures.append("method")
+
+        requested_headers = request_headers.get("access-control-request-headers")
+        if requested_headers is not None:
+            if self.allow_all_headers:
+                # Mirror back whatever was requested.
+                raw.append((b"access-control-allow-headers", requested_headers.encode("latin-1")))
+            elif any(h.strip().lower() not in self._allow_headers for h in requested_headers.split(",")):
+                failures.append("headers")
+
+        if failures:
+            status, body = 400, ("Disallowed CORS " + ", ".join(failures)).encode()
+        else:
+            status, body = 200, b"OK"
+        raw.append((b"content-length", str(len(body)).encode()))
+        raw.append((b"content-type", b"text/plain; charset=utf-8"))
+        await send({"type": "http.response.start", "status": status, "headers": raw})
+        await send({"type": "http.response.body", "body": body})
+
+    async def send(self, message: Message, send: Send, request_headers: Headers) -> None:
+        if message["type"] != "http.response.start":
+            await send(message)
+            return
+
+        raw = [(k, v) for k, v in message.get("headers", []) if k.lower() not in self._simple_keys]
+        raw.extend(self._simple_raw)
+        origin = request_headers["origin"]
+
+        # With cookies, or when only specific origins are allowed, the exact
+        # origin must be echoed back instead of "*".
+        if (self.allow_all_origins and "cookie" in request_headers) or (
+            not self.allow_all_origins and self.is_allowed_origin(origin=origin)
+        ):
+            vary = b"Origin"
+            kept = []
+            for k, v in raw:
+                name = k.lower()
+                if name == b"vary":
+                    vary = v + b", Origin"
+                elif name != b"access-control-allow-origin":
+                    kept.append((k, v))
+            kept.append((b"access-control-allow-origin", origin.encode("latin-1")))
+            kept.append((b"vary", vary))
+            raw = kept
+
+        message["headers"] = raw
+        await send(message)
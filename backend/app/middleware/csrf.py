@@ -11,9 +11,10 @@ import hmac
 import logging
 import secrets
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.datastructures import Headers
+from starlette.requests import cookie_parser
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.utils.constants import CSRF_COOKIE_NAME
 
@@ -53,34 +54,43 @@ def generate_csrf_token() -> str:
     return secrets.token_urlsafe(32)
 
 
-class CSRFMiddleware(BaseHTTPMiddleware):
+class CSRFMiddleware:
     """
     Validate double-submit CSRF cookie on unsafe HTTP methods.
 
     The ``csrf_token`` cookie is set by the login / refresh endpoints
     (non-httpOnly so the frontend JS can read it).  This middleware
     checks that the ``X-CSRF-Token`` request header matches it.
+
+    Pure ASGI: reads method, path and headers straight from the scope.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Safe methods never mutate state — skip.
-        if request.method in SAFE_METHODS:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
 
         # Exempt paths (login, register, health, etc.) — skip.
-        path = request.url.path.rstrip("/")
+        path = scope["path"].rstrip("/")
         if path in EXEMPT_PATHS or path.startswith(EXEMPT_PREFIXES):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Bearer-token requests (machine-to-machine, e.g. Telegram bot) are not
         # vulnerable to CSRF because the token is not auto-attached by the browser.
-        auth_header = request.headers.get("Authorization", "")
+        headers = Headers(scope=scope)
+        auth_header = headers.get("Authorization", "")
         if auth_header.startswith("Bearer "):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # --- Double-submit cookie validation ---
-        cookie_token = request.cookies.get(CSRF_COOKIE_NAME)
-        header_token = request.headers.get(CSRF_HEADER_NAME)
+        cookie_token = cookie_parser(headers.get("cookie", "")).get(CSRF_COOKIE_NAME)
+        header_token = headers.get(CSRF_HEADER_NAME)
 
         if not cookie_token or not header_token:
             logger.warning(
@@ -89,16 +99,20 @@ class CSRFMiddleware(BaseHTTPMiddleware):
                 bool(header_token),
                 path,
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=403,
                 content={"detail": "CSRF token missing"},
             )
+            await response(scope, receive, send)
+            return
 
         if not hmac.compare_digest(cookie_token, header_token):
             logger.warning("CSRF token mismatch on %s", path)
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=403,
                 content={"detail": "CSRF token invalid"},
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -15,12 +15,14 @@ import logging
 from dataclasses import dataclass
 
 from jose import JWTError, jwt
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.requests import Request
-from starlette.responses import Response
+from sqlalchemy.orm import Session
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.context import current_user_id, current_user_role
+from app.utils.constants import PROBE_PATHS
 from app.utils.security import ALGORITHM, SECRET_KEY, _get_secret_key
 
 logger = logging.getLogger(__name__)
@@ -33,7 +35,7 @@ class RLSContext:
     client_ip: str = ""
 
 
-def extract_rls_context(request: Request) -> RLSContext:
+def extract_rls_context(request: HTTPConnection) -> RLSContext:
     """Extract request metadata used by PostgreSQL RLS policies."""
     user_id = ""
     user_role = ""
@@ -57,38 +59,74 @@ def extract_rls_context(request: Request) -> RLSContext:
     return RLSContext(user_id=user_id, user_role=user_role, client_ip=client_ip)
 
 
+_SET_RLS_SQL = text(
+    "SELECT set_config('app.user_id',   :uid,  true), "
+    "       set_config('app.user_role', :role, true), "
+    "       set_config('app.client_ip', :ip,   true)"
+)
+
+
+def _rls_params(context: RLSContext) -> dict[str, str]:
+    return {"uid": context.user_id, "role": context.user_role, "ip": context.client_ip}
+
+
 async def apply_rls_context(session: AsyncSession, context: RLSContext) -> None:
     """Apply RLS variables on the same DB session that will execute request queries."""
     try:
-        await session.execute(
-            text(
-                "SELECT set_config('app.user_id',   :uid,  true), "
-                "       set_config('app.user_role', :role, true), "
-                "       set_config('app.client_ip', :ip,   true)"
-            ),
-            {
-                "uid": context.user_id,
-                "role": context.user_role,
-                "ip": context.client_ip,
-            },
-        )
+        await session.execute(_SET_RLS_SQL, _rls_params(context))
     except Exception:
         logger.debug("RLS context set failed (non-fatal)", exc_info=True)
 
 
-async def set_rls_context(request: Request, call_next) -> Response:
-    """HTTP middleware that stores RLS context for request-scoped DB sessions."""
-    request.state.rls_context = extract_rls_context(request)
+@event.listens_for(Session, "after_begin")
+def _apply_rls_on_begin(session: Session, transaction, connection) -> None:
+    """Set RLS variables as soon as a request session opens a transaction.
 
-    # Propagate user identity to contextvars so service-layer code can access it
-    ctx = request.state.rls_context
-    token_id = current_user_id.set(ctx.user_id) if ctx.user_id else None
-    token_role = current_user_role.set(ctx.user_role) if ctx.user_role else None
+    The variables are transaction-local, so this also re-applies them after
+    an intermediate commit within the same request.
+    """
+    context = session.info.get("rls_context")
+    if context is None or connection.dialect.name != "postgresql":
+        return
     try:
-        response = await call_next(request)
-    finally:
-        if token_id is not None:
-            current_user_id.reset(token_id)
-        if token_role is not None:
-            current_user_role.reset(token_role)
-    return response
+        connection.execute(_SET_RLS_SQL, _rls_params(context))
+    except Exception:
+        logger.debug("RLS context set failed (non-fatal)", exc_info=True)
+
+
+async def bind_rls_context(session: AsyncSession, context: RLSContext) -> None:
+    """Attach RLS context to a session without forcing a connection checkout.
+
+    Requests whose handler never queries the database (or only does so on
+    some branches) no longer pay a pool checkout plus a set_config round-trip.
+    """
+    session.info["rls_context"] = context
+    if session.in_transaction():
+        await apply_rls_context(session, context)
+
+
+class RLSContextMiddleware:
+    """ASGI middleware that stores RLS context for request-scoped DB sessions."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Anonymous probes: no token to decode, no RLS-scoped queries.
+        if scope["type"] != "http" or scope["path"] in PROBE_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        ctx = extract_rls_context(HTTPConnection(scope))
+        scope.setdefault("state", {})["rls_context"] = ctx
+
+        # Propagate user identity to contextvars so service-layer code can access it
+        token_id = current_user_id.set(ctx.user_id) if ctx.user_id else None
+        token_role = current_user_role.set(ctx.user_role) if ctx.user_role else None
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if token_id is not None:
+                current_user_id.reset(token_id)
+            if token_role is not None:
+                current_user_role.reset(token_role)
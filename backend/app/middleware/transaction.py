@@ -4,18 +4,21 @@ Request-scoped TransactionMiddleware (T11)
 Automatically commits the session on successful responses (2xx/3xx)
 and rolls back on errors (4xx/5xx) or unhandled exceptions.
 
-StreamingResponse endpoints are EXCLUDED because BaseHTTPMiddleware exits
-before the response body is fully consumed, so the session would be closed
-while the generator is still running.
+Pure ASGI: the commit/rollback happens when the response start message is
+sent, i.e. after the endpoint has produced its response but before any
+bytes reach the client.
+
+StreamingResponse endpoints are EXCLUDED because their generator keeps
+using the session after the response has started, so it must manage its
+own session lifetime. Health/metrics probes (PROBE_PATHS) are skipped too.
 """
 
 import logging
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.database import AsyncSessionLocal
+from app.utils.constants import PROBE_PATHS
 
 logger = logging.getLogger(__name__)
 
@@ -25,22 +28,34 @@ _STREAMING_PATHS = {
 }
 
 
-class TransactionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
+class TransactionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Skip auto-commit/rollback for streaming endpoints — the generator
         # captures the session and may outlive the middleware scope.
-        if request.url.path in _STREAMING_PATHS:
-            return await call_next(request)
+        # Health/metrics probes never touch the request session.
+        if scope["type"] != "http" or scope["path"] in _STREAMING_PATHS or scope["path"] in PROBE_PATHS:
+            await self.app(scope, receive, send)
+            return
 
         async with AsyncSessionLocal() as session:
-            request.state.db = session
+            scope.setdefault("state", {})["db"] = session
+            response_started = False
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal response_started
+                if message["type"] == "http.response.start" and not response_started:
+                    response_started = True
+                    if message["status"] < 400:
+                        await session.commit()
+                    else:
+                        await session.rollback()
+                await send(message)
+
             try:
-                response = await call_next(request)
-                if response.status_code < 400:
-                    await session.commit()
-                else:
-                    await session.rollback()
-                return response
+                await self.app(scope, receive, send_wrapper)
             except Exception:
                 await session.rollback()
                 logger.exception("Transaction middleware rolled back due to unhandled exception")
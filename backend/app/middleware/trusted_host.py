@@ -0,0 +1,58 @@
+"""
+Host-header allow-list with precomputed lookups.
+
+Starlette's TrustedHostMiddleware scans the allow-list per request and
+compares case-sensitively, so ``Host: Example.com`` is rejected for an
+``example.com`` entry. This subclass lowercases the configuration once,
+checks exact hosts with a frozenset lookup and ``*.domain`` patterns with a
+single ``str.endswith(tuple)`` call. The Host header is read straight from
+the raw ASGI header list and compared as bytes, without decoding.
+"""
+
+from collections.abc import Sequence
+
+from starlette.datastructures import URL
+from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.responses import PlainTextResponse, RedirectResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+def _host_header(scope: Scope) -> bytes:
+    for key, value in scope["headers"]:
+        if key == b"host":
+            return value
+    return b""
+
+
+class FastTrustedHostMiddleware(TrustedHostMiddleware):
+    def __init__(
+        self,
+        app: ASGIApp,
+        allowed_hosts: Sequence[str] | None = None,
+        www_redirect: bool = True,
+    ) -> None:
+        # Parent validates the wildcard patterns and sets allow_any.
+        super().__init__(app, allowed_hosts=allowed_hosts, www_redirect=www_redirect)
+        # Encoded once so the per-request check compares raw header bytes.
+        lowered = [h.lower().encode("latin-1") for h in self.allowed_hosts]
+        self._exact_hosts = frozenset(h for h in lowered if not h.startswith(b"*"))
+        # "*.example.com" -> ".example.com"
+        self._wildcard_suffixes = tuple(h[1:] for h in lowered if h.startswith(b"*."))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.allow_any or scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        host = _host_header(scope).split(b":")[0].lower()
+        if host in self._exact_hosts or (self._wildcard_suffixes and host.endswith(self._wildcard_suffixes)):
+            await self.app(scope, receive, send)
+            return
+
+        response: Response
+        if self.www_redirect and b"www." + host in self._exact_hosts:
+            url = URL(scope=scope)
+            response = RedirectResponse(url=str(url.replace(netloc="www." + url.netloc)))
+        else:
+            response = PlainTextResponse("Invalid host header", status_code=400)
+        await response(scope, receive, send)
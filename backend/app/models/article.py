@@ -36,7 +36,6 @@ class Article(Base, TimestampMixin):
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     document_id = Column(
@@ -73,7 +72,7 @@ class Article(Base, TimestampMixin):
 
     # Generation metadata
     llm_provider = Column(String(50), nullable=True)
-    content_hash = Column(String(64), nullable=True, index=True)
+    content_hash = Column(String(64), nullable=True)
 
     # Search: embedding vector (pgvector)
     if Vector is not None:
@@ -94,6 +93,13 @@ class Article(Base, TimestampMixin):
             Index("ix_articles_bucket_status", "bucket", "status"),
             Index("ix_articles_content_hash", "content_hash"),
             Index("ix_articles_tags", "tags", postgresql_using="gin"),
+            Index(
+                "ix_articles_embedding_hnsw",
+                "embedding_vector",
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={"embedding_vector": "vector_cosine_ops"},
+            ),
             {"schema": "sowknow"},
         )
     else:
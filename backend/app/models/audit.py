@@ -5,11 +5,11 @@ Audit log model for tracking admin actions and confidential access
 import enum
 import uuid
 
-from sqlalchemy import Column, ForeignKey, String, Text
-from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import Column, ForeignKey, Index, String, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base, GUIDType, TimestampMixin
+from app.models.base import Base, GUIDType, NameEnum, TimestampMixin
 
 
 class AuditAction(enum.StrEnum):
@@ -34,14 +34,21 @@ class AuditLog(Base, TimestampMixin):
     """
 
     __tablename__ = "audit_logs"
-    __table_args__ = {"schema": "sowknow"}
-
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
-    user_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.users.id"), nullable=True, index=True)
-    action = Column(SQLEnum(AuditAction), nullable=False, index=True)
+    # The admin audit view filters by user or action over a created_at range
+    # and pages newest-first; these serve filter + order from one index scan
+    # and also cover plain user_id / action lookups.
+    __table_args__ = (
+        Index("ix_audit_logs_user_time", "user_id", text("created_at DESC")),
+        Index("ix_audit_logs_action_time", "action", text("created_at DESC")),
+        {"schema": "sowknow"},
+    )
+
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    user_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.users.id"), nullable=True)
+    action = Column(NameEnum(AuditAction), nullable=False)
     resource_type = Column(String(100), nullable=False, index=True)  # e.g., "user", "document", "system"
     resource_id = Column(String(255), nullable=True, index=True)  # ID of affected resource
-    details = Column(Text, nullable=True)  # JSON string with additional details
+    details = Column(JSONB, nullable=True)  # Additional details (GIN-indexed)
     ip_address = Column(String(45), nullable=True)  # IPv6 compatible
     user_agent = Column(String(512), nullable=True)
 
@@ -1,7 +1,11 @@
+import enum
 import uuid
+from collections.abc import Iterable
+from itertools import islice
 from typing import Any
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, insert
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
@@ -26,30 +30,99 @@ class GUID(TypeDecorator):
         else:
             return dialect.type_descriptor(CHAR(36))
 
+    # Processors are built once per dialect and cached by SQLAlchemy, so the
+    # dialect branch is taken here rather than on every bound value / row.
+    # On PostgreSQL the native UUID type's own processors are used as-is.
+
+    def bind_processor(self, dialect: Any) -> Any:
+        impl_processor = self.load_dialect_impl(dialect).bind_processor(dialect)
+        if dialect.name == "postgresql":
+            return impl_processor
+
+        def process(value: Any) -> Any:
+            if value is None:
+                return value
+            value = str(value) if value.__class__ is uuid.UUID else str(uuid.UUID(value))
+            return impl_processor(value) if impl_processor else value
+
+        return process
+
+    def result_processor(self, dialect: Any, coltype: Any) -> Any:
+        impl_processor = self.load_dialect_impl(dialect).result_processor(dialect, coltype)
+        if dialect.name == "postgresql":
+            return impl_processor
+
+        def process(value: Any) -> Any:
+            if impl_processor:
+                value = impl_processor(value)
+            if value is None or value.__class__ is uuid.UUID:
+                return value
+            return uuid.UUID(value)
+
+        return process
+
+
+GUIDType = GUID
+
+
+class NameEnum(TypeDecorator):
+    """Enum column stored by member *name*, read back by name or value.
+
+    Same DDL and bind values as ``Enum(enum_cls)``, but result rows are
+    resolved with one dict lookup built at construction. Rows written by SQL
+    (triggers, migrations) using the lowercase member *value* also load,
+    where plain ``Enum`` raises ``LookupError``.
+    """
+
+    impl = SQLEnum
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[enum.Enum], **kwargs: Any) -> None:
+        self.enum_cls = enum_cls
+        self._lookup: dict[Any, enum.Enum] = {}
+        for member in enum_cls:
+            self._lookup[member] = member
+            self._lookup[member.value] = member
+            self._lookup[member.name] = member
+        kwargs.setdefault("name", enum_cls.__name__.lower())
+        super().__init__(*enum_cls.__members__, **kwargs)
+
     def process_bind_param(self, value: Any, dialect: Any) -> Any:
         if value is None:
             return value
-        elif dialect.name == "postgresql":
-            return value
-        else:
-            if isinstance(value, uuid.UUID):
-                return str(value)
-            else:
-                return str(uuid.UUID(value))
+        try:
+            return self._lookup[value].name
+        except KeyError:
+            raise LookupError(f"{value!r} is not a valid {self.enum_cls.__name__}") from None
 
-    def process_result_value(self, value: Any, dialect: Any) -> Any:
-        if value is None:
-            return value
-        elif dialect.name == "postgresql":
-            return value
-        else:
-            if isinstance(value, uuid.UUID):
-                return value
-            else:
-                return uuid.UUID(value)
+    def result_processor(self, dialect: Any, coltype: Any) -> Any:
+        # Replaces (rather than chains after) the impl's processor, which
+        # would reject value-spelled rows before we could map them.
+        lookup = self._lookup
 
+        def process(value: Any) -> Any:
+            return None if value is None else lookup[value]
+
+        return process
+
+
+def checked_enum(enum_cls: type[enum.Enum], name: str) -> SQLEnum:
+    """Enum stored as VARCHAR(32) with a named CHECK constraint of its values.
+
+    For value sets that grow (e.g. LLM-extracted entity / relation types):
+    adding a value is a constraint swap in an ordinary transactional
+    migration instead of ``ALTER TYPE ... ADD VALUE``. ``name`` is the CHECK
+    constraint name.
+    """
+    return SQLEnum(
+        enum_cls,
+        values_callable=lambda obj: [e.value for e in obj],
+        native_enum=False,
+        create_constraint=True,
+        length=32,
+        name=name,
+    )
 
-GUIDType = GUID
 
 Base = declarative_base()
 
@@ -63,3 +136,24 @@ class TimestampMixin:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Set defaults for timestamp columns"""
         super().__init__(*args, **kwargs)
+
+
+class BulkInsertMixin:
+    """Mixin adding ``bulk_insert`` for high-volume child rows (chunks, mentions, tags)"""
+
+    @classmethod
+    def bulk_insert(cls, session: Any, rows: Iterable[dict[str, Any]], batch_size: int = 1000) -> int:
+        """Insert *rows* (attribute-name dicts) with executemany, *batch_size* at a time.
+
+        Bypasses the unit of work: no ORM instances are built or tracked, so
+        relationships on already-loaded parents are not refreshed. Python-side
+        column defaults (ids) are still applied. *rows* is consumed lazily.
+        Works with a sync ``Session``; returns the number of rows inserted.
+        """
+        stmt = insert(cls)
+        it = iter(rows)
+        total = 0
+        while batch := list(islice(it, batch_size)):
+            session.execute(stmt, batch)
+            total += len(batch)
+        return total
@@ -15,7 +15,7 @@ class Bookmark(Base):
     __tablename__ = "bookmarks"
     __table_args__ = ({"schema": "sowknow"},)
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     user_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.users.id", ondelete="CASCADE"), nullable=False, index=True)
     url = Column(String(2048), nullable=False)
     title = Column(String(512), nullable=False)
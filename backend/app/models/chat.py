@@ -1,7 +1,7 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, Enum, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -37,7 +37,6 @@ class ChatSession(Base, TimestampMixin):
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     user_id = Column(
@@ -71,13 +70,16 @@ class ChatMessage(Base, TimestampMixin):
     """
 
     __tablename__ = "chat_messages"
-    __table_args__ = {"schema": "sowknow"}
+    # Serves message history pages, including keyset paging on created_at.
+    __table_args__ = (
+        Index("ix_chat_messages_session_created", "session_id", text("created_at DESC")),
+        {"schema": "sowknow"},
+    )
 
     id = Column(
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     session_id = Column(
@@ -50,11 +50,11 @@ class Collection(Base, TimestampMixin):
 
     __tablename__ = "collections"
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
 
     # Owner
     user_id = Column(
-        GUIDType(as_uuid=True), ForeignKey("sowknow.users.id", ondelete="CASCADE"), nullable=False, index=True
+        GUIDType(as_uuid=True), ForeignKey("sowknow.users.id", ondelete="CASCADE"), nullable=False
     )
 
     # Basic info
@@ -138,14 +138,13 @@ class CollectionItem(Base, TimestampMixin):
     """
 
     __tablename__ = "collection_items"
-    __table_args__ = {"schema": "sowknow"}
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     collection_id = Column(
-        GUIDType(as_uuid=True), ForeignKey("sowknow.collections.id", ondelete="CASCADE"), nullable=False, index=True
+        GUIDType(as_uuid=True), ForeignKey("sowknow.collections.id", ondelete="CASCADE"), nullable=False
     )
     document_id = Column(
-        GUIDType(as_uuid=True), ForeignKey("sowknow.documents.id", ondelete="CASCADE"), nullable=False, index=True
+        GUIDType(as_uuid=True), ForeignKey("sowknow.documents.id", ondelete="CASCADE"), nullable=False
     )
     article_id = Column(
         GUIDType(as_uuid=True),
@@ -192,14 +191,13 @@ class CollectionChatSession(Base, TimestampMixin):
     """
 
     __tablename__ = "collection_chat_sessions"
-    __table_args__ = {"schema": "sowknow"}
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     collection_id = Column(
-        GUIDType(as_uuid=True), ForeignKey("sowknow.collections.id", ondelete="CASCADE"), nullable=False, index=True
+        GUIDType(as_uuid=True), ForeignKey("sowknow.collections.id", ondelete="CASCADE"), nullable=False
     )
     user_id = Column(
-        GUIDType(as_uuid=True), ForeignKey("sowknow.users.id", ondelete="CASCADE"), nullable=False, index=True
+        GUIDType(as_uuid=True), ForeignKey("sowknow.users.id", ondelete="CASCADE"), nullable=False
     )
 
     # Session metadata
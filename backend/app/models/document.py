@@ -12,9 +12,11 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     event,
+    literal_column,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship
 
 # Import Vector type from pgvector for embeddings
 try:
@@ -25,7 +27,12 @@ except ImportError:
 import enum
 import uuid
 
-from app.models.base import Base, GUIDType, TimestampMixin
+from app.models.base import Base, BulkInsertMixin, GUIDType, TimestampMixin
+
+# Index expression for the halfvec HNSW index. A literal column renders as-is
+# (parenthesised, as Postgres requires for expression indexes) and exposes a
+# key so postgresql_ops can attach the operator class.
+_EMBEDDING_HALFVEC = literal_column("(embedding_vector::halfvec(1024))")
 
 
 class DocumentBucket(enum.StrEnum):
@@ -60,13 +67,11 @@ class Document(Base, TimestampMixin):
     """
 
     __tablename__ = "documents"
-    __table_args__ = {"schema": "sowknow"}
 
     id = Column(
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     filename = Column(String(512), nullable=False)
@@ -76,7 +81,6 @@ class Document(Base, TimestampMixin):
         Enum(DocumentBucket, values_callable=lambda obj: [e.value for e in obj]),
         default=DocumentBucket.PUBLIC,
         nullable=False,
-        index=True,
     )
     status = Column(
         Enum(DocumentStatus, values_callable=lambda obj: [e.value for e in obj]),
@@ -116,6 +120,17 @@ class Document(Base, TimestampMixin):
     # Additional metadata stored as JSON
     document_metadata = Column("metadata", JSONB, default=dict)
 
+    # Metadata keys that are filtered on, as deferred (never loaded) SQL
+    # expressions. The key is rendered as a literal rather than a bind
+    # parameter so the expression matches the indexes below, including under
+    # asyncpg's generic prepared-statement plans.
+    metadata_sha256 = column_property(
+        document_metadata.op("->>", return_type=Text)(literal_column("'sha256_hash'")), deferred=True
+    )
+    metadata_document_type = column_property(
+        document_metadata.op("->>", return_type=Text)(literal_column("'document_type'")), deferred=True
+    )
+
     # Audio/voice note metadata
     audio_file_path = Column(Text, nullable=True)
     audio_duration_seconds = Column(Float, nullable=True)
@@ -126,12 +141,18 @@ class Document(Base, TimestampMixin):
     chunks = relationship("DocumentChunk", back_populates="document", cascade="all, delete-orphan")
     processing_queue = relationship("ProcessingQueue", back_populates="document", uselist=False)
 
-    # Indexes
+    # Indexes. The document list filters by bucket (always, for non-admins)
+    # and optionally status, then pages newest-first; these serve both shapes
+    # as a bounded index range scan with no sort, and cover plain bucket /
+    # bucket+status lookups.
     __table_args__ = (
-        Index("ix_documents_bucket_status", "bucket", "status"),
+        Index("ix_documents_bucket_created", "bucket", text("created_at DESC")),
+        Index("ix_documents_bucket_status_created", "bucket", "status", text("created_at DESC")),
         Index("ix_documents_created_at", "created_at"),
         Index("ix_documents_language", "language"),
         Index("ix_documents_pipeline_stage", "pipeline_stage", "pipeline_retry_count"),
+        Index("ix_documents_metadata_sha256", text("(metadata ->> 'sha256_hash')")),
+        Index("ix_documents_metadata_document_type", text("(metadata ->> 'document_type')")),
         {"schema": "sowknow"},
     )
 
@@ -139,19 +160,17 @@ class Document(Base, TimestampMixin):
         return f"<Document {self.filename} ({self.bucket}/{self.status})>"
 
 
-class DocumentTag(Base, TimestampMixin):
+class DocumentTag(Base, TimestampMixin, BulkInsertMixin):
     """
     Tags associated with documents for categorization
     """
 
     __tablename__ = "document_tags"
-    __table_args__ = {"schema": "sowknow"}
 
     id = Column(
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     document_id = Column(
@@ -159,7 +178,7 @@ class DocumentTag(Base, TimestampMixin):
         ForeignKey("sowknow.documents.id", ondelete="CASCADE"),
         nullable=False,
     )
-    tag_name = Column(String(256), nullable=False, index=True)
+    tag_name = Column(String(256), nullable=False)
     tag_type = Column(String(100))  # topic, entity, project, importance, etc.
     auto_generated = Column(Boolean, default=False)
     confidence_score = Column(Integer)  # 0-100 for AI-generated tags
@@ -178,7 +197,7 @@ class DocumentTag(Base, TimestampMixin):
         return f"<DocumentTag {self.tag_name} ({self.tag_type})>"
 
 
-class DocumentChunk(Base, TimestampMixin):
+class DocumentChunk(Base, TimestampMixin, BulkInsertMixin):
     """
     Text chunks with embeddings for semantic search
     """
@@ -190,7 +209,6 @@ class DocumentChunk(Base, TimestampMixin):
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     document_id = Column(
@@ -204,7 +222,7 @@ class DocumentChunk(Base, TimestampMixin):
     # Embedding vector column (pgvector)
     # This stores the 1024-dimensional embedding for semantic search
     if Vector is not None:
-        embedding_vector = Column(Vector(1024), nullable=True, index=True)
+        embedding_vector = Column(Vector(1024), nullable=True)
     else:
         # Fallback for testing without pgvector - use Text column
         embedding_vector = Column(Text, nullable=True)
@@ -219,8 +237,9 @@ class DocumentChunk(Base, TimestampMixin):
     search_vector = Column(TSVECTOR, nullable=True)
     search_language = Column(String(10), nullable=False, server_default="french")
 
-    # Relationships
-    document = relationship("Document", back_populates="chunks")
+    # Relationships. Chunks are loaded by the thousand; never lazy-load the
+    # parent per chunk (use selectinload/joinedload or select the columns).
+    document = relationship("Document", back_populates="chunks", lazy="raise_on_sql")
 
     # Indexes
     if Vector is not None:
@@ -233,12 +252,17 @@ class DocumentChunk(Base, TimestampMixin):
                 "document_id", "chunk_index",
                 name="uq_document_chunks_doc_index",
             ),
+            # HNSW over a half-precision copy of the embedding (migration
+            # 043): half the index size and graph-walk bandwidth. Semantic
+            # search orders candidates by the same halfvec cosine distance,
+            # then re-ranks them on the FP32 column.
             Index(
-                "ix_document_chunks_embedding_vector",
-                "embedding_vector",
-                postgresql_using="ivfflat",
-                postgresql_with={"lists": 100},
-            ),
+                "ix_document_chunks_embedding_halfvec_hnsw",
+                _EMBEDDING_HALFVEC,
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={_EMBEDDING_HALFVEC.key: "halfvec_cosine_ops"},
+            ).ddl_if(dialect="postgresql"),
             {"schema": "sowknow"},
         )
     else:
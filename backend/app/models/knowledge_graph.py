@@ -8,11 +8,11 @@ for graph-augmented retrieval and knowledge visualization.
 import enum
 import uuid
 
-from sqlalchemy import Column, Date, Enum, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import Column, Date, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base, GUIDType, TimestampMixin
+from app.models.base import Base, BulkInsertMixin, GUIDType, TimestampMixin, checked_enum
 
 
 class EntityType(enum.StrEnum):
@@ -59,14 +59,13 @@ class Entity(Base, TimestampMixin):
     """
 
     __tablename__ = "entities"
-    __table_args__ = {"schema": "sowknow"}
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
 
     # Entity identity
-    name = Column(String(512), nullable=False, index=True)
+    name = Column(String(512), nullable=False)
     entity_type = Column(
-        Enum(EntityType, values_callable=lambda obj: [e.value for e in obj]), nullable=False, index=True
+        checked_enum(EntityType, "ck_entities_entity_type"), nullable=False
     )
     canonical_id = Column(String(256), index=True)  # External ID (Wikidata, etc.)
 
@@ -86,14 +85,26 @@ class Entity(Base, TimestampMixin):
     y_position = Column(Float)  # For graph visualization
     color = Column(String(7))  # Hex color for visualization
 
-    # Relationships
+    # Relationships. The FKs cascade ON DELETE and are NOT NULL, so deletes
+    # are left to the database (passive_deletes) instead of the ORM loading
+    # each collection and trying to NULL the foreign keys.
+    # The graph relationships are lazy="raise_on_sql" throughout: load them
+    # with selectinload()/joinedload() rather than one query per object.
     source_relationships = relationship(
-        "EntityRelationship", foreign_keys="EntityRelationship.source_id", back_populates="source_entity"
+        "EntityRelationship",
+        foreign_keys="EntityRelationship.source_id",
+        back_populates="source_entity",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     target_relationships = relationship(
-        "EntityRelationship", foreign_keys="EntityRelationship.target_id", back_populates="target_entity"
+        "EntityRelationship",
+        foreign_keys="EntityRelationship.target_id",
+        back_populates="target_entity",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
-    mentions = relationship("EntityMention", back_populates="entity")
+    mentions = relationship("EntityMention", back_populates="entity", passive_deletes=True, lazy="raise_on_sql")
     smart_folders = relationship("SmartFolder", back_populates="entity")
     milestones = relationship("Milestone", back_populates="entity", cascade="all, delete-orphan")
     pattern_insights = relationship("PatternInsight", back_populates="entity", cascade="all, delete-orphan")
@@ -103,6 +114,14 @@ class Entity(Base, TimestampMixin):
         Index("ix_entities_name", "name"),
         Index("ix_entities_type", "entity_type"),
         Index("ix_entities_name_type", "name", "entity_type"),
+        # Alias resolution filters with ``aliases @> '["name"]'``; jsonb_path_ops
+        # only serves containment but is about half the size of the default.
+        Index(
+            "ix_entities_aliases_gin",
+            "aliases",
+            postgresql_using="gin",
+            postgresql_ops={"aliases": "jsonb_path_ops"},
+        ),
         {"schema": "sowknow"},
     )
 
@@ -118,21 +137,20 @@ class EntityRelationship(Base, TimestampMixin):
     """
 
     __tablename__ = "entity_relationships"
-    __table_args__ = {"schema": "sowknow"}
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
 
     # Connected entities
     source_id = Column(
-        GUIDType(as_uuid=True), ForeignKey("sowknow.entities.id", ondelete="CASCADE"), nullable=False, index=True
+        GUIDType(as_uuid=True), ForeignKey("sowknow.entities.id", ondelete="CASCADE"), nullable=False
     )
     target_id = Column(
-        GUIDType(as_uuid=True), ForeignKey("sowknow.entities.id", ondelete="CASCADE"), nullable=False, index=True
+        GUIDType(as_uuid=True), ForeignKey("sowknow.entities.id", ondelete="CASCADE"), nullable=False
     )
 
     # Relationship type and properties
     relation_type = Column(
-        Enum(RelationType, values_callable=lambda obj: [e.value for e in obj]), nullable=False, index=True
+        checked_enum(RelationType, "ck_entity_relationships_relation_type"), nullable=False
     )
     confidence_score = Column(Integer, default=50)  # 0-100
     attributes = Column(JSONB, default=dict)  # Additional properties (start_date, role, etc.)
@@ -143,8 +161,12 @@ class EntityRelationship(Base, TimestampMixin):
     last_seen_at = Column(Date)
 
     # Relationships
-    source_entity = relationship("Entity", foreign_keys=[source_id], back_populates="source_relationships")
-    target_entity = relationship("Entity", foreign_keys=[target_id], back_populates="target_relationships")
+    source_entity = relationship(
+        "Entity", foreign_keys=[source_id], back_populates="source_relationships", lazy="raise_on_sql"
+    )
+    target_entity = relationship(
+        "Entity", foreign_keys=[target_id], back_populates="target_relationships", lazy="raise_on_sql"
+    )
 
     # Indexes
     __table_args__ = (
@@ -158,7 +180,7 @@ class EntityRelationship(Base, TimestampMixin):
         return f"<EntityRelationship {self.source_id} -{self.relation_type}-> {self.target_id}>"
 
 
-class EntityMention(Base, TimestampMixin):
+class EntityMention(Base, TimestampMixin, BulkInsertMixin):
     """
     Specific mention of an entity in a document
 
@@ -166,16 +188,15 @@ class EntityMention(Base, TimestampMixin):
     """
 
     __tablename__ = "entity_mentions"
-    __table_args__ = {"schema": "sowknow"}
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
 
     # References
     entity_id = Column(
-        GUIDType(as_uuid=True), ForeignKey("sowknow.entities.id", ondelete="CASCADE"), nullable=False, index=True
+        GUIDType(as_uuid=True), ForeignKey("sowknow.entities.id", ondelete="CASCADE"), nullable=False
     )
     document_id = Column(
-        GUIDType(as_uuid=True), ForeignKey("sowknow.documents.id", ondelete="CASCADE"), nullable=False, index=True
+        GUIDType(as_uuid=True), ForeignKey("sowknow.documents.id", ondelete="CASCADE"), nullable=False
     )
     chunk_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.document_chunks.id", ondelete="SET NULL"))
 
@@ -187,7 +208,7 @@ class EntityMention(Base, TimestampMixin):
     confidence_score = Column(Integer, default=50)
 
     # Relationships
-    entity = relationship("Entity", back_populates="mentions")
+    entity = relationship("Entity", back_populates="mentions", lazy="raise_on_sql")
 
     # Indexes
     __table_args__ = (
@@ -210,14 +231,13 @@ class TimelineEvent(Base, TimestampMixin):
     """
 
     __tablename__ = "timeline_events"
-    __table_args__ = {"schema": "sowknow"}
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
 
     # Event identity
     title = Column(String(512), nullable=False)
     description = Column(Text)
-    event_date = Column(Date, index=True)
+    event_date = Column(Date)
     event_date_precision = Column(String(20))  # "exact", "approximate", "quarter", "year"
 
     # Related entities
@@ -237,6 +257,13 @@ class TimelineEvent(Base, TimestampMixin):
     __table_args__ = (
         Index("ix_timeline_events_date", "event_date"),
         Index("ix_timeline_events_type", "event_type"),
+        # Entity timelines filter with ``entity_ids @> '["<uuid>"]'``.
+        Index(
+            "ix_timeline_events_entity_ids_gin",
+            "entity_ids",
+            postgresql_using="gin",
+            postgresql_ops={"entity_ids": "jsonb_path_ops"},
+        ),
         {"schema": "sowknow"},
     )
 
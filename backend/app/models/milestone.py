@@ -28,18 +28,16 @@ class Milestone(Base, TimestampMixin):
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     entity_id = Column(
         GUIDType(as_uuid=True),
         ForeignKey("sowknow.entities.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # The milestone date (may be approximate)
-    date = Column(DateTime(timezone=True), nullable=True, index=True)
+    date = Column(DateTime(timezone=True), nullable=True)
     date_precision = Column(
         String(20),
         nullable=True,
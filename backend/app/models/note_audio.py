@@ -9,7 +9,7 @@ class NoteAudio(Base):
     __tablename__ = "note_audio"
     __table_args__ = ({"schema": "sowknow"},)
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     note_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.notes.id", ondelete="CASCADE"), nullable=False, index=True)
     file_path = Column(Text, nullable=False)
     duration_seconds = Column(Float, nullable=True)
@@ -38,20 +38,17 @@ class PatternInsight(Base, TimestampMixin):
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     entity_id = Column(
         GUIDType(as_uuid=True),
         ForeignKey("sowknow.entities.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     insight_type = Column(
         Enum(PatternInsightType, values_callable=lambda obj: [e.value for e in obj]),
         nullable=False,
-        index=True,
     )
 
     description = Column(Text, nullable=False)
@@ -1,7 +1,7 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, GUIDType, TimestampMixin
@@ -33,9 +33,25 @@ class ProcessingQueue(Base, TimestampMixin):
     """
 
     __tablename__ = "processing_queue"
-    __table_args__ = {"schema": "sowknow"}
+    # Per-document task lookups (and the ON DELETE CASCADE from documents)
+    # need document_id indexed. The partial indexes hold only live rows, so
+    # admin queue stats stay cheap however many completed rows accumulate.
+    __table_args__ = (
+        Index("ix_processing_queue_document_task", "document_id", "task_type"),
+        Index(
+            "ix_processing_queue_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index(
+            "ix_processing_queue_inflight",
+            "started_at",
+            postgresql_where=text("status = 'in_progress'"),
+        ),
+        {"schema": "sowknow"},
+    )
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     document_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.documents.id", ondelete="CASCADE"), nullable=False)
 
     # Task information
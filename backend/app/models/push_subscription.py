@@ -9,7 +9,7 @@ class PushSubscription(Base):
     __tablename__ = "push_subscriptions"
     __table_args__ = ({"schema": "sowknow"},)
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     user_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.users.id", ondelete="CASCADE"), nullable=False, index=True)
     endpoint = Column(Text, nullable=False)
     p256dh = Column(String(255), nullable=False)
@@ -48,7 +48,6 @@ class SmartFolder(Base, TimestampMixin):
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     user_id = Column(
@@ -124,7 +123,6 @@ class SmartFolderReport(Base, TimestampMixin):
         GUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     smart_folder_id = Column(
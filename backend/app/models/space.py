@@ -26,7 +26,7 @@ class Space(Base):
     __tablename__ = "spaces"
     __table_args__ = ({"schema": "sowknow"},)
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     user_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.users.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(512), nullable=False)
     description = Column(Text, nullable=True)
@@ -45,7 +45,7 @@ class SpaceItem(Base):
     __tablename__ = "space_items"
     __table_args__ = ({"schema": "sowknow"},)
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     space_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.spaces.id", ondelete="CASCADE"), nullable=False, index=True)
     item_type = Column(
         Enum(SpaceItemType, values_callable=lambda obj: [e.value for e in obj]),
@@ -64,7 +64,7 @@ class SpaceRule(Base):
     __tablename__ = "space_rules"
     __table_args__ = ({"schema": "sowknow"},)
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     space_id = Column(GUIDType(as_uuid=True), ForeignKey("sowknow.spaces.id", ondelete="CASCADE"), nullable=False, index=True)
     rule_type = Column(
         Enum(SpaceRuleType, values_callable=lambda obj: [e.value for e in obj]),
@@ -20,7 +20,7 @@ class Subscription(Base):
     __tablename__ = "subscriptions"
     __table_args__ = {"schema": "sowknow"}
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     user_id = Column(
         GUIDType(as_uuid=True),
         ForeignKey("sowknow.users.id", ondelete="CASCADE"),
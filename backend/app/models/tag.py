@@ -31,8 +31,8 @@ class Tag(Base):
         {"schema": "sowknow"},
     )
 
-    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
-    tag_name = Column(String(255), nullable=False, index=True)
+    id = Column(GUIDType(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    tag_name = Column(String(255), nullable=False)
     tag_type = Column(
         Enum(TagType, values_callable=lambda obj: [e.value for e in obj]),
         nullable=False,
@@ -8,7 +8,6 @@ import functools
 import logging
 import time
 from collections.abc import Callable
-from typing import Any
 
 import httpx
 from tenacity import before_sleep_log, retry, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -27,6 +26,24 @@ RETRYABLE_EXCEPTIONS = (
 )
 
 
+@functools.cache
+def _retry_policy(
+    max_attempts: int,
+    min_wait: float,
+    max_wait: float,
+    retry_exceptions: tuple[type[Exception], ...],
+) -> Callable:
+    # One tenacity decorator per distinct configuration; plain @with_retry()
+    # uses share the same one.
+    return retry(
+        stop=stop_after_attempt(max_attempts),
+        wait=wait_exponential(multiplier=min_wait, max=max_wait),
+        retry=retry_if_exception_type(retry_exceptions),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+
+
 def with_retry(
     max_attempts: int = 3,
     min_wait: float = 1,
@@ -36,6 +53,9 @@ def with_retry(
     """
     Decorator factory for adding retry logic to async network functions.
 
+    Failed attempts are logged by tenacity's ``before_sleep_log`` before each
+    retry; the decorated function is called directly, without a wrapper frame.
+
     Args:
         max_attempts: Maximum number of retry attempts
         min_wait: Minimum wait time between retries (exponential backoff)
@@ -45,26 +65,7 @@ def with_retry(
     Returns:
         Decorated function with retry logic
     """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        @retry(
-            stop=stop_after_attempt(max_attempts),
-            wait=wait_exponential(multiplier=min_wait, max=max_wait),
-            retry=retry_if_exception_type(retry_exceptions),
-            before_sleep=before_sleep_log(logger, logging.WARNING),
-            reraise=True,
-        )
-        async def wrapper(*args, **kwargs) -> Any:
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                logger.warning(f"Attempt failed for {func.__name__}: {str(e)}")
-                raise
-
-        return wrapper
-
-    return decorator
+    return _retry_policy(max_attempts, min_wait, max_wait, tuple(retry_exceptions))
 
 
 class CircuitBreaker:
@@ -90,27 +91,41 @@ class CircuitBreaker:
         self.success_count = 0
         self.last_failure_time: float | None = None
         self.state = "CLOSED"
+        self._probe_in_flight = False
 
     def _can_execute(self) -> bool:
-        """Check if request can be executed based on circuit state."""
+        """Check if request can be executed based on circuit state.
+
+        In HALF_OPEN a single trial request is let through at a time; others
+        are rejected until it records a success or failure. There is no await
+        between the check and the update, so this is atomic under asyncio.
+        """
         if self.state == "CLOSED":
             return True
 
         if self.state == "OPEN":
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                self.state = "HALF_OPEN"
-                self.success_count = 0
-                logger.info("Circuit breaker: OPEN -> HALF_OPEN")
-                return True
-            return False
+            if time.monotonic() - self.last_failure_time < self.recovery_timeout:
+                return False
+            self.state = "HALF_OPEN"
+            self.success_count = 0
+            self._probe_in_flight = False
+            logger.info("Circuit breaker: OPEN -> HALF_OPEN")
 
         if self.state == "HALF_OPEN":
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
             return True
 
         return False
 
+    def _release_probe(self) -> None:
+        """Free the HALF_OPEN trial slot when a request ends without an outcome."""
+        self._probe_in_flight = False
+
     def _record_success(self) -> None:
         """Record successful request."""
+        self._probe_in_flight = False
         if self.state == "HALF_OPEN":
             self.success_count += 1
             if self.success_count >= self.half_open_success_threshold:
@@ -123,8 +138,9 @@ class CircuitBreaker:
 
     def _record_failure(self) -> None:
         """Record failed request."""
+        self._probe_in_flight = False
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
 
         if self.state == "HALF_OPEN":
             self.state = "OPEN"
@@ -144,6 +160,31 @@ class CircuitBreaker:
         }
 
 
+# One connection pool per base_url, shared by every ResilientAsyncClient and
+# resilient_request() call so keep-alive connections (and their TCP/TLS
+# handshakes) are reused instead of being set up and torn down per request.
+# Closed on app shutdown via close_shared_clients().
+_SHARED_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=60)
+_shared_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _get_shared_client(base_url: str) -> httpx.AsyncClient:
+    client = _shared_clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(base_url=base_url, limits=_SHARED_LIMITS)
+        _shared_clients[base_url] = client
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close all pooled clients. Called from the app lifespan on shutdown."""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        if not client.is_closed:
+            await client.aclose()
+
+
 class ResilientAsyncClient:
     """
     Async HTTP client with built-in retry logic and circuit breaker.
@@ -168,18 +209,14 @@ class ResilientAsyncClient:
         self._max_wait = max_wait
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create httpx client."""
+        """Get the shared pooled client for this base_url."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=httpx.Timeout(self.timeout),
-            )
+            self._client = _get_shared_client(self.base_url)
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """Release the HTTP client. The shared pool stays open for other callers."""
+        self._client = None
 
     async def request(
         self,
@@ -194,6 +231,7 @@ class ResilientAsyncClient:
             raise CircuitBreakerOpenError(f"Circuit breaker is {self._circuit_breaker.state}")
 
         client = await self._get_client()
+        kwargs.setdefault("timeout", self.timeout)
         last_exception: Exception | None = None
 
         for attempt in range(1, self._max_attempts + 1):
@@ -217,28 +255,30 @@ class ResilientAsyncClient:
                     if self._circuit_breaker:
                         self._circuit_breaker._record_failure()
                     raise
+            except BaseException:
+                # Non-retryable error or cancellation: no verdict on the
+                # upstream, but don't leave a HALF_OPEN trial slot taken.
+                if self._circuit_breaker:
+                    self._circuit_breaker._release_probe()
+                raise
 
         if last_exception:
             raise last_exception
 
-    @with_retry()
     async def get(self, url: str, **kwargs) -> httpx.Response:
-        """GET request with retry."""
+        """GET request; retries and circuit breaking are handled by ``request``."""
         return await self.request("GET", url, **kwargs)
 
-    @with_retry()
     async def post(self, url: str, **kwargs) -> httpx.Response:
-        """POST request with retry."""
+        """POST request; retries and circuit breaking are handled by ``request``."""
         return await self.request("POST", url, **kwargs)
 
-    @with_retry()
     async def put(self, url: str, **kwargs) -> httpx.Response:
-        """PUT request with retry."""
+        """PUT request; retries and circuit breaking are handled by ``request``."""
         return await self.request("PUT", url, **kwargs)
 
-    @with_retry()
     async def delete(self, url: str, **kwargs) -> httpx.Response:
-        """DELETE request with retry."""
+        """DELETE request; retries and circuit breaking are handled by ``request``."""
         return await self.request("DELETE", url, **kwargs)
 
     def get_circuit_breaker_status(self) -> dict | None:
@@ -264,8 +304,5 @@ async def resilient_request(
     """
     Convenience function for making a single resilient request.
     """
-    client = ResilientAsyncClient(timeout=timeout)
-    try:
-        return await client.request(method, url, **kwargs)
-    finally:
-        await client.close()
+    client = ResilientAsyncClient(max_attempts=max_attempts, timeout=timeout)
+    return await client.request(method, url, **kwargs)
@@ -1,21 +1,42 @@
 # Schemas initialization
-from app.schemas.token import Token, TokenPayload
-from app.schemas.user import UserCreate, UserInDB, UserPublic, UserRole
+#
+# Names are resolved on first access (PEP 562). Importing any submodule
+# (``from app.schemas.user import ...``) runs this file, so eager imports here
+# made every process that touched one schema load all of them — and, through
+# smart_folder, the whole model registry.
+import importlib
 
-# Document schemas - check if they exist first
-try:
-    from app.schemas.document import (
-        DocumentChunkResponse,
-        DocumentCreate,
-        DocumentListResponse,
-        DocumentResponse,
-        DocumentTagCreate,
-        DocumentTagResponse,
-        DocumentUpdate,
-        DocumentUploadResponse,
-    )
-
-    _document_schemas = [
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "app.schemas.user": ("UserCreate", "UserPublic", "UserInDB", "UserRole"),
+    "app.schemas.token": ("Token", "TokenPayload"),
+    "app.schemas.pagination": (
+        "PaginationParams",
+        "PaginatedResponse",
+        "CursorPaginationParams",
+        "CursorPaginatedResponse",
+        "encode_cursor",
+        "decode_cursor",
+    ),
+    # Smart Folder v2
+    "app.schemas.smart_folder": (
+        "SmartFolderCreate",
+        "SmartFolderUpdate",
+        "SmartFolderResponse",
+        "SmartFolderListResponse",
+        "SmartFolderGenerateRequest",
+        "SmartFolderRefineRequest",
+        "SmartFolderSaveRequest",
+        "SmartFolderReportResponse",
+        "GenerationStatusResponse",
+        "CitationEntry",
+        "GeneratedContent",
+        "ReportSection",
+        "MilestoneCreate",
+        "MilestoneResponse",
+        "PatternInsightCreate",
+        "PatternInsightResponse",
+    ),
+    "app.schemas.document": (
         "DocumentCreate",
         "DocumentUpdate",
         "DocumentResponse",
@@ -24,25 +45,8 @@ try:
         "DocumentTagCreate",
         "DocumentTagResponse",
         "DocumentChunkResponse",
-    ]
-except ImportError:
-    _document_schemas = []
-
-# Chat schemas - check if they exist
-try:
-    from app.schemas.chat import (
-        ChatMessageCreate,
-        ChatMessageListResponse,
-        ChatMessageResponse,
-        ChatSessionCreate,
-        ChatSessionListResponse,
-        ChatSessionResponse,
-        ChatStreamChunk,
-        LLMProvider,
-        MessageRole,
-    )
-
-    _chat_schemas = [
+    ),
+    "app.schemas.chat": (
         "ChatSessionCreate",
         "ChatSessionResponse",
         "ChatSessionListResponse",
@@ -52,68 +56,18 @@ try:
         "ChatStreamChunk",
         "LLMProvider",
         "MessageRole",
-    ]
-except ImportError:
-    _chat_schemas = []
-
-# Search schemas - check if they exist
-try:
-    from app.schemas.search import SearchRequest, SearchResponse, SearchResultChunk
-
-    _search_schemas = ["SearchRequest", "SearchResponse", "SearchResultChunk"]
-except ImportError:
-    _search_schemas = []
-
-# Admin schemas - check if they exist
-try:
-    from app.schemas.admin import (
-        AnomalyBucketResponse,
-        AnomalyDocument,
-        DashboardResponse,
-        QueueStats,
-        SystemStats,
-    )
-
-    _admin_schemas = [
+    ),
+    "app.schemas.search": ("SearchRequest", "SearchResponse", "SearchResultChunk"),
+    "app.schemas.admin": (
         "SystemStats",
         "QueueStats",
         "AnomalyDocument",
         "AnomalyBucketResponse",
         "DashboardResponse",
-    ]
-except ImportError:
-    _admin_schemas = []
-
-# Collection schemas - check if they exist
-try:
-    from app.schemas.collection import (
-        CollectionBulkAddRequest,
-        CollectionBulkRemoveRequest,
-        CollectionChatCreate,
-        CollectionChatResponse,
-        CollectionCreate,
-        CollectionDetailResponse,
-        CollectionItemCreate,
-        CollectionItemResponse,
-        CollectionItemUpdate,
-        CollectionListResponse,
-        CollectionPreviewRequest,
-        CollectionPreviewResponse,
-        CollectionRefreshRequest,
-        CollectionReportRequest,
-        CollectionReportResponse,
-        CollectionResponse,
-        CollectionStatsResponse,
-        CollectionType,
-        CollectionUpdate,
-        CollectionVisibility,
-        ParsedIntentResponse,
-        ReportFormat,
-        SmartFolderGenerateRequest,
-        SmartFolderResponse,
-    )
-
-    _collection_schemas = [
+    ),
+    # SmartFolderGenerateRequest / SmartFolderResponse also exist here; the
+    # package exports the smart_folder versions.
+    "app.schemas.collection": (
         "ParsedIntentResponse",
         "CollectionCreate",
         "CollectionUpdate",
@@ -131,77 +85,27 @@ try:
         "CollectionBulkRemoveRequest",
         "CollectionRefreshRequest",
         "CollectionStatsResponse",
-        "SmartFolderGenerateRequest",
-        "SmartFolderResponse",
         "ReportFormat",
         "CollectionReportRequest",
         "CollectionReportResponse",
         "CollectionVisibility",
         "CollectionType",
-    ]
-except ImportError:
-    _collection_schemas = []
+    ),
+}
 
-from app.schemas.smart_folder import (
-    CitationEntry,
-    GeneratedContent,
-    GenerationStatusResponse,
-    MilestoneCreate,
-    MilestoneResponse,
-    PatternInsightCreate,
-    PatternInsightResponse,
-    ReportSection,
-    SmartFolderCreate,
-    SmartFolderGenerateRequest,
-    SmartFolderListResponse,
-    SmartFolderRefineRequest,
-    SmartFolderReportResponse,
-    SmartFolderResponse,
-    SmartFolderSaveRequest,
-    SmartFolderUpdate,
-)
-from app.schemas.pagination import (
-    CursorPaginatedResponse,
-    CursorPaginationParams,
-    PaginatedResponse,
-    PaginationParams,
-    decode_cursor,
-    encode_cursor,
-)
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
 
-__all__ = [
-    "UserCreate",
-    "UserPublic",
-    "UserInDB",
-    "UserRole",
-    "Token",
-    "TokenPayload",
-    "PaginationParams",
-    "PaginatedResponse",
-    "CursorPaginationParams",
-    "CursorPaginatedResponse",
-    "encode_cursor",
-    "decode_cursor",
-    # Smart Folder v2
-    "SmartFolderCreate",
-    "SmartFolderUpdate",
-    "SmartFolderResponse",
-    "SmartFolderListResponse",
-    "SmartFolderGenerateRequest",
-    "SmartFolderRefineRequest",
-    "SmartFolderSaveRequest",
-    "SmartFolderReportResponse",
-    "GenerationStatusResponse",
-    "CitationEntry",
-    "GeneratedContent",
-    "ReportSection",
-    "MilestoneCreate",
-    "MilestoneResponse",
-    "PatternInsightCreate",
-    "PatternInsightResponse",
-    *_document_schemas,
-    *_chat_schemas,
-    *_search_schemas,
-    *_admin_schemas,
-    *_collection_schemas,
-]
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 import re
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, validator
@@ -144,7 +145,7 @@ class AuditLogEntry(BaseModel):
     action: str
     resource_type: str
     resource_id: str | None = None
-    details: str | None = None
+    details: dict[str, Any] | str | None = None
     ip_address: str | None = None
     created_at: datetime
     user_email: str | None = None  # Joined from user table
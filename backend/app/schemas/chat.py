@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import StrEnum
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class LLMProvider(StrEnum):
@@ -21,9 +21,15 @@ class MessageRole(StrEnum):
 # Chat Session Schemas
 class ChatSessionCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=512)
-    document_scope: list[UUID] | None = None
+    # Stored as JSONB and matched per search hit, so keep it bounded.
+    document_scope: list[UUID] | None = Field(default=None, max_length=500)
     model_preference: str | None = None
 
+    @field_validator("document_scope")
+    @classmethod
+    def dedupe_document_scope(cls, value: list[UUID] | None) -> list[UUID] | None:
+        return list(dict.fromkeys(value)) if value else value
+
 
 class ChatSessionResponse(BaseModel):
     id: UUID
@@ -76,6 +82,7 @@ class ChatMessageResponse(BaseModel):
 class ChatMessageListResponse(BaseModel):
     messages: list[ChatMessageResponse]
     total: int
+    next_cursor: str | None = None
 
 
 # Stream Response Schema
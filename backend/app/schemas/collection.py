@@ -106,10 +106,21 @@ class CollectionItemResponse(BaseModel):
     # Include document summary (set after ORM validation)
     document: Any | None = None
 
+    @classmethod
+    def from_orm_trusted(cls, item: Any) -> "CollectionItemResponse":
+        """Build from a CollectionItem row without running validation."""
+        return cls.model_construct(**{name: getattr(item, name) for name in _ITEM_ORM_FIELDS})
+
     class Config:
         from_attributes = True
 
 
+# Article title/summary and the document summary are filled in by the caller.
+_ITEM_ORM_FIELDS = tuple(
+    name for name in CollectionItemResponse.model_fields if name not in {"article_title", "article_summary", "document"}
+)
+
+
 class CollectionResponse(BaseModel):
     id: UUID
     user_id: UUID
@@ -133,10 +144,20 @@ class CollectionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_orm_trusted(cls, collection: Any, **extra: Any) -> "CollectionResponse":
+        """Build from a Collection row without running validation; ``extra`` fills subclass fields."""
+        return cls.model_construct(
+            **{name: getattr(collection, name) for name in _COLLECTION_ORM_FIELDS}, **extra
+        )
+
     class Config:
         from_attributes = True
 
 
+_COLLECTION_ORM_FIELDS = tuple(CollectionResponse.model_fields)
+
+
 class CollectionDetailResponse(CollectionResponse):
     """Extended response with items"""
 
@@ -1,5 +1,6 @@
 from datetime import datetime
 from enum import StrEnum
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -82,11 +83,25 @@ class DocumentResponse(BaseModel):
             self.error_message = meta.get("processing_error") or self.pipeline_error
         return self
 
+    @classmethod
+    def from_orm_trusted(cls, doc: Any) -> "DocumentResponse":
+        """Build from a Document row without running validation."""
+        values = {name: getattr(doc, name) for name in _DOCUMENT_ORM_FIELDS}
+        values["metadata"] = doc.document_metadata
+        # model_construct skips validators, so derive error_message here.
+        return cls.model_construct(**values).compute_error_message()
+
     class Config:
         from_attributes = True
         populate_by_name = True
 
 
+# metadata is read from document_metadata; error_message is derived.
+_DOCUMENT_ORM_FIELDS = tuple(
+    name for name in DocumentResponse.model_fields if name not in {"metadata", "error_message"}
+)
+
+
 class DocumentListResponse(BaseModel):
     documents: list[DocumentResponse]
     total: int
@@ -161,15 +161,20 @@ class ChatService:
         ]
         doc_metadata: dict = {}
         if confidential_doc_ids:
-            from sqlalchemy.orm import selectinload
+            from sqlalchemy.orm import load_only, selectinload
 
             from app.database import AsyncSessionLocal
-            from app.models.document import Document
+            from app.models.document import Document, DocumentTag
 
+            # Only the metadata summary fields are read; skip the metadata
+            # JSONB and the other wide columns.
             async with AsyncSessionLocal() as meta_db:
                 result = await meta_db.execute(
                     select(Document)
-                    .options(selectinload(Document.tags))
+                    .options(
+                        load_only(Document.id, Document.page_count, Document.mime_type, Document.created_at),
+                        selectinload(Document.tags).load_only(DocumentTag.tag_name),
+                    )
                     .where(Document.id.in_(confidential_doc_ids))
                 )
                 for doc in result.scalars().all():
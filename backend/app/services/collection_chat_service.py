@@ -5,7 +5,6 @@ Manages chat sessions scoped to specific collections with Mistral Small 2603
 (via OpenRouter) for public and confidential documents.
 """
 
-import json
 import logging
 import uuid
 from typing import Any
@@ -42,7 +41,7 @@ async def create_audit_log(
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
-            details=json.dumps(details) if details else None,
+            details=details or None,
         )
         db.add(audit_entry)
         await db.commit()
@@ -10,6 +10,7 @@ is updated or deleted (see openrouter_service.invalidate_collection_cache).
 Cache key prefix: collection:{collection_id}:query:{hash}
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime
@@ -375,7 +376,7 @@ class CollectionService:
             - "broad_hybrid": generic query
         """
         # Check cache first
-        cached = SearchCache.get_collection_intent(query)
+        cached = await asyncio.to_thread(SearchCache.get_collection_intent, query)
         if cached:
             logger.info(f"Intent cache hit for query: {query[:50]}")
             intent = ParsedIntentModel(**cached)
@@ -399,7 +400,7 @@ class CollectionService:
                     intent = self.intent_parser._fallback_parse(query)
 
             # Cache the parsed intent
-            SearchCache.set_collection_intent(query, intent.to_dict())
+            await asyncio.to_thread(SearchCache.set_collection_intent, query, intent.to_dict())
 
         # Pick search strategy based on intent content
         strategy = "broad_hybrid"
@@ -428,7 +429,7 @@ class CollectionService:
         user_role = user.role.value if user and hasattr(user, "role") else "user"
 
         # Check cache first
-        cached = SearchCache.get_collection_gather(search_query, user_role)
+        cached = await asyncio.to_thread(SearchCache.get_collection_gather, search_query, user_role)
         if cached:
             logger.info(f"Gather cache hit for query: {search_query[:50]}")
             return cached
@@ -530,7 +531,7 @@ class CollectionService:
 
             if len(results) >= min_results:
                 logger.info(f"Stage 2: Found {len(results)} results on attempt {attempt + 1}")
-                SearchCache.set_collection_gather(search_query, user_role, results)
+                await asyncio.to_thread(SearchCache.set_collection_gather, search_query, user_role, results)
                 return results
 
             # Broaden search for retry
@@ -539,7 +540,7 @@ class CollectionService:
                 search_query = intent.query  # Use full query text
 
         logger.info(f"Stage 2: Returning {len(results)} results after {max_attempts} attempts")
-        SearchCache.set_collection_gather(search_query, user_role, results)
+        await asyncio.to_thread(SearchCache.set_collection_gather, search_query, user_role, results)
         return results
 
     async def _gather_documents_for_intent(self, intent: ParsedIntentModel, user: User, db: Session) -> list[Document]:
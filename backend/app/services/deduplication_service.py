@@ -110,9 +110,7 @@ class DeduplicationService:
         # Check database using metadata, scoped to this uploader.
         # Multiple legacy rows may share a hash, so choose the newest
         # same-size document instead of raising.
-        query = select(Document).where(
-            Document.document_metadata["sha256_hash"].astext == file_hash
-        )
+        query = select(Document).where(Document.metadata_sha256 == file_hash)
         if uploaded_by:
             query = query.where(Document.uploaded_by == uploaded_by)
         query = query.order_by(Document.created_at.desc())
@@ -240,7 +238,7 @@ class DeduplicationService:
         hash_duplicates = []
         # Get documents with hashes in metadata
         docs_with_hashes_result = await db.execute(
-            select(Document).where(Document.document_metadata["sha256_hash"].astext != None)
+            select(Document).where(Document.metadata_sha256.isnot(None))
         )
         docs_with_hashes = docs_with_hashes_result.scalars().all()
 
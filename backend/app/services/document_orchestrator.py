@@ -8,7 +8,6 @@ reducing the API router's responsibility to HTTP concerns only
 This is Step 1 in decoupling the 1,441-line documents.py god-router.
 """
 
-import json
 import logging
 from datetime import UTC, datetime
 from typing import Any
@@ -352,7 +351,7 @@ class DocumentOrchestrator:
             action=AuditAction.CONFIDENTIAL_UPLOADED,
             resource_type="document",
             resource_id=str(document.id),
-            details=json.dumps({"filename": document.filename, "original_filename": original_filename}),
+            details={"filename": document.filename, "original_filename": original_filename},
             created_at=datetime.now(UTC),
         )
         db.add(audit)
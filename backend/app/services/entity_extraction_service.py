@@ -179,19 +179,23 @@ class EntityExtractionService:
             if not extracted:
                 return {"entities": [], "relationships": [], "events": []}
 
-            # Store entities (sync DB operations)
+            # Store entities (sync DB operations). Entities are flushed as
+            # they are created, so their mentions can be bulk-inserted after.
             entity_map = {}
+            mentions = []
             for entity_data in extracted.get("entities", []):
                 entity = self._get_or_create_entity_sync(entity_data=entity_data, db=db)
                 if entity:
                     entity_map[entity.name] = entity
-                    mention = EntityMention(
-                        entity_id=entity.id,
-                        document_id=document.id,
-                        context_text=entity_data.get("context", "")[:500],
-                        confidence_score=entity_data.get("confidence", 50),
+                    mentions.append(
+                        {
+                            "entity_id": entity.id,
+                            "document_id": document.id,
+                            "context_text": entity_data.get("context", "")[:500],
+                            "confidence_score": entity_data.get("confidence", 50),
+                        }
                     )
-                    db.add(mention)
+            EntityMention.bulk_insert(db, mentions)
 
             # Store relationships
             for rel_data in extracted.get("relationships", []):
@@ -20,7 +20,7 @@ except ImportError:
     Histogram = None  # type: ignore[assignment,misc]
     _prometheus_available = False
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from threading import Lock
 
 import redis
@@ -945,6 +945,8 @@ class AlertManager:
         self._alerts: dict[str, AlertConfig] = {}
         self._alert_states: dict[str, AlertState] = {}
         self._lock = Lock()
+        # Serialized configs for the alerts API; rebuilt only on registration.
+        self._configured: list[dict[str, Any]] = []
 
     def register_alert(self, config: AlertConfig) -> None:
         """Register a new alert configuration."""
@@ -952,6 +954,11 @@ class AlertManager:
             self._alerts[config.name] = config
             if config.name not in self._alert_states:
                 self._alert_states[config.name] = AlertState(alert_name=config.name)
+            self._configured = [asdict(c) for c in self._alerts.values()]
+
+    def get_configured_alerts(self) -> list[dict[str, Any]]:
+        """Return all registered alert configurations as plain dicts (do not mutate)."""
+        return self._configured
 
     def check_alert(self, name: str, current_value: float) -> bool:
         """
@@ -1015,6 +1022,7 @@ class AlertManager:
 _cost_tracker: CostTracker | None = None
 _queue_monitor: QueueMonitor | None = None
 _alert_manager = AlertManager()
+_system_monitor = SystemMonitor()
 _cost_ceiling: CostCeiling | None = None
 _per_user_cost_budget: PerUserCostBudget | None = None
 
@@ -1060,6 +1068,11 @@ def get_alert_manager() -> AlertManager:
     return _alert_manager
 
 
+def get_system_monitor() -> SystemMonitor:
+    """Get global system monitor instance (stateless, safe to share across threads)."""
+    return _system_monitor
+
+
 def setup_default_alerts() -> None:
     """Set up default monitoring alerts per PRD requirements."""
     manager = get_alert_manager()
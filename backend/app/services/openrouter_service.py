@@ -23,6 +23,7 @@ from datetime import datetime
 from typing import Any
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -175,12 +176,12 @@ class OpenRouterService:
             SHA256 hash string prefixed with cache namespace.
         """
         scope = collection_id or "global"
-        cache_content = (
-            f"{model}:{tier}:{scope}:"
-            f"{json.dumps(messages, separators=(',', ':'), ensure_ascii=False)}"
-        )
-        cache_hash = hashlib.sha256(cache_content.encode("utf-8")).hexdigest()
-        return f"{CACHE_KEY_PREFIX}{cache_hash}"
+        # orjson emits the same bytes as json.dumps(separators=(",", ":"),
+        # ensure_ascii=False) for chat messages, so existing keys stay valid,
+        # without building the prompt as a str and re-encoding it.
+        digest = hashlib.sha256(f"{model}:{tier}:{scope}:".encode())
+        digest.update(orjson.dumps(messages))
+        return f"{CACHE_KEY_PREFIX}{digest.hexdigest()}"
 
     def check_cache(
         self,
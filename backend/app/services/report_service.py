@@ -29,6 +29,45 @@ class ReportFormat:
     SHORT = "short"
     STANDARD = "standard"
     COMPREHENSIVE = "comprehensive"
+    ALL = frozenset({SHORT, STANDARD, COMPREHENSIVE})
+
+
+# Length/section guidance per report format, built once at import.
+_FORMAT_GUIDES: dict[str, dict[str, Any]] = {
+    ReportFormat.SHORT: {
+        "length": "1-2 pages",
+        "sections": ["Executive Summary", "Key Findings", "Recommendations"],
+        "detail": "Concise, high-level overview",
+    },
+    ReportFormat.STANDARD: {
+        "length": "3-5 pages",
+        "sections": [
+            "Executive Summary",
+            "Introduction",
+            "Analysis",
+            "Key Findings",
+            "Recommendations",
+            "Conclusion",
+        ],
+        "detail": "Balanced overview with supporting details",
+    },
+    ReportFormat.COMPREHENSIVE: {
+        "length": "6-10 pages",
+        "sections": [
+            "Executive Summary",
+            "Introduction",
+            "Background",
+            "Detailed Analysis",
+            "Key Findings",
+            "Supporting Evidence",
+            "Recommendations",
+            "Implementation Notes",
+            "Conclusion",
+            "Appendices",
+        ],
+        "detail": "In-depth analysis with extensive supporting evidence",
+    },
+}
 
 
 class ReportService:
@@ -203,44 +242,7 @@ class ReportService:
         Trigger for tier downgrade: cost estimate > $0.30/report.
         """
 
-        # Build format guidelines
-        format_guides = {
-            ReportFormat.SHORT: {
-                "length": "1-2 pages",
-                "sections": ["Executive Summary", "Key Findings", "Recommendations"],
-                "detail": "Concise, high-level overview",
-            },
-            ReportFormat.STANDARD: {
-                "length": "3-5 pages",
-                "sections": [
-                    "Executive Summary",
-                    "Introduction",
-                    "Analysis",
-                    "Key Findings",
-                    "Recommendations",
-                    "Conclusion",
-                ],
-                "detail": "Balanced overview with supporting details",
-            },
-            ReportFormat.COMPREHENSIVE: {
-                "length": "6-10 pages",
-                "sections": [
-                    "Executive Summary",
-                    "Introduction",
-                    "Background",
-                    "Detailed Analysis",
-                    "Key Findings",
-                    "Supporting Evidence",
-                    "Recommendations",
-                    "Implementation Notes",
-                    "Conclusion",
-                    "Appendices",
-                ],
-                "detail": "In-depth analysis with extensive supporting evidence",
-            },
-        }
-
-        guide = format_guides.get(format, format_guides[ReportFormat.STANDARD])
+        guide = _FORMAT_GUIDES.get(format, _FORMAT_GUIDES[ReportFormat.STANDARD])
 
         # Language instruction
         lang_instruction = "Write the report in English." if language == "en" else "Rédigez le rapport en français."
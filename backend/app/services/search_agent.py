@@ -14,9 +14,9 @@ from uuid import UUID
 
 from sqlalchemy import select as sa_select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
-from app.models.document import Document, DocumentBucket
+from app.models.document import Document, DocumentBucket, DocumentTag
 from app.models.user import UserRole
 from app.services.agent_identity import build_service_prompt
 from app.services.context_block_service import get_cached_context_block
@@ -563,7 +563,10 @@ async def _strip_confidential_chunks(
     async with AsyncSessionLocal() as meta_db:
         result = await meta_db.execute(
             sa_select(Document)
-            .options(selectinload(Document.tags))
+            .options(
+                load_only(Document.id, Document.page_count, Document.mime_type, Document.created_at),
+                selectinload(Document.tags).load_only(DocumentTag.tag_name),
+            )
             .where(Document.id.in_(confidential_doc_ids))
         )
         doc_metadata = {str(doc.id): doc for doc in result.scalars().all()}
@@ -646,7 +649,9 @@ async def run_agentic_search(
     # --- Result cache check (no DB) ---
     bucket_filter = HybridSearchService()._get_user_bucket_filter(user) if user else ["public"]
     try:
-        cached = SearchCache.get_result(request.query, user_role.value, request.top_k, bucket_filter)
+        cached = await asyncio.to_thread(
+            SearchCache.get_result, request.query, user_role.value, request.top_k, bucket_filter
+        )
         logger.info("run_agentic_search: SearchCache.get_result succeeded")
     except Exception as exc:
         logger.warning("run_agentic_search: SearchCache.get_result failed: %s", exc)
@@ -743,7 +748,7 @@ async def run_agentic_search(
             result = await db.execute(
                 sa_select(Document.id).where(
                     Document.id.in_(doc_ids_to_check),
-                    Document.document_metadata["document_type"].astext == "journal",
+                    Document.metadata_document_type == "journal",
                 )
             )
             journal_doc_ids = {row[0] for row in result.fetchall()}
@@ -861,8 +866,13 @@ async def run_agentic_search(
     )
 
     # --- Store result in cache ---
-    SearchCache.set_result(
-        request.query, user_role.value, request.top_k, bucket_filter, response.model_dump(mode="json")
+    await asyncio.to_thread(
+        SearchCache.set_result,
+        request.query,
+        user_role.value,
+        request.top_k,
+        bucket_filter,
+        response.model_dump(mode="json"),
     )
 
     return response
@@ -4,13 +4,20 @@ Search-specific caching layer on top of Redis.
 Caches:
 - Query embeddings (TTL 1h) — same text → same embedding
 - Search results (TTL 60s) — repeated queries within 1 minute
+
+Values are JSON encoded with orjson: embeddings are ~1k-float arrays and
+result payloads carry every hit's snippet, so stdlib ``json`` dominated the
+cost of a cache hit.
+
+The client is synchronous; async callers go through ``asyncio.to_thread`` so
+a slow Redis round-trip never stalls the event loop.
 """
 
 import hashlib
-import json
 import logging
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 import redis as _redis
 
 from app.core.redis_url import safe_redis_url
@@ -23,6 +30,14 @@ RESULT_TTL = 60       # 1 minute
 
 _redis_client: _redis.Redis | None = None
 
+# numpy scores and non-str dict keys show up in search results; anything else
+# orjson can't encode falls back to str() as the stdlib encoder did.
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=str, option=_ORJSON_OPTS)
+
 
 def close_redis_client() -> None:
     """Close the module-level Redis client singleton (lifespan shutdown)."""
@@ -91,7 +106,7 @@ class SearchCache:
             raw = redis.get(cls._embedding_key(query))
             if raw:
                 _record_cache_metric("search_embedding", hit=True)
-                return json.loads(raw)
+                return orjson.loads(raw)
         except Exception as exc:
             logger.debug("search_cache get_embedding error: %s", exc)
         _record_cache_metric("search_embedding", hit=False)
@@ -104,7 +119,7 @@ class SearchCache:
         if not redis:
             return
         try:
-            redis.setex(cls._embedding_key(query), EMBEDDING_TTL, json.dumps(embedding))
+            redis.setex(cls._embedding_key(query), EMBEDDING_TTL, _dumps(embedding))
         except Exception as exc:
             logger.debug("search_cache set_embedding error: %s", exc)
 
@@ -121,7 +136,7 @@ class SearchCache:
             raw = redis.get(cls._result_key(query, user_role, top_k, buckets_hash))
             if raw:
                 _record_cache_metric("search_result", hit=True)
-                return json.loads(raw)
+                return orjson.loads(raw)
         except Exception as exc:
             logger.debug("search_cache get_result error: %s", exc)
         _record_cache_metric("search_result", hit=False)
@@ -140,7 +155,7 @@ class SearchCache:
             redis.setex(
                 cls._result_key(query, user_role, top_k, buckets_hash),
                 RESULT_TTL,
-                json.dumps(result, default=str),
+                _dumps(result),
             )
         except Exception as exc:
             logger.debug("search_cache set_result error: %s", exc)
@@ -171,7 +186,7 @@ class SearchCache:
             raw = redis.get(cls._collection_intent_key(query))
             if raw:
                 _record_cache_metric("collection_intent", hit=True)
-                return json.loads(raw)
+                return orjson.loads(raw)
         except Exception as exc:
             logger.debug("search_cache get_collection_intent error: %s", exc)
         _record_cache_metric("collection_intent", hit=False)
@@ -187,7 +202,7 @@ class SearchCache:
             redis.setex(
                 cls._collection_intent_key(query),
                 cls.INTENT_TTL,
-                json.dumps(intent_data, default=str),
+                _dumps(intent_data),
             )
         except Exception as exc:
             logger.debug("search_cache set_collection_intent error: %s", exc)
@@ -202,7 +217,7 @@ class SearchCache:
             raw = redis.get(cls._collection_gather_key(query, user_role))
             if raw:
                 _record_cache_metric("collection_gather", hit=True)
-                return json.loads(raw)
+                return orjson.loads(raw)
         except Exception as exc:
             logger.debug("search_cache get_collection_gather error: %s", exc)
         _record_cache_metric("collection_gather", hit=False)
@@ -218,7 +233,7 @@ class SearchCache:
             redis.setex(
                 cls._collection_gather_key(query, user_role),
                 cls.GATHER_TTL,
-                json.dumps(results, default=str),
+                _dumps(results),
             )
         except Exception as exc:
             logger.debug("search_cache set_collection_gather error: %s", exc)
@@ -19,6 +19,12 @@ from app.services.search_cache import SearchCache
 
 logger = logging.getLogger(__name__)
 
+# Chunks fetched from the halfvec HNSW index before the exact FP32 re-rank.
+# Matches hnsw.ef_search (migration 024). With iterative scans (migration
+# 044) the index keeps going past ef_search until this many chunks survive
+# the bucket filter, so public-only users still get a full candidate set.
+ANN_RERANK_CANDIDATES = 100
+
 
 class SearchResult:
     """Container for search results with relevance scores"""
@@ -165,20 +171,31 @@ class HybridSearchService:
         logger.info("semantic_search CONTINUING query=%s", query)
 
         # Generate query embedding (with cache)
-        cached_embedding = SearchCache.get_embedding(query)
+        cached_embedding = await asyncio.to_thread(SearchCache.get_embedding, query)
         if cached_embedding is not None:
             query_embedding = cached_embedding
         else:
             query_embedding = embedding_service.encode_query(query)
-            SearchCache.set_embedding(query, query_embedding)
+            await asyncio.to_thread(SearchCache.set_embedding, query, query_embedding)
         embedding_array = "[" + ",".join(map(str, query_embedding)) + "]"
 
         # Get user bucket filter
         bucket_filter = self._get_user_bucket_filter(user) if user else [DocumentBucket.PUBLIC.value]
 
-        # Build SQL query for vector similarity using pgvector's cosine distance operator
-        # Uses embedding_vector column for pgvector operations
+        # Two-stage vector search with pgvector's cosine distance operator:
+        # the HNSW index is built over a half-precision copy of
+        # embedding_vector (migration 043), so candidates are found by
+        # halfvec distance, then re-ranked by exact FP32 distance.
         sql_query = text("""
+            WITH candidates AS MATERIALIZED (
+                SELECT dc.id, dc.embedding_vector
+                FROM document_chunks dc
+                JOIN documents d ON dc.document_id = d.id
+                WHERE d.bucket::text = ANY(:buckets)
+                AND dc.embedding_vector IS NOT NULL
+                ORDER BY dc.embedding_vector::halfvec(1024) <=> CAST(:embedding AS halfvec(1024))
+                LIMIT :candidates
+            )
             SELECT
                 dc.id as chunk_id,
                 dc.document_id,
@@ -187,12 +204,11 @@ class HybridSearchService:
                 dc.chunk_text,
                 dc.chunk_index,
                 dc.page_number,
-                1 - (dc.embedding_vector <=> CAST(:embedding AS vector)) as similarity
-            FROM document_chunks dc
+                1 - (c.embedding_vector <=> CAST(:embedding AS vector)) as similarity
+            FROM candidates c
+            JOIN document_chunks dc ON dc.id = c.id
             JOIN documents d ON dc.document_id = d.id
-            WHERE d.bucket::text = ANY(:buckets)
-            AND dc.embedding_vector IS NOT NULL
-            ORDER BY dc.embedding_vector <=> CAST(:embedding AS vector)
+            ORDER BY c.embedding_vector <=> CAST(:embedding AS vector)
             LIMIT :limit OFFSET :offset
         """)
 
@@ -201,6 +217,7 @@ class HybridSearchService:
             {
                 "embedding": embedding_array,
                 "buckets": bucket_filter,
+                "candidates": max(limit + offset, ANN_RERANK_CANDIDATES),
                 "limit": limit,
                 "offset": offset,
             },
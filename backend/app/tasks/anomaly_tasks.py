@@ -32,9 +32,9 @@ def daily_anomaly_report() -> dict:
     from app.database import SessionLocal
     from app.services.cache_monitor import cache_monitor
     from app.services.monitoring import (
-        SystemMonitor,
         get_cost_tracker,
         get_queue_monitor,
+        get_system_monitor,
     )
 
     report_time = datetime.now()
@@ -165,7 +165,7 @@ def daily_anomaly_report() -> dict:
 
     # 4. Check system resources
     try:
-        system_monitor = SystemMonitor()
+        system_monitor = get_system_monitor()
         mem_stats = system_monitor.get_memory_usage()
 
         if mem_stats["percent"] > 80:
@@ -310,9 +310,9 @@ def system_health_check() -> dict:
 
     from app.services.cache_monitor import cache_monitor
     from app.services.monitoring import (
-        SystemMonitor,
         get_alert_manager,
         get_queue_monitor,
+        get_system_monitor,
     )
 
     health_status = {
@@ -387,7 +387,7 @@ def system_health_check() -> dict:
 
         # Check system resources
         try:
-            system_monitor = SystemMonitor()
+            system_monitor = get_system_monitor()
             mem_stats = system_monitor.get_memory_usage()
             disk_stats = system_monitor.get_disk_usage()
 
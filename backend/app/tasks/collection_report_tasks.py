@@ -66,12 +66,7 @@ def generate_collection_report_task(
             if not user:
                 raise ValueError(f"User {user_id} not found")
 
-            format_map = {
-                "short": ReportFormatService.SHORT,
-                "standard": ReportFormatService.STANDARD,
-                "comprehensive": ReportFormatService.COMPREHENSIVE,
-            }
-            fmt = format_map.get(report_format, ReportFormatService.STANDARD)
+            fmt = report_format if report_format in ReportFormatService.ALL else ReportFormatService.STANDARD
 
             result = await report_service.generate_report(
                 collection_id=UUID(collection_id),
@@ -84,8 +79,6 @@ def generate_collection_report_task(
 
             # Audit log: confidential document access
             if result.get("has_confidential"):
-                import json
-
                 from app.models.audit import AuditAction, AuditLog
 
                 audit_entry = AuditLog(
@@ -93,14 +86,12 @@ def generate_collection_report_task(
                     action=AuditAction.CONFIDENTIAL_ACCESSED,
                     resource_type="report",
                     resource_id=collection_id,
-                    details=json.dumps(
-                        {
-                            "format": report_format,
-                            "language": language,
-                            "action": "generate_report",
-                            "has_confidential": True,
-                        }
-                    ),
+                    details={
+                        "format": report_format,
+                        "language": language,
+                        "action": "generate_report",
+                        "has_confidential": True,
+                    },
                 )
                 db.add(audit_entry)
                 await db.commit()
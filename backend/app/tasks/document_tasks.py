@@ -298,15 +298,19 @@ def process_document(self, document_id: str, task_type: str = "full_pipeline") -
                 from app.models.document import DocumentChunk
 
                 try:
-                    for chunk_data in chunks:
-                        chunk = DocumentChunk(
-                            document_id=document.id,
-                            chunk_index=chunk_data["index"],
-                            chunk_text=chunk_data["text"],
-                            token_count=chunk_data["token_count"],
-                            search_language=detected_language,
-                        )
-                        db.add(chunk)
+                    DocumentChunk.bulk_insert(
+                        db,
+                        (
+                            {
+                                "document_id": document.id,
+                                "chunk_index": chunk_data["index"],
+                                "chunk_text": chunk_data["text"],
+                                "token_count": chunk_data["token_count"],
+                                "search_language": detected_language,
+                            }
+                            for chunk_data in chunks
+                        ),
+                    )
 
                     document.chunk_count = len(chunks)
                     document.pipeline_stage = "chunked"
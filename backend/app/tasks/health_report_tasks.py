@@ -61,10 +61,11 @@ def daily_health_report() -> dict:
         day_ago = now - timedelta(hours=24)
 
         # ── Document counts ──
-        doc_counts = {}
-        for status in DocumentStatus:
-            cnt = db.query(func.count(Document.id)).filter(Document.status == status).scalar()
-            doc_counts[status.value] = cnt or 0
+        doc_counts = {status.value: 0 for status in DocumentStatus}
+        for status, cnt in db.execute(
+            select(Document.status, func.count()).group_by(Document.status)
+        ):
+            doc_counts[status.value] = cnt
 
         total_docs = sum(doc_counts.values())
 
@@ -126,11 +127,7 @@ def daily_health_report() -> dict:
             ]}
 
         # ── Failed doc count (permanent) ──
-        permanent_failed = (
-            db.query(func.count(Document.id))
-            .filter(Document.status == DocumentStatus.ERROR)
-            .scalar()
-        )
+        permanent_failed = doc_counts[DocumentStatus.ERROR.value]
 
         # ── Build text report ──
         text_lines = [
@@ -14,7 +14,7 @@ from app.services.task_service import task_service
 logger = logging.getLogger(__name__)
 
 
-@celery_app.task(name="app.tasks.task_alarm_tasks.check_task_alarms")
+@celery_app.task(name="app.tasks.task_alarm_tasks.check_task_alarms", ignore_result=True)
 def check_task_alarms() -> dict:
     """Check for tasks with pending alarms and send push notifications."""
     db = SessionLocal()
@@ -37,3 +37,17 @@ COOKIE_REFRESH_TOKEN_NAME = _prefixed_cookie_name("refresh_token", host_prefix=F
 # CSRF double-submit cookie is not an auth token, but uses the same host-prefix
 # rules in production (Path=/, Secure, no Domain).
 CSRF_COOKIE_NAME = _prefixed_cookie_name("csrf_token", host_prefix=True)
+
+# Unauthenticated probe/scrape endpoints (liveness checks, Prometheus, status
+# pollers). They dominate request volume and never use the request-scoped DB
+# session or RLS identity, so those middlewares pass them straight through.
+PROBE_PATHS = frozenset(
+    {
+        "/health",
+        "/metrics",
+        "/api/v1/health",
+        "/api/v1/health/detailed",
+        "/api/v1/metrics",
+        "/api/v1/status",
+    }
+)
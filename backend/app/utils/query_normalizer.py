@@ -7,10 +7,15 @@ queries that differ only in case, whitespace, punctuation, or diacritics.
 
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
 
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"[^\w\s'-]")
 
+
+@functools.lru_cache(maxsize=4096)
 def normalise_query(q: str | None) -> str:
     """Return a canonical form of a query suitable for cache-key generation.
 
@@ -28,6 +33,8 @@ def normalise_query(q: str | None) -> str:
 
     Returns:
         Normalised query string.  ``None`` is treated as empty string.
+
+    Memoised: one search derives several cache keys from the same query.
     """
     if not q:
         return ""
@@ -37,16 +44,18 @@ def normalise_query(q: str | None) -> str:
     text = text.lower().strip()
 
     # Collapse whitespace (including non-breaking spaces).
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE.sub(" ", text)
 
-    # Remove zero-width and control characters.
-    text = "".join(ch for ch in text if unicodedata.category(ch)[0] != "C")
+    # Remove zero-width and control characters. After the collapse above,
+    # isprintable() is only False when such characters are present.
+    if not text.isprintable():
+        text = "".join(ch for ch in text if unicodedata.category(ch)[0] != "C")
 
     # Strip punctuation except apostrophes and hyphens inside words.
-    text = re.sub(r"[^\w\s'-]", "", text)
+    text = _PUNCTUATION.sub("", text)
 
     # Collapse whitespace again after punctuation removal.
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE.sub(" ", text).strip()
 
     return text
 
@@ -4,18 +4,18 @@ from datetime import datetime, timedelta
 from typing import Any
 
 import bcrypt as _bcrypt
-from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import ExpiredSignatureError, JWTError, jwt
 from sqlalchemy import select
 from sqlalchemy.orm import Session  # noqa: F401 — kept for type-compat in non-async callers
 
+from app.core.env import load_env_once
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.services.token_blacklist import is_token_blacklisted
 
-load_dotenv()
+load_env_once()
 
 logger = logging.getLogger(__name__)
 
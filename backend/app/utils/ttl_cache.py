@@ -0,0 +1,81 @@
+"""
+Short-TTL in-process cache for expensive async probes.
+
+Health and monitoring endpoints are polled by nginx, Docker healthchecks,
+Prometheus and the frontend. Caching each probe for a few seconds keeps
+that traffic from fanning out to Postgres/Redis/upstream APIs on every hit.
+
+- Single-flight: concurrent misses for the same key share one in-flight call.
+- Stale-on-error: if a refresh raises, the last good value is served and
+  ``is_stale(key)`` reports it until the next successful refresh. Pass
+  ``max_stale`` to stop doing so once the value has been expired that long;
+  the refresh error then propagates.
+
+Usage:
+    from app.utils.ttl_cache import AsyncTTLCache
+
+    _cache = AsyncTTLCache()
+
+    async def redis_info() -> dict:
+        return await _cache.get_or_set("redis_info", 5, _fetch_redis_info)
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTTLCache:
+    """Per-key TTL cache with single-flight refresh and stale-on-error fallback."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._stale: set[str] = set()
+
+    async def get_or_set(
+        self,
+        key: str,
+        ttl: float,
+        factory: Callable[[], Awaitable[Any]],
+        max_stale: float | None = None,
+    ) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed while we waited on the lock.
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            try:
+                value = await factory()
+            except Exception:
+                if entry is None or (max_stale is not None and time.monotonic() >= entry[0] + max_stale):
+                    self._stale.discard(key)
+                    raise
+                logger.warning("Refresh of %r failed; serving stale value", key, exc_info=True)
+                self._stale.add(key)
+                return entry[1]
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._stale.discard(key)
+            return value
+
+    def is_stale(self, key: str) -> bool:
+        """True if the last ``get_or_set`` for *key* fell back to a stale value."""
+        return key in self._stale
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._stale.discard(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._locks.clear()
+        self._stale.clear()
@@ -6,5 +6,11 @@ if [ -d /app/backups ]; then
     chmod -R 777 /app/backups 2>/dev/null || true
 fi
 
+# Apply schema migrations once per container start when requested.
+# The API lifespan no longer runs create_all in production (RUN_DDL=0).
+if [ "${RUN_MIGRATIONS:-0}" = "1" ]; then
+    alembic upgrade head
+fi
+
 # Execute main command
 exec "$@"
@@ -271,6 +271,12 @@ class _AsyncSessionWrapper:
         return self._sync.bind
 
 
+@pytest.fixture
+def async_db(db: Session) -> _AsyncSessionWrapper:
+    """The test session behind the AsyncSession API, for calling endpoints directly."""
+    return _AsyncSessionWrapper(db)
+
+
 @pytest.fixture
 def client(db: Session) -> Generator:
     """Create a test client with database override"""
@@ -308,7 +308,7 @@ class TestE2EConfidentialCollectionExportAudit:
             .first()
         )
         assert audit_entry is not None, "Audit log entry not found for confidential export"
-        details = json.loads(audit_entry.details)
+        details = audit_entry.details
         assert details["format"] == "pdf"
         assert details["confidential_document_count"] == 1
         assert details["action"] == "export_collection"
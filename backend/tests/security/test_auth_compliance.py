@@ -349,7 +349,7 @@ class TestSecurityConfigurationCompliance:
 
         cors_configured = False
         for middleware in app.user_middleware:
-            if hasattr(middleware, 'cls') and middleware.cls == CORSMiddleware:
+            if hasattr(middleware, 'cls') and issubclass(middleware.cls, CORSMiddleware):
                 cors_configured = True
                 break
 
@@ -337,7 +337,7 @@ class TestAuditLogging:
             action=AuditAction.CONFIDENTIAL_ACCESSED,
             resource_type="document",
             resource_id=str(doc.id),
-            details='{"bucket": "confidential", "action": "view"}'
+            details={"bucket": "confidential", "action": "view"}
         )
         db.add(audit_entry)
         db.commit()
@@ -0,0 +1,98 @@
+"""Unit tests for the aggregate counts behind the admin stats endpoints."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api import admin
+from app.models.document import Document, DocumentBucket, DocumentStatus
+
+
+def _doc(name: str, bucket: DocumentBucket, status: DocumentStatus, created_at: datetime | None = None) -> Document:
+    return Document(
+        filename=name,
+        original_filename=name,
+        file_path=f"/data/{bucket.value}/{name}",
+        bucket=bucket,
+        status=status,
+        size=1,
+        mime_type="application/pdf",
+        created_at=created_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_document_counts_per_bucket_status_and_day(db, async_db):
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    db.add_all(
+        [
+            _doc("a.pdf", DocumentBucket.PUBLIC, DocumentStatus.INDEXED),
+            _doc("b.pdf", DocumentBucket.PUBLIC, DocumentStatus.ERROR, created_at=yesterday),
+            _doc("c.pdf", DocumentBucket.CONFIDENTIAL, DocumentStatus.PROCESSING),
+            _doc("d.pdf", DocumentBucket.CONFIDENTIAL, DocumentStatus.INDEXED, created_at=yesterday),
+        ]
+    )
+    db.commit()
+
+    stats = (await admin.get_system_stats(current_user=None, db=async_db)).model_dump()
+
+    assert stats["total_documents"] == 4
+    assert stats["public_documents"] == 2
+    assert stats["confidential_documents"] == 2
+    assert stats["indexed_documents"] == 2
+    assert stats["processing_documents"] == 1
+    assert stats["error_documents"] == 1
+    assert stats["uploads_today"] == 2
+
+
+@pytest.mark.asyncio
+async def test_extended_stats_user_and_audit_counts(db, async_db):
+    from app.models.audit import AuditAction, AuditLog
+    from app.models.user import User, UserRole
+
+    db.add_all(
+        [
+            User(email="a@x.io", hashed_password="x", role=UserRole.ADMIN, can_access_confidential=True),
+            User(email="s@x.io", hashed_password="x", role=UserRole.SUPERUSER),
+            User(email="u@x.io", hashed_password="x", role=UserRole.USER, is_active=False),
+        ]
+    )
+    db.add(AuditLog(action=AuditAction.SYSTEM_ACTION, resource_type="test"))
+    db.commit()
+
+    stats = await admin.get_extended_admin_stats(current_user=None, db=async_db)
+
+    assert (stats.total_users, stats.active_users) == (3, 2)
+    assert (stats.admin_count, stats.superuser_count, stats.regular_user_count) == (1, 1, 1)
+    assert stats.confidential_access_users == 1
+    assert (stats.total_audit_logs, stats.recent_admin_actions) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_queue_stats_counts_and_average_wait(db, async_db):
+    from app.models.processing import ProcessingQueue, TaskStatus, TaskType
+
+    doc = _doc("q.pdf", DocumentBucket.PUBLIC, DocumentStatus.PROCESSING)
+    db.add(doc)
+    db.flush()
+    now = datetime.utcnow()
+    for status, age in [
+        (TaskStatus.PENDING, 10),
+        (TaskStatus.PENDING, 20),
+        (TaskStatus.IN_PROGRESS, 0),
+        (TaskStatus.COMPLETED, 0),
+        (TaskStatus.FAILED, 0),
+    ]:
+        db.add(
+            ProcessingQueue(
+                document_id=doc.id,
+                task_type=TaskType.CHUNKING,
+                status=status,
+                created_at=now - timedelta(minutes=age),
+            )
+        )
+    db.commit()
+
+    stats = await admin.get_queue_stats(current_user=None, db=async_db)
+
+    assert (stats.pending_tasks, stats.in_progress_tasks, stats.completed_tasks, stats.failed_tasks) == (2, 1, 1, 1)
+    assert 14.9 < stats.average_wait_time < 15.5
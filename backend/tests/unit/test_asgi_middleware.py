@@ -0,0 +1,173 @@
+"""
+Unit tests for the pure-ASGI middleware stack (request ID, CSRF, RLS context,
+request-scoped transaction).
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.core.context import current_user_id
+from app.main import RequestIDMiddleware, StaticResponseMiddleware
+from app.middleware import transaction
+from app.middleware.csrf import CSRFMiddleware
+from app.middleware.rls import RLSContext, RLSContextMiddleware
+from app.middleware.transaction import TransactionMiddleware
+from app.utils.constants import CSRF_COOKIE_NAME
+
+
+def _app(*middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok(request: Request):
+        return {"request_id": getattr(request.state, "request_id", None)}
+
+    @app.post("/write")
+    async def write():
+        return {"written": True}
+
+    @app.post("/fail")
+    async def fail():
+        raise HTTPException(status_code=409, detail="conflict")
+
+    for mw in middleware:
+        app.add_middleware(mw)
+    return app
+
+
+class TestRequestIDMiddleware:
+    def test_generates_and_echoes_request_id(self):
+        client = TestClient(_app(RequestIDMiddleware))
+        resp = client.get("/ok")
+        assert resp.headers["X-Request-ID"] == resp.json()["request_id"]
+
+        resp = client.get("/ok", headers={"X-Request-ID": "abc-123"})
+        assert resp.headers["X-Request-ID"] == "abc-123"
+
+
+class TestCSRFMiddleware:
+    def test_safe_method_passes(self):
+        assert TestClient(_app(CSRFMiddleware)).get("/ok").status_code == 200
+
+    def test_missing_token_rejected(self):
+        resp = TestClient(_app(CSRFMiddleware)).post("/write")
+        assert resp.status_code == 403
+        assert resp.json() == {"detail": "CSRF token missing"}
+
+    def test_mismatched_token_rejected(self):
+        client = TestClient(_app(CSRFMiddleware), cookies={CSRF_COOKIE_NAME: "a"})
+        resp = client.post("/write", headers={"X-CSRF-Token": "b"})
+        assert resp.json() == {"detail": "CSRF token invalid"}
+
+    def test_matching_token_and_bearer_pass(self):
+        client = TestClient(_app(CSRFMiddleware), cookies={CSRF_COOKIE_NAME: "tok"})
+        assert client.post("/write", headers={"X-CSRF-Token": "tok"}).status_code == 200
+        bearer = TestClient(_app(CSRFMiddleware))
+        assert bearer.post("/write", headers={"Authorization": "Bearer x"}).status_code == 200
+
+
+class TestRLSContextMiddleware:
+    def test_context_and_contextvar_visible_to_handler(self):
+        app = FastAPI()
+
+        @app.get("/who")
+        async def who(request: Request):
+            return {"ip": request.state.rls_context.client_ip, "user": current_user_id.get()}
+
+        app.add_middleware(RLSContextMiddleware)
+        ctx = RLSContext(user_id="u-9", user_role="user", client_ip="1.2.3.4")
+        with patch("app.middleware.rls.extract_rls_context", return_value=ctx):
+            body = TestClient(app).get("/who").json()
+
+        assert body == {"ip": "1.2.3.4", "user": "u-9"}
+        assert current_user_id.get() is None
+
+    def test_probe_paths_skip_context_extraction(self):
+        app = FastAPI()
+
+        @app.get("/api/v1/health")
+        async def health():
+            return {"ok": True}
+
+        app.add_middleware(RLSContextMiddleware)
+        with patch("app.middleware.rls.extract_rls_context") as extract:
+            assert TestClient(app).get("/api/v1/health").status_code == 200
+        extract.assert_not_called()
+
+
+class TestTransactionMiddleware:
+    def _session_factory(self):
+        session = MagicMock(commit=AsyncMock(), rollback=AsyncMock())
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        return factory, session
+
+    def test_commits_on_success(self):
+        factory, session = self._session_factory()
+        with patch.object(transaction, "AsyncSessionLocal", factory):
+            assert TestClient(_app(TransactionMiddleware)).post("/write").status_code == 200
+        session.commit.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+
+    def test_rolls_back_on_error_status(self):
+        factory, session = self._session_factory()
+        with patch.object(transaction, "AsyncSessionLocal", factory):
+            assert TestClient(_app(TransactionMiddleware)).post("/fail").status_code == 409
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    def test_probe_paths_open_no_session(self):
+        app = FastAPI()
+
+        @app.get("/metrics")
+        async def metrics():
+            return {}
+
+        app.add_middleware(TransactionMiddleware)
+        factory, _ = self._session_factory()
+        with patch.object(transaction, "AsyncSessionLocal", factory):
+            assert TestClient(app).get("/metrics").status_code == 200
+        factory.assert_not_called()
+
+
+class TestStaticResponseMiddleware:
+    def _client(self):
+        app = FastAPI()
+
+        @app.get("/")
+        async def root():
+            raise AssertionError("router should not be reached")
+
+        app.add_middleware(StaticResponseMiddleware, responses={"/": b'{"status":"ok"}'})
+        app.add_middleware(RequestIDMiddleware)
+        return TestClient(app)
+
+    def test_serves_precomputed_body_without_routing(self):
+        resp = self._client().get("/")
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "ok"}
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.headers["content-length"] == str(len(b'{"status":"ok"}'))
+
+    def test_outer_middleware_still_runs(self):
+        resp = self._client().get("/")
+        assert resp.headers.get("x-request-id")
+
+    def test_other_methods_fall_through(self):
+        resp = self._client().post("/")
+        assert resp.status_code == 405
+
+    def test_conditional_get_returns_304(self):
+        client = self._client()
+        etag = client.get("/").headers["etag"]
+        resp = client.get("/", headers={"if-none-match": f'"other", {etag}'})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    def test_stale_etag_gets_full_body(self):
+        resp = self._client().get("/", headers={"if-none-match": '"stale"'})
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "ok"}
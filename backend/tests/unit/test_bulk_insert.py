@@ -0,0 +1,48 @@
+"""
+Unit tests for BulkInsertMixin.bulk_insert.
+"""
+import uuid
+from unittest.mock import MagicMock
+
+from app.models.document import Document, DocumentBucket, DocumentChunk, DocumentStatus
+
+
+class TestBulkInsert:
+    def test_batches_lazily_and_counts_rows(self):
+        session = MagicMock()
+        rows = ({"document_id": uuid.uuid4(), "chunk_index": i, "chunk_text": "x"} for i in range(2500))
+
+        assert DocumentChunk.bulk_insert(session, rows, batch_size=1000) == 2500
+        assert [len(call.args[1]) for call in session.execute.call_args_list] == [1000, 1000, 500]
+
+    def test_empty_input_executes_nothing(self):
+        session = MagicMock()
+        assert DocumentChunk.bulk_insert(session, []) == 0
+        session.execute.assert_not_called()
+
+    def test_rows_persist_with_generated_ids(self, db):
+        doc = Document(
+            filename="a.txt",
+            original_filename="a.txt",
+            file_path="/tmp/a.txt",
+            size=1,
+            mime_type="text/plain",
+            bucket=DocumentBucket.PUBLIC,
+            status=DocumentStatus.PENDING,
+        )
+        db.add(doc)
+        db.flush()
+
+        DocumentChunk.bulk_insert(
+            db,
+            [
+                {"document_id": doc.id, "chunk_index": i, "chunk_text": f"c{i}", "document_metadata": {"i": i}}
+                for i in range(3)
+            ],
+        )
+        db.commit()
+
+        chunks = db.query(DocumentChunk).order_by(DocumentChunk.chunk_index).all()
+        assert [c.chunk_text for c in chunks] == ["c0", "c1", "c2"]
+        assert all(isinstance(c.id, uuid.UUID) for c in chunks)
+        assert chunks[2].document_metadata == {"i": 2}
@@ -0,0 +1,53 @@
+"""
+Unit tests for the orjson Celery serializer and zstd message compression.
+"""
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from kombu.compression import compress, decompress
+from kombu.serialization import dumps, loads
+
+from app.celery_app import celery_app
+
+
+class TestOrjsonSerializer:
+    def test_app_accepts_both_and_publishes_json_by_default(self):
+        conf = celery_app.conf
+        assert conf.task_serializer == "json"
+        assert conf.result_serializer == "json"
+        assert conf.task_compression is None
+        assert set(conf.accept_content) == {"orjson", "json"}
+        assert set(conf.result_accept_content) == {"orjson", "json"}
+
+    def _payload(self):
+        return {
+            "args": [uuid.uuid4(), "extracted text " * 100],
+            "kwargs": {"chunk_ids": [1, 2, 3], "cost": Decimal("0.25")},
+            "eta": datetime(2026, 1, 1, tzinfo=UTC),
+        }
+
+    def test_round_trip_keeps_argument_types(self):
+        payload = self._payload()
+        content_type, encoding, body = dumps(payload, serializer="orjson")
+
+        assert content_type == "application/x-orjson"
+        decoded = loads(body, content_type, encoding)
+        assert decoded == payload
+        assert isinstance(decoded["args"][0], uuid.UUID)
+        assert isinstance(decoded["eta"], datetime)
+
+    def test_wire_format_interchangeable_with_kombu_json(self):
+        payload = self._payload()
+        _, _, orjson_body = dumps(payload, serializer="orjson")
+        _, _, json_body = dumps(payload, serializer="json")
+
+        assert loads(orjson_body, "application/json", "utf-8") == payload
+        assert loads(json_body, "application/x-orjson", "utf-8") == payload
+
+    def test_zstd_compression_round_trip(self):
+        _, _, body = dumps({"text": "chunk " * 500}, serializer="orjson")
+        compressed, content_type = compress(body.encode(), "zstd")
+
+        assert len(compressed) < len(body)
+        assert decompress(compressed, content_type).decode() == body
@@ -0,0 +1,70 @@
+"""Unit tests for keyset paging of chat session messages."""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import chat
+from app.models.chat import ChatMessage, ChatSession, MessageRole
+from app.models.user import User, UserRole
+
+
+@pytest.fixture
+def session_with_messages(db):
+    user = User(email="pager@x.io", hashed_password="x", role=UserRole.USER)
+    db.add(user)
+    db.flush()
+    session = ChatSession(user_id=user.id, title="paging")
+    db.add(session)
+    db.flush()
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    # Two messages share a timestamp so the id tie-break is exercised.
+    for i, offset in enumerate([0, 1, 1, 2, 3]):
+        db.add(
+            ChatMessage(
+                session_id=session.id,
+                role=MessageRole.USER,
+                content=f"m{i}",
+                created_at=start + timedelta(seconds=offset),
+            )
+        )
+    db.commit()
+    return user, session
+
+
+async def _page(async_db, user, session, **kwargs):
+    return await chat.get_session_messages(session.id, current_user=user, db=async_db, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_cursor_walks_every_message_once(async_db, session_with_messages):
+    user, session = session_with_messages
+    expected = [m.id for m in (await _page(async_db, user, session, limit=10)).messages]
+
+    seen, cursor = [], None
+    while True:
+        page = await _page(async_db, user, session, limit=2, cursor=cursor)
+        seen.extend(m.id for m in page.messages)
+        assert page.total == 5
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert seen == expected
+    assert len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_offset_paging_still_supported(async_db, session_with_messages):
+    user, session = session_with_messages
+    page = await _page(async_db, user, session, limit=2, offset=4)
+    assert [m.content for m in page.messages] == ["m4"]
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_rejected(async_db, session_with_messages):
+    user, session = session_with_messages
+    with pytest.raises(HTTPException) as exc:
+        await _page(async_db, user, session, cursor="not-a-cursor")
+    assert exc.value.status_code == 400
@@ -0,0 +1,21 @@
+"""Unit tests for chat request schemas."""
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.chat import ChatSessionCreate
+
+
+class TestChatSessionCreate:
+    def test_document_scope_is_deduplicated_in_order(self):
+        a, b = uuid4(), uuid4()
+        session = ChatSessionCreate(title="t", document_scope=[a, b, a, str(b)])
+        assert session.document_scope == [a, b]
+
+    def test_document_scope_is_bounded(self):
+        with pytest.raises(ValidationError):
+            ChatSessionCreate(title="t", document_scope=[uuid4() for _ in range(501)])
+
+    def test_document_scope_defaults_to_none(self):
+        assert ChatSessionCreate(title="t").document_scope is None
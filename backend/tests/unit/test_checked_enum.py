@@ -0,0 +1,35 @@
+"""
+Unit tests for checked_enum (VARCHAR + CHECK enum columns).
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateTable
+
+from app.models.knowledge_graph import Entity, EntityType
+
+
+class TestCheckedEnum:
+    def test_ddl_is_varchar_with_named_check(self):
+        ddl = str(CreateTable(Entity.__table__).compile(dialect=postgresql.dialect()))
+        assert "entity_type VARCHAR(32) NOT NULL" in ddl
+        assert "CONSTRAINT ck_entities_entity_type CHECK (entity_type IN ('person'" in ddl
+        assert "CREATE TYPE" not in ddl
+
+    def test_round_trips_enum_members(self, db):
+        db.add(Entity(name="Acme", entity_type=EntityType.ORGANIZATION))
+        db.commit()
+
+        assert db.execute(text("SELECT entity_type FROM entities")).scalar_one() == "organization"
+        assert db.query(Entity).one().entity_type is EntityType.ORGANIZATION
+
+    def test_check_rejects_unknown_values(self, db):
+        with pytest.raises(IntegrityError):
+            db.execute(
+                text(
+                    "INSERT INTO entities (id, name, entity_type, created_at, updated_at) "
+                    "VALUES ('00000000-0000-0000-0000-000000000001', 'x', 'spaceship', "
+                    "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                )
+            )
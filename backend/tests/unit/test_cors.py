@@ -0,0 +1,112 @@
+"""
+Unit tests for FastCORSMiddleware (pre-encoded CORS headers), checked against
+Starlette's CORSMiddleware behaviour.
+"""
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+
+from app.middleware.cors import FastCORSMiddleware
+
+ORIGIN = "https://sowknow.example.com"
+CONFIG = {
+    "allow_origins": frozenset({ORIGIN}),
+    "allow_credentials": True,
+    "allow_methods": ["GET", "POST"],
+    "allow_headers": ["Authorization", "Content-Type"],
+    "expose_headers": ["X-Total-Count"],
+    "max_age": 86400,
+}
+
+
+def _client(cls=FastCORSMiddleware, **overrides) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return [1, 2]
+
+    app.add_middleware(cls, **{**CONFIG, **overrides})
+    return TestClient(app)
+
+
+def _cors_headers(resp) -> dict:
+    return {k: v for k, v in resp.headers.items() if k.startswith("access-control-") or k == "vary"}
+
+
+class TestPreflight:
+    def _preflight(self, client, origin=ORIGIN, method="POST", headers="authorization, content-type"):
+        return client.options(
+            "/items",
+            headers={
+                "origin": origin,
+                "access-control-request-method": method,
+                "access-control-request-headers": headers,
+            },
+        )
+
+    def test_allowed_preflight_matches_starlette(self):
+        fast = self._preflight(_client())
+        ref = self._preflight(_client(CORSMiddleware))
+        assert fast.status_code == ref.status_code == 200
+        assert fast.text == ref.text == "OK"
+        assert _cors_headers(fast) == _cors_headers(ref)
+        assert fast.headers["access-control-allow-origin"] == ORIGIN
+        assert fast.headers["access-control-max-age"] == "86400"
+
+    def test_disallowed_preflight_matches_starlette(self):
+        kwargs = {"origin": "https://evil.test", "method": "PURGE", "headers": "x-evil"}
+        fast = self._preflight(_client(), **kwargs)
+        ref = self._preflight(_client(CORSMiddleware), **kwargs)
+        assert fast.status_code == ref.status_code == 400
+        assert fast.text == ref.text == "Disallowed CORS origin, method, headers"
+        assert "access-control-allow-origin" not in fast.headers
+
+    def test_wildcard_headers_are_mirrored(self):
+        resp = self._preflight(_client(allow_headers=["*"]), headers="x-anything")
+        assert resp.status_code == 200
+        assert resp.headers["access-control-allow-headers"] == "x-anything"
+
+
+class TestSimpleResponse:
+    def test_allowed_origin_gets_cors_headers(self):
+        fast = _client().get("/items", headers={"origin": ORIGIN})
+        ref = _client(CORSMiddleware).get("/items", headers={"origin": ORIGIN})
+        assert fast.json() == [1, 2]
+        assert _cors_headers(fast) == _cors_headers(ref)
+        assert fast.headers["access-control-expose-headers"] == "X-Total-Count"
+
+    def test_unknown_origin_is_not_echoed(self):
+        resp = _client().get("/items", headers={"origin": "https://evil.test"})
+        assert "access-control-allow-origin" not in resp.headers
+
+    def test_no_origin_passes_through(self):
+        resp = _client().get("/items")
+        assert resp.status_code == 200
+        assert "access-control-allow-credentials" not in resp.headers
+
+    def test_existing_vary_header_is_extended(self):
+        app = FastAPI()
+
+        @app.get("/encoded")
+        async def encoded():
+            return Response(b"x", headers={"Vary": "Accept-Encoding"})
+
+        app.add_middleware(FastCORSMiddleware, **CONFIG)
+        resp = TestClient(app).get("/encoded", headers={"origin": ORIGIN})
+        assert resp.headers["vary"] == "Accept-Encoding, Origin"
+
+    def test_request_without_origin_skips_header_parsing(self):
+        with patch("app.middleware.cors.Headers") as headers_cls:
+            resp = _client().get("/items")
+        assert resp.status_code == 200
+        headers_cls.assert_not_called()
+
+    def test_list_origins_and_regex_are_honoured(self):
+        client = _client(allow_origins=[ORIGIN], allow_origin_regex=r"https://.*\.preview\.test")
+        assert client.get("/items", headers={"origin": ORIGIN}).headers["access-control-allow-origin"] == ORIGIN
+        preview = "https://pr-1.preview.test"
+        assert client.get("/items", headers={"origin": preview}).headers["access-control-allow-origin"] == preview
@@ -0,0 +1,40 @@
+"""Unit tests for the startup create-missing-tables path."""
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, event, inspect
+
+from app.database import _create_missing_tables
+
+
+def _metadata() -> MetaData:
+    metadata = MetaData()
+    Table("present", metadata, Column("id", Integer, primary_key=True))
+    Table("absent", metadata, Column("id", Integer, primary_key=True))
+    return metadata
+
+
+def test_creates_only_missing_tables():
+    engine = create_engine("sqlite://")
+    metadata = _metadata()
+    metadata.tables["present"].create(engine)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    with engine.begin() as conn:
+        _create_missing_tables(conn, metadata)
+
+    assert set(inspect(engine).get_table_names()) == {"present", "absent"}
+    creates = [s for s in statements if s.lstrip().upper().startswith("CREATE TABLE")]
+    assert len(creates) == 1
+    assert "absent" in creates[0]
+
+
+def test_up_to_date_database_sends_no_ddl():
+    engine = create_engine("sqlite://")
+    metadata = _metadata()
+    metadata.create_all(engine)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    with engine.begin() as conn:
+        _create_missing_tables(conn, metadata)
+
+    assert not [s for s in statements if "CREATE" in s.upper()]
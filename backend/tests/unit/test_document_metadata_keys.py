@@ -0,0 +1,28 @@
+"""
+Unit tests for the indexed document metadata key expressions.
+"""
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.models.document import Document
+
+
+def _pg(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestMetadataKeyExpressions:
+    def test_filter_renders_literal_key_matching_index(self):
+        sql = _pg(select(Document.id).where(Document.metadata_sha256 == "abc"))
+        assert "documents.metadata ->> 'sha256_hash') = %(param_1)s" in sql
+
+        index = next(i for i in Document.__table__.indexes if i.name == "ix_documents_metadata_sha256")
+        assert "(metadata ->> 'sha256_hash')" in _pg(CreateIndex(index))
+
+    def test_document_type_filter(self):
+        sql = _pg(select(Document.id).where(Document.metadata_document_type == "journal"))
+        assert "documents.metadata ->> 'document_type') = %(param_1)s" in sql
+
+    def test_expressions_are_not_loaded_with_the_entity(self):
+        assert "->>" not in _pg(select(Document))
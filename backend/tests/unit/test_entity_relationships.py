@@ -0,0 +1,63 @@
+"""
+Unit tests for Entity relationship configuration (delete cascades, FK binding).
+"""
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from app.models.knowledge_graph import Entity, EntityRelationship, EntityType, RelationType
+
+
+class TestEntityDelete:
+    def test_delete_leaves_relationship_rows_to_db_cascade(self, db):
+        a = Entity(name="a", entity_type=EntityType.PERSON)
+        b = Entity(name="b", entity_type=EntityType.ORGANIZATION)
+        db.add_all([a, b])
+        db.flush()
+        db.add(EntityRelationship(source_id=a.id, target_id=b.id, relation_type=RelationType.WORKS_AT))
+        db.commit()
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(db.bind, "before_cursor_execute", listener)
+        try:
+            db.delete(a)
+            db.commit()
+        finally:
+            event.remove(db.bind, "before_cursor_execute", listener)
+
+        assert db.get(Entity, a.id) is None
+        assert not any("entity_relationships" in s for s in statements)
+
+    def test_relationship_sides_bind_distinct_foreign_keys(self):
+        assert Entity.source_relationships.property.local_remote_pairs[0][1].name == "source_id"
+        assert Entity.target_relationships.property.local_remote_pairs[0][1].name == "target_id"
+
+
+class TestGraphLoading:
+    def _seed(self, db):
+        a = Entity(name="a", entity_type=EntityType.PERSON)
+        b = Entity(name="b", entity_type=EntityType.ORGANIZATION)
+        db.add_all([a, b])
+        db.flush()
+        db.add(EntityRelationship(source_id=a.id, target_id=b.id, relation_type=RelationType.WORKS_AT))
+        db.commit()
+        db.expunge_all()
+
+    def test_lazy_access_raises_instead_of_querying(self, db):
+        self._seed(db)
+        entity = db.execute(select(Entity).where(Entity.name == "a")).scalar_one()
+
+        with pytest.raises(InvalidRequestError):
+            entity.source_relationships
+
+    def test_selectinload_loads_both_sides(self, db):
+        self._seed(db)
+        entity = db.execute(
+            select(Entity)
+            .where(Entity.name == "a")
+            .options(selectinload(Entity.source_relationships).selectinload(EntityRelationship.target_entity))
+        ).scalar_one()
+
+        assert [r.target_entity.name for r in entity.source_relationships] == ["b"]
@@ -0,0 +1,33 @@
+"""
+Unit tests for the GUID column type's per-dialect processors.
+"""
+import uuid
+
+from sqlalchemy import Column, MetaData, Table, create_engine, insert, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.models.base import GUID
+
+metadata = MetaData()
+things = Table("things", metadata, Column("id", GUID(as_uuid=True), primary_key=True))
+
+
+class TestGUID:
+    def test_sqlite_round_trip_from_uuid_and_string(self):
+        engine = create_engine("sqlite://")
+        metadata.create_all(engine)
+        a, b = uuid.uuid4(), uuid.uuid4()
+        with engine.begin() as conn:
+            conn.execute(insert(things), [{"id": a}, {"id": str(b).upper()}])
+            stored = set(conn.execute(text("SELECT id FROM things")).scalars())
+            loaded = set(conn.execute(select(things.c.id)).scalars())
+
+        assert stored == {str(a), str(b)}
+        assert loaded == {a, b}
+
+    def test_postgresql_uses_native_uuid_processors(self):
+        dialect = postgresql.dialect()
+        native = dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        guid = GUID(as_uuid=True)
+        assert (guid.bind_processor(dialect) is None) == (native.bind_processor(dialect) is None)
+        assert (guid.result_processor(dialect, None) is None) == (native.result_processor(dialect, None) is None)
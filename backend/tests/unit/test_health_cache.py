@@ -0,0 +1,234 @@
+"""
+Unit tests for the short-TTL cache in front of /api/v1/health and for
+running the health probes concurrently.
+"""
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api import health
+
+
+@pytest.fixture(autouse=True)
+def _reset_health_cache():
+    health._health_cache.clear()
+    yield
+    health._health_cache.clear()
+
+
+def _patch_checks():
+    return (
+        patch.object(health, "_check_database", new_callable=AsyncMock, return_value="ok"),
+        patch.object(health, "_check_redis", new_callable=AsyncMock, return_value="ok"),
+        patch.object(health, "_check_vault", new_callable=AsyncMock, return_value="disabled"),
+        patch.object(health, "_check_nats", new_callable=AsyncMock, return_value="ok"),
+    )
+
+
+class TestHealthCache:
+    @pytest.mark.asyncio
+    async def test_repeated_calls_within_ttl_probe_once(self):
+        db, redis_, vault, nats = _patch_checks()
+        with db as db_mock, redis_, vault, nats:
+            first = await health.comprehensive_health()
+            second = await health.comprehensive_health()
+
+        assert db_mock.await_count == 1
+        assert first.body == second.body
+        assert json.loads(first.body)["status"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_probe(self):
+        db, redis_, vault, nats = _patch_checks()
+        with db as db_mock, redis_, vault, nats:
+            responses = await asyncio.gather(*(health.comprehensive_health() for _ in range(10)))
+
+        assert db_mock.await_count == 1
+        assert all(r.status_code == 200 for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refreshed(self):
+        db, redis_, vault, nats = _patch_checks()
+        with db as db_mock, redis_, vault, nats, patch.object(health, "_HEALTH_CACHE_TTL", 0):
+            await health.comprehensive_health()
+            await health.comprehensive_health()
+
+        assert db_mock.await_count == 2
+
+
+class TestProbeConcurrency:
+    @pytest.mark.asyncio
+    async def test_blocking_redis_ping_does_not_serialize_probes(self):
+        async def slow_db():
+            await asyncio.sleep(0.2)
+            return "ok"
+
+        db = patch.object(health, "_check_database", side_effect=slow_db)
+        ping = patch.object(health, "_redis_ping", side_effect=lambda: time.sleep(0.2))
+        vault = patch.object(health, "_check_vault", new_callable=AsyncMock, return_value="disabled")
+        nats = patch.object(health, "_check_nats", new_callable=AsyncMock, return_value="ok")
+        with db, ping, vault, nats:
+            start = time.perf_counter()
+            response, code = await health._run_health_checks()
+            elapsed = time.perf_counter() - start
+
+        assert response["redis"] == "ok"
+        assert code == 200
+        assert elapsed < 0.35
+
+    @pytest.mark.asyncio
+    async def test_deep_health_runs_db_and_celery_concurrently(self):
+        async def slow_db_state():
+            await asyncio.sleep(0.2)
+            return {"db_connected": True, "active_connections": 3}
+
+        def slow_ping():
+            time.sleep(0.2)
+            return True
+
+        with (
+            patch.object(health, "_deep_db_state", side_effect=slow_db_state),
+            patch.object(health, "_celery_ping", side_effect=slow_ping),
+        ):
+            start = time.perf_counter()
+            resp = await health.deep_health()
+            elapsed = time.perf_counter() - start
+
+        body = json.loads(resp.body)
+        assert body["db_connected"] is True
+        assert body["celery_ping"] is True
+        assert resp.status_code == 200
+        assert elapsed < 0.35
+
+
+class TestDeepHealthCache:
+    @pytest.mark.asyncio
+    async def test_deep_probes_cached_within_ttl(self):
+        db_state = AsyncMock(return_value={"db_connected": True, "active_connections": 1})
+        with (
+            patch.object(health, "_deep_db_state", db_state),
+            patch.object(health, "_celery_ping", return_value=True) as ping,
+        ):
+            await health.deep_health()
+            resp = await health.deep_health()
+
+        assert db_state.await_count == 1
+        assert ping.call_count == 1
+        assert "stale" not in json.loads(resp.body)
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_serves_stale_and_tags_it(self):
+        db_state = AsyncMock(
+            side_effect=[{"db_connected": True, "active_connections": 1}, RuntimeError("db down")]
+        )
+        with (
+            patch.object(health, "_deep_db_state", db_state),
+            patch.object(health, "_celery_ping", return_value=True),
+            patch.object(health, "_HEALTH_CACHE_TTL", 0),
+        ):
+            await health.deep_health()
+            resp = await health.deep_health()
+
+        body = json.loads(resp.body)
+        assert resp.status_code == 503
+        assert body["db_connected"] is False
+        assert body["active_connections"] == 1
+        assert body["stale"] == ["deep_db"]
+
+    @pytest.mark.asyncio
+    async def test_outage_past_max_stale_is_not_masked(self):
+        db_state = AsyncMock(
+            side_effect=[{"db_connected": True, "active_connections": 1}, RuntimeError("db down")]
+        )
+        with (
+            patch.object(health, "_deep_db_state", db_state),
+            patch.object(health, "_celery_ping", return_value=True),
+            patch.object(health, "_HEALTH_CACHE_TTL", 10),
+            patch.object(health, "_HEALTH_MAX_STALE", 30),
+            patch("app.utils.ttl_cache.time") as clock,
+        ):
+            clock.monotonic.return_value = 0.0
+            await health.deep_health()
+            clock.monotonic.return_value = 3600.0
+            resp = await health.deep_health()
+
+        body = json.loads(resp.body)
+        assert resp.status_code == 503
+        assert body["db_connected"] is False
+        assert "stale" not in body
+
+    @pytest.mark.asyncio
+    async def test_celery_workers_not_reported_past_max_stale(self):
+        from fastapi import HTTPException
+
+        inspect = AsyncMock(side_effect=[({"w1": []}, {"w1": []}), RuntimeError("broker down")])
+        with (
+            patch.object(health, "_celery_inspect", inspect),
+            patch.object(health, "_HEALTH_CACHE_TTL", 10),
+            patch.object(health, "_HEALTH_MAX_STALE", 30),
+            patch("app.utils.ttl_cache.time") as clock,
+        ):
+            clock.monotonic.return_value = 0.0
+            assert (await health.celery_health_check())["workers"] == 1
+            clock.monotonic.return_value = 3600.0
+            with pytest.raises(HTTPException) as exc:
+                await health.celery_health_check()
+
+        assert exc.value.status_code == 503
+
+
+class TestProbeClients:
+    @pytest.mark.asyncio
+    async def test_redis_client_reused_across_pings(self):
+        client = MagicMock()
+        with patch("redis.from_url", return_value=client) as from_url:
+            health._redis_ping()
+            health._redis_ping()
+            await health.close_probe_clients()
+
+        from_url.assert_called_once()
+        assert client.ping.call_count == 2
+        client.close.assert_called_once()
+        assert health._redis_client is None
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_and_recreated_after_close(self):
+        first = health._get_http_client()
+        assert health._get_http_client() is first
+        await health.close_probe_clients()
+        assert first.is_closed
+        second = health._get_http_client()
+        assert second is not first
+        await health.close_probe_clients()
+
+
+class TestDatabaseProbe:
+    @pytest.mark.asyncio
+    async def test_slow_pool_checkout_is_bounded_by_timeout(self):
+        class _HangingConnect:
+            async def __aenter__(self):
+                await asyncio.sleep(5)
+
+            async def __aexit__(self, *exc):
+                return False
+
+        engine = MagicMock(connect=MagicMock(return_value=_HangingConnect()))
+        with patch.object(health, "probe_engine", engine), patch.object(health, "_CHECK_TIMEOUT", 0.05):
+            start = time.perf_counter()
+            result = await health._check_database()
+
+        assert result == "error"
+        assert time.perf_counter() - start < 1
+
+    @pytest.mark.asyncio
+    async def test_select_one_via_scalar(self):
+        conn = MagicMock(scalar=AsyncMock(return_value=1))
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+        engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+        with patch.object(health, "probe_engine", engine):
+            assert await health._check_database() == "ok"
+        conn.scalar.assert_awaited_once()
@@ -0,0 +1,48 @@
+"""
+Unit tests guarding against redundant table and index declarations on the
+ORM models.
+"""
+import ast
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import app.models  # noqa: F401  (registers the models on Base.metadata)
+from app.models.base import Base
+
+MODELS_DIR = Path(app.models.__file__).parent
+
+
+class TestModelIndexes:
+    def test_no_two_indexes_cover_the_same_columns(self):
+        duplicates = []
+        for table in Base.metadata.tables.values():
+            seen = defaultdict(list)
+            for index in table.indexes:
+                key = (tuple(str(e) for e in index.expressions), str(index.dialect_options["postgresql"]["where"]))
+                seen[key].append(index.name)
+            duplicates += [(table.name, names) for names in seen.values() if len(names) > 1]
+
+        assert duplicates == []
+
+    def test_primary_keys_are_not_also_unique(self):
+        redundant = [
+            f"{table.name}.{column.name}"
+            for table in Base.metadata.tables.values()
+            for column in table.primary_key.columns
+            if column.unique
+        ]
+
+        assert redundant == []
+
+    def test_each_table_is_declared_by_one_model(self):
+        # Parse the sources rather than Base.metadata so a module that is not
+        # imported by app.models still counts.
+        names = Counter()
+        for path in MODELS_DIR.glob("*.py"):
+            for node in ast.walk(ast.parse(path.read_text())):
+                if isinstance(node, ast.Assign) and any(
+                    isinstance(t, ast.Name) and t.id == "__tablename__" for t in node.targets
+                ):
+                    names[ast.literal_eval(node.value)] += 1
+
+        assert [name for name, count in names.items() if count > 1] == []
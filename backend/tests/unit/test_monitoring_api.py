@@ -0,0 +1,105 @@
+"""
+Unit tests for the monitoring API: concurrent monitors in /health/detailed and
+the cached Prometheus scrape body.
+"""
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api import monitoring
+
+
+def _slow(value, delay=0.2):
+    def call(*args, **kwargs):
+        time.sleep(delay)
+        return value
+
+    return call
+
+
+class TestHealthDetailed:
+    @pytest.mark.asyncio
+    async def test_monitors_run_concurrently_and_thresholds_apply(self):
+        system = MagicMock(
+            get_memory_usage=_slow({"percent": 91}),
+            get_disk_usage=_slow({"alert_high": False}),
+            get_cpu_usage=_slow({"percent": 5}),
+        )
+        cost = MagicMock(
+            get_stats=_slow({"over_budget": False, "today_cost": 0.0}),
+            get_daily_cost_breakdown=_slow({}),
+        )
+        queue = MagicMock(get_worker_status=_slow({"congested": True, "queue_depth": 120}))
+        alerts = MagicMock(get_active_alerts=_slow([]))
+        cache = MagicMock(get_hit_rate=_slow(0.9), get_total_tokens_saved=_slow(10))
+
+        with (
+            patch.object(monitoring, "get_system_monitor", return_value=system),
+            patch.object(monitoring, "get_cost_tracker", return_value=cost),
+            patch.object(monitoring, "get_queue_monitor", return_value=queue),
+            patch.object(monitoring, "get_alert_manager", return_value=alerts),
+            patch.object(monitoring, "cache_monitor", cache),
+            patch.object(monitoring, "_cached_redis_info", AsyncMock(return_value={"available": False})),
+        ):
+            start = time.perf_counter()
+            resp = await monitoring.health_detailed()
+            elapsed = time.perf_counter() - start
+
+        body = json.loads(resp.body)
+        assert elapsed < 0.6
+        assert body["status"] == "degraded"
+        assert body["issues"] == ["High memory usage: 91%", "Queue congested: 120 tasks"]
+        assert body["monitoring"]["cpu"] == {"percent": 5}
+        assert isinstance(body["services"]["minimax"]["timestamp"], str)
+
+
+class TestPrometheusScrapeCache:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        monitoring._probe_cache.clear()
+        yield
+        monitoring._probe_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_second_scrape_within_ttl_is_a_hit(self):
+        render = AsyncMock(return_value=b"sowknow_up 1\n")
+        with patch.object(monitoring, "_render_metrics", render):
+            first = await monitoring.prometheus_metrics()
+            second = await monitoring.prometheus_metrics()
+
+        render.assert_awaited_once()
+        assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+        assert second.body == b"sowknow_up 1\n"
+        assert second.headers["cache-control"] == "public, max-age=5"
+
+    @pytest.mark.asyncio
+    async def test_failed_render_serves_last_good_body(self):
+        render = AsyncMock(side_effect=[b"sowknow_up 1\n", RuntimeError("boom")])
+        with patch.object(monitoring, "_render_metrics", render), patch.object(monitoring, "_METRICS_CACHE_TTL", 0):
+            await monitoring.prometheus_metrics()
+            resp = await monitoring.prometheus_metrics()
+
+        assert resp.status_code == 200
+        assert resp.body == b"sowknow_up 1\n"
+
+
+class TestAlertsEndpoint:
+    @pytest.mark.asyncio
+    async def test_configured_alerts_serialized_once_per_registration(self):
+        from app.services.monitoring import AlertConfig, AlertManager
+
+        manager = AlertManager()
+        manager.register_alert(AlertConfig("disk", 85.0))
+        with patch.object(monitoring, "get_alert_manager", return_value=manager):
+            first = await monitoring.get_alerts()
+            second = await monitoring.get_alerts()
+            manager.register_alert(AlertConfig("cpu", 90.0, duration_seconds=60))
+            third = await monitoring.get_alerts()
+
+        assert first["configured_alerts"] is second["configured_alerts"]
+        assert first["configured_alerts"] == [
+            {"name": "disk", "threshold": 85.0, "comparison": "gt", "duration_seconds": 300, "enabled": True}
+        ]
+        assert [a["name"] for a in third["configured_alerts"]] == ["disk", "cpu"]
@@ -0,0 +1,44 @@
+"""
+Unit tests for the NameEnum column type (name-stored enum tolerant of value rows).
+"""
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select, text
+
+from app.models.audit import AuditAction
+from app.models.base import NameEnum
+
+metadata = MetaData()
+events = Table(
+    "events",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("action", NameEnum(AuditAction)),
+)
+
+
+@pytest.fixture
+def conn():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        yield connection
+
+
+class TestNameEnum:
+    def test_binds_member_name(self, conn):
+        conn.execute(insert(events).values(id=1, action=AuditAction.USER_CREATED))
+        assert conn.execute(text("SELECT action FROM events")).scalar() == "USER_CREATED"
+
+    def test_reads_names_and_values(self, conn):
+        conn.execute(text("INSERT INTO events (id, action) VALUES (1, 'ADMIN_LOGIN'), (2, 'confidential_accessed')"))
+        rows = conn.execute(select(events.c.action).order_by(events.c.id)).scalars().all()
+        assert rows == [AuditAction.ADMIN_LOGIN, AuditAction.CONFIDENTIAL_ACCESSED]
+
+    def test_filter_by_value_string(self, conn):
+        conn.execute(insert(events).values(id=1, action=AuditAction.SYSTEM_ACTION))
+        stmt = select(events.c.id).where(events.c.action == "system_action")
+        assert conn.execute(stmt).scalar() == 1
+
+    def test_unknown_value_rejected(self, conn):
+        with pytest.raises(Exception, match="not a valid AuditAction"):
+            conn.execute(insert(events).values(id=1, action="nope"))
@@ -11,19 +11,25 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "backend", "app"))
 
 try:
+    from app import network_utils
     from app.network_utils import (
         RETRYABLE_EXCEPTIONS,
         CircuitBreaker,
         CircuitBreakerOpenError,
         ResilientAsyncClient,
+        close_shared_clients,
+        resilient_request,
         with_retry,
     )
 except ImportError:
+    import network_utils
     from network_utils import (
         RETRYABLE_EXCEPTIONS,
         CircuitBreaker,
         CircuitBreakerOpenError,
         ResilientAsyncClient,
+        close_shared_clients,
+        resilient_request,
         with_retry,
     )
 
@@ -96,6 +102,22 @@ class TestCircuitBreaker:
         cb._record_failure()
         assert cb.state == "OPEN"
 
+    def test_half_open_admits_one_trial_at_a_time(self):
+        """Test HALF_OPEN lets a single probe through until it resolves."""
+        cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0, half_open_success_threshold=2)
+        cb._record_failure()
+
+        assert cb._can_execute()
+        assert cb.state == "HALF_OPEN"
+        assert not cb._can_execute()
+
+        cb._record_success()
+        assert cb.state == "HALF_OPEN"
+        assert cb._can_execute()
+
+        cb._release_probe()
+        assert cb._can_execute()
+
     def test_cannot_execute_when_open(self):
         """Test request is rejected when circuit is OPEN."""
         cb = CircuitBreaker(failure_threshold=1)
@@ -186,6 +208,17 @@ class TestWithRetry:
 
         assert call_count == 1
 
+    def test_default_policy_is_shared_and_preserves_metadata(self):
+        """Test equal configurations reuse one tenacity policy."""
+        assert with_retry() is with_retry()
+        assert with_retry(max_attempts=5) is not with_retry()
+
+        @with_retry()
+        async def fetch():
+            return 1
+
+        assert fetch.__name__ == "fetch"
+
 
 class TestResilientAsyncClient:
     """Tests for ResilientAsyncClient class."""
@@ -267,6 +300,71 @@ class TestResilientAsyncClient:
         await client.close()
 
 
+class TestRetryAttempts:
+    """Retries happen once, in ``request``, not again in the verb helpers."""
+
+    @pytest.mark.asyncio
+    async def test_persistent_failure_makes_exactly_max_attempts_calls(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            raise httpx.ConnectError("down", request=request)
+
+        network_utils._shared_clients["http://flaky.test"] = httpx.AsyncClient(
+            base_url="http://flaky.test", transport=httpx.MockTransport(handler)
+        )
+        client = ResilientAsyncClient(base_url="http://flaky.test", max_attempts=3, min_wait=0)
+        try:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("/x")
+        finally:
+            await close_shared_clients()
+
+        assert len(calls) == 3
+        assert client.get_circuit_breaker_status()["failure_count"] == 1
+
+
+class TestSharedClientPool:
+    """Tests for the per-base_url pooled httpx clients."""
+
+    @pytest.mark.asyncio
+    async def test_instances_share_one_client_per_base_url(self):
+        a = ResilientAsyncClient(base_url="http://pool.test")
+        b = ResilientAsyncClient(base_url="http://pool.test")
+        other = ResilientAsyncClient(base_url="http://other.test")
+
+        shared = await a._get_client()
+        assert await b._get_client() is shared
+        assert await other._get_client() is not shared
+
+        await a.close()
+        assert not shared.is_closed
+
+        await close_shared_clients()
+        assert shared.is_closed
+        assert network_utils._shared_clients == {}
+
+    @pytest.mark.asyncio
+    async def test_resilient_request_reuses_pool_and_applies_timeout(self):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.extensions["timeout"]["read"])
+            return httpx.Response(200)
+
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        network_utils._shared_clients[""] = pooled
+        try:
+            await resilient_request("GET", "http://svc.test/a", timeout=3.0)
+            await resilient_request("GET", "http://svc.test/b", timeout=7.0)
+            assert not pooled.is_closed
+        finally:
+            await close_shared_clients()
+
+        assert seen == [3.0, 7.0]
+
+
 class TestRetryableExceptions:
     """Tests for retryable exceptions tuple."""
 
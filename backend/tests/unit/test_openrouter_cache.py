@@ -124,6 +124,26 @@ class TestCacheKeyGeneration:
 
         assert key1 != key2
 
+    def test_generate_cache_key_matches_json_dumps_format(self):
+        """Keys must not change with the serializer, or every cached entry misses."""
+        import hashlib
+        import json
+
+        service = OpenRouterService()
+        messages = [
+            {"role": "system", "content": "Réponds en français.\n\t\x01"},
+            {"role": "user", "content": 'Quote "this" / that \\ 😀'},
+        ]
+
+        legacy = hashlib.sha256(
+            (
+                "test-model:standard:global:"
+                + json.dumps(messages, separators=(",", ":"), ensure_ascii=False)
+            ).encode("utf-8")
+        ).hexdigest()
+
+        assert service._generate_cache_key("test-model", messages) == f"{CACHE_KEY_PREFIX}{legacy}"
+
 
 class TestCacheHitScenario:
     """Tests for cache hit behavior."""
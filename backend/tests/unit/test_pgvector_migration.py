@@ -52,6 +52,69 @@ class TestDocumentChunkModel:
         col_type = str(col.type)
         assert "1024" in col_type or hasattr(col.type, "dimensions")
 
+    def test_embedding_index_is_halfvec_hnsw_cosine(self):
+        """The only vector index is HNSW over halfvec with the cosine opclass"""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+
+        import app.models.document as document_module
+
+        if document_module.Vector is None:
+            pytest.skip("pgvector not installed")
+        indexes = [i for i in DocumentChunk.__table__.indexes if "embedding_vector" in str(i.expressions)]
+        assert [i.name for i in indexes] == ["ix_document_chunks_embedding_halfvec_hnsw"]
+        ddl = str(CreateIndex(indexes[0]).compile(dialect=postgresql.dialect()))
+        assert (
+            "USING hnsw ((embedding_vector::halfvec(1024)) halfvec_cosine_ops) "
+            "WITH (m = 16, ef_construction = 64)"
+        ) in ddl
+
+    @pytest.mark.requires_postgres
+    @pytest.mark.asyncio
+    async def test_semantic_search_reranks_halfvec_candidates_on_fp32(self, db, async_db):
+        """Results come back in exact FP32 cosine order with FP32 similarities"""
+        from app.services.search_cache import SearchCache
+        from app.services.search_service import HybridSearchService
+
+        rng = np.random.default_rng(0)
+        doc = Document(
+            filename="v.pdf",
+            original_filename="v.pdf",
+            file_path="/tmp/v.pdf",
+            bucket=DocumentBucket.PUBLIC,
+            status=DocumentStatus.INDEXED,
+            size=1,
+            mime_type="application/pdf",
+        )
+        db.add(doc)
+        db.flush()
+        vectors = rng.standard_normal((20, 1024)).astype(np.float32)
+        for i, vector in enumerate(vectors):
+            db.add(
+                DocumentChunk(
+                    document_id=doc.id,
+                    chunk_index=i,
+                    chunk_text=f"chunk {i}",
+                    embedding_vector=vector.tolist(),
+                )
+            )
+        db.commit()
+
+        query = rng.standard_normal(1024).astype(np.float32)
+        expected = (vectors @ query) / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+
+        embedder = MagicMock(can_embed=True)
+        embedder.encode_query.return_value = query.tolist()
+        with (
+            patch("app.services.search_service.embedding_service", embedder),
+            patch.object(SearchCache, "get_embedding", return_value=None),
+            patch.object(SearchCache, "set_embedding"),
+        ):
+            results = await HybridSearchService().semantic_search("q", limit=20, db=async_db)
+
+        assert [r.chunk_index for r in results] == list(np.argsort(-expected))
+        assert [r.semantic_score for r in results] == pytest.approx(sorted(expected, reverse=True), abs=1e-6)
+
 
 class TestEmbeddingStorage:
     """Tests for embedding storage in vector column"""
@@ -30,6 +30,15 @@ class TestNormaliseQuery:
     def test_removes_zero_width_chars(self):
         assert normalise_query("hello\u200bworld") == "helloworld"
 
+    def test_removes_control_chars_and_non_breaking_spaces(self):
+        assert normalise_query("hello\x07\u00a0world\u2028!") == "hello world"
+
+    def test_repeated_queries_hit_the_cache(self):
+        normalise_query.cache_clear()
+        for _ in range(3):
+            normalise_query("Repeated Query")
+        assert normalise_query.cache_info().hits == 2
+
     def test_empty_and_none(self):
         assert normalise_query("") == ""
         assert normalise_query(None) == ""
@@ -0,0 +1,45 @@
+"""
+Unit tests for deferring RLS set_config until a request session begins a transaction.
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.middleware.rls import RLSContext, _apply_rls_on_begin, bind_rls_context
+
+CTX = RLSContext(user_id="u-1", user_role="admin", client_ip="10.0.0.1")
+
+
+class TestBindRLSContext:
+    @pytest.mark.asyncio
+    async def test_bind_does_not_touch_database(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        session = AsyncSession(engine)
+        session.execute = AsyncMock()
+
+        await bind_rls_context(session, CTX)
+
+        session.execute.assert_not_called()
+        assert not session.in_transaction()
+        assert session.info["rls_context"] is CTX
+        await session.close()
+        await engine.dispose()
+
+    def test_listener_sets_config_on_postgres_begin(self):
+        session = MagicMock(info={"rls_context": CTX})
+        connection = MagicMock()
+        connection.dialect.name = "postgresql"
+
+        _apply_rls_on_begin(session, None, connection)
+
+        params = connection.execute.call_args.args[1]
+        assert params == {"uid": "u-1", "role": "admin", "ip": "10.0.0.1"}
+
+    def test_listener_ignores_sessions_without_context(self):
+        connection = MagicMock()
+        connection.dialect.name = "postgresql"
+
+        _apply_rls_on_begin(MagicMock(info={}), None, connection)
+
+        connection.execute.assert_not_called()
@@ -0,0 +1,30 @@
+"""
+Unit tests for the lazily resolved app.schemas package exports.
+"""
+import subprocess
+import sys
+
+import pytest
+
+import app.schemas as schemas
+
+
+class TestSchemasPackage:
+    def test_every_exported_name_resolves(self):
+        for name in schemas.__all__:
+            assert getattr(schemas, name) is not None
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            schemas.DoesNotExist  # noqa: B018
+
+    def test_importing_one_submodule_does_not_load_the_others(self):
+        code = (
+            "import sys, app.schemas.token; "
+            "print(sorted(m for m in sys.modules if m.startswith('app.schemas.')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert "app.schemas.smart_folder" not in out
+        assert "app.schemas.collection" not in out
@@ -0,0 +1,48 @@
+"""
+Unit tests for SearchCache value encoding.
+"""
+import uuid
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from app.services.search_cache import SearchCache
+
+
+def _dict_backed_redis() -> MagicMock:
+    store: dict[str, str] = {}
+    redis = MagicMock()
+    # decode_responses=True: values come back as str.
+    redis.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value.decode())
+    redis.get.side_effect = store.get
+    return redis
+
+
+class TestSearchCacheEncoding:
+    def test_result_with_numpy_scores_and_uuids_round_trips(self):
+        doc_id = uuid.uuid4()
+        result = {
+            "results": [{"document_id": doc_id, "score": np.float32(0.5)}],
+            "created_at": datetime(2024, 1, 2, 3, 4, 5),
+        }
+        with patch("app.services.search_cache._get_redis", return_value=_dict_backed_redis()):
+            SearchCache.set_result("q", "user", 10, ["public"], result)
+            cached = SearchCache.get_result("q", "user", 10, ["public"])
+
+        assert cached["results"] == [{"document_id": str(doc_id), "score": 0.5}]
+        assert cached["created_at"] == "2024-01-02T03:04:05"
+
+    def test_unknown_types_fall_back_to_str(self):
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+
+        with patch("app.services.search_cache._get_redis", return_value=_dict_backed_redis()):
+            SearchCache.set_collection_gather("q", "user", [{"value": Opaque()}])
+            assert SearchCache.get_collection_gather("q", "user") == [{"value": "opaque"}]
+
+    def test_embedding_round_trips(self):
+        with patch("app.services.search_cache._get_redis", return_value=_dict_backed_redis()):
+            SearchCache.set_embedding("q", [0.25, -1.0])
+            assert SearchCache.get_embedding("q") == [0.25, -1.0]
@@ -0,0 +1,22 @@
+"""
+Unit tests for the pre-serialized /api/v1/status payload.
+"""
+import json
+
+import pytest
+
+from app.api import status
+
+
+class TestApiStatus:
+    @pytest.mark.asyncio
+    async def test_returns_precomputed_json(self):
+        first = await status.api_status()
+        second = await status.api_status()
+
+        assert first.media_type == "application/json"
+        assert first.body is status._API_STATUS_BYTES
+        assert first.body == second.body
+        data = json.loads(first.body)
+        assert data["version"] == "3.0.0"
+        assert any(f["name"] == "Multi-Agent Search" for f in data["features"])
@@ -0,0 +1,91 @@
+"""
+Unit tests for FastTrustedHostMiddleware (case-insensitive host allow-list).
+"""
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.trusted_host import FastTrustedHostMiddleware
+
+ORIGIN = "https://sowknow.example.com"
+
+
+def _client(allowed_hosts) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/")
+    async def root():
+        return {"ok": True}
+
+    app.add_middleware(FastTrustedHostMiddleware, allowed_hosts=allowed_hosts)
+    return TestClient(app)
+
+
+class TestFastTrustedHost:
+    def test_exact_host_is_case_insensitive(self):
+        client = _client(("Sowknow.Example.com",))
+        assert client.get("/", headers={"host": "sowknow.example.com"}).status_code == 200
+        assert client.get("/", headers={"host": "SOWKNOW.EXAMPLE.COM:443"}).status_code == 200
+
+    def test_unknown_host_rejected(self):
+        resp = _client(("sowknow.example.com",)).get("/", headers={"host": "evil.test"})
+        assert resp.status_code == 400
+        assert resp.text == "Invalid host header"
+
+    def test_wildcard_subdomain(self):
+        client = _client(("*.example.com",))
+        assert client.get("/", headers={"host": "api.Example.com"}).status_code == 200
+        assert client.get("/", headers={"host": "example.com"}).status_code == 400
+
+    def test_www_redirect(self):
+        resp = _client(("www.example.com",)).get(
+            "/", headers={"host": "example.com"}, follow_redirects=False
+        )
+        assert resp.status_code == 307
+        assert resp.headers["location"].startswith("http://www.example.com")
+
+
+class TestMiddlewareOrder:
+    def _client(self) -> TestClient:
+        from app import main
+
+        app = FastAPI()
+
+        @app.get("/items")
+        async def items():
+            return []
+
+        with (
+            patch.object(main, "ALLOWED_HOSTS", ("api.example.com",)),
+            patch.object(main, "ALLOWED_ORIGINS", frozenset({ORIGIN})),
+        ):
+            main._add_middleware(app)
+        return TestClient(app)
+
+    def test_preflight_answered_by_cors_with_max_age(self):
+        resp = self._client().options(
+            "/items",
+            headers={"host": "evil.test", "origin": ORIGIN, "access-control-request-method": "POST"},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["access-control-max-age"]
+
+    def test_host_rejection_still_carries_cors_headers(self):
+        resp = self._client().get("/items", headers={"host": "evil.test", "origin": ORIGIN})
+        assert resp.status_code == 400
+        assert resp.headers["access-control-allow-origin"] == ORIGIN
+
+    def test_preflight_skips_inner_middleware(self):
+        with (
+            patch("app.middleware.transaction.AsyncSessionLocal") as session_factory,
+            patch("app.middleware.rls.extract_rls_context") as extract,
+        ):
+            resp = self._client().options(
+                "/items",
+                headers={"host": "api.example.com", "origin": ORIGIN, "access-control-request-method": "POST"},
+            )
+        assert resp.status_code == 200
+        assert "x-request-id" not in resp.headers
+        session_factory.assert_not_called()
+        extract.assert_not_called()
@@ -0,0 +1,84 @@
+"""
+Unit tests for the unvalidated (trusted ORM row) response constructors.
+
+from_orm_trusted must produce exactly what model_validate produces for the
+same row, since the response then goes out without further validation.
+"""
+from app.models.collection import Collection, CollectionItem, CollectionType, CollectionVisibility
+from app.models.document import Document, DocumentBucket, DocumentStatus
+from app.models.user import User, UserRole
+from app.schemas.collection import CollectionDetailResponse, CollectionItemResponse, CollectionResponse
+from app.schemas.document import DocumentResponse
+
+
+def _document(db, **overrides) -> Document:
+    doc = Document(
+        filename="a.pdf",
+        original_filename="a.pdf",
+        file_path="/data/public/a.pdf",
+        bucket=DocumentBucket.PUBLIC,
+        status=DocumentStatus.ERROR,
+        size=42,
+        mime_type="application/pdf",
+        **overrides,
+    )
+    db.add(doc)
+    db.commit()
+    db.refresh(doc)
+    return doc
+
+
+def _dump(model) -> dict:
+    return model.model_dump(mode="json", by_alias=True)
+
+
+class TestDocumentResponse:
+    def test_matches_model_validate(self, db):
+        doc = _document(db, pipeline_error="ocr failed")
+        assert _dump(DocumentResponse.from_orm_trusted(doc)) == _dump(DocumentResponse.model_validate(doc))
+
+    def test_error_message_prefers_metadata(self, db):
+        doc = _document(db, pipeline_error="ocr failed", document_metadata={"processing_error": "bad pdf"})
+        response = DocumentResponse.from_orm_trusted(doc)
+        assert response.error_message == "bad pdf"
+        assert _dump(response)["file_size"] == 42
+
+
+class TestCollectionResponses:
+    def _collection(self, db) -> Collection:
+        user = User(email="owner@x.io", hashed_password="x", role=UserRole.ADMIN)
+        db.add(user)
+        db.flush()
+        collection = Collection(
+            user_id=user.id,
+            name="c",
+            query="q",
+            collection_type=CollectionType.SMART,
+            visibility=CollectionVisibility.PRIVATE,
+        )
+        db.add(collection)
+        db.commit()
+        db.refresh(collection)
+        return collection
+
+    def test_collection_matches_model_validate(self, db):
+        collection = self._collection(db)
+        assert _dump(CollectionResponse.from_orm_trusted(collection)) == _dump(
+            CollectionResponse.model_validate(collection)
+        )
+
+    def test_detail_and_items(self, db):
+        collection = self._collection(db)
+        item = CollectionItem(collection_id=collection.id, document_id=_document(db).id)
+        db.add(item)
+        db.commit()
+        db.refresh(item)
+
+        item_response = CollectionItemResponse.from_orm_trusted(item)
+        expected = CollectionItemResponse.model_validate(item)
+        expected.document = None
+        assert _dump(item_response) == _dump(expected)
+
+        detail = _dump(CollectionDetailResponse.from_orm_trusted(collection, items=[item_response]))
+        assert detail["id"] == str(collection.id)
+        assert [i["id"] for i in detail["items"]] == [str(item.id)]
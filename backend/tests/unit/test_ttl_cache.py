@@ -0,0 +1,79 @@
+"""
+Unit tests for the AsyncTTLCache helper (single-flight, stale-on-error).
+"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.utils.ttl_cache import AsyncTTLCache
+
+
+class TestAsyncTTLCache:
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl_skips_factory(self):
+        cache = AsyncTTLCache()
+        factory = AsyncMock(return_value={"ok": True})
+
+        assert await cache.get_or_set("k", 60, factory) == {"ok": True}
+        assert await cache.get_or_set("k", 60, factory) == {"ok": True}
+        assert factory.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self):
+        cache = AsyncTTLCache()
+        calls = 0
+
+        async def slow():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        results = await asyncio.gather(*(cache.get_or_set("k", 60, slow) for _ in range(20)))
+        assert calls == 1
+        assert set(results) == {1}
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_when_refresh_fails(self):
+        cache = AsyncTTLCache()
+        await cache.get_or_set("k", 0, AsyncMock(return_value="good"))
+
+        failing = AsyncMock(side_effect=ConnectionError("down"))
+        assert await cache.get_or_set("k", 0, failing) == "good"
+        failing.assert_awaited_once()
+        assert cache.is_stale("k")
+
+        await cache.get_or_set("k", 0, AsyncMock(return_value="fresh"))
+        assert not cache.is_stale("k")
+
+    @pytest.mark.asyncio
+    async def test_stale_value_bounded_by_max_stale(self):
+        cache = AsyncTTLCache()
+        with patch("app.utils.ttl_cache.time") as clock:
+            clock.monotonic.return_value = 100.0
+            await cache.get_or_set("k", 10, AsyncMock(return_value="good"), max_stale=30)
+
+            failing = AsyncMock(side_effect=ConnectionError("down"))
+            clock.monotonic.return_value = 139.0
+            assert await cache.get_or_set("k", 10, failing, max_stale=30) == "good"
+            assert cache.is_stale("k")
+
+            clock.monotonic.return_value = 140.0
+            with pytest.raises(ConnectionError):
+                await cache.get_or_set("k", 10, failing, max_stale=30)
+            assert not cache.is_stale("k")
+
+    @pytest.mark.asyncio
+    async def test_error_without_cached_value_propagates(self):
+        cache = AsyncTTLCache()
+        with pytest.raises(ConnectionError):
+            await cache.get_or_set("k", 5, AsyncMock(side_effect=ConnectionError("down")))
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refresh(self):
+        cache = AsyncTTLCache()
+        factory = AsyncMock(side_effect=[1, 2])
+        await cache.get_or_set("k", 60, factory)
+        cache.invalidate("k")
+        assert await cache.get_or_set("k", 60, factory) == 2
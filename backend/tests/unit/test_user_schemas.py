@@ -0,0 +1,46 @@
+"""Unit tests for the user request schemas."""
+import random
+import re
+import string
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.user import UserCreate
+
+_REGEX_RULES = [r"[A-Z]", r"[a-z]", r"\d", r"[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]"]
+
+
+def _accepted(password: str) -> bool:
+    try:
+        UserCreate(email="u@example.com", password=password)
+    except ValidationError:
+        return False
+    return True
+
+
+class TestPasswordComplexity:
+    @pytest.mark.parametrize(
+        ("password", "message"),
+        [
+            ("Ab1!", "at least 8 characters"),
+            ("abcdefg1!", "uppercase"),
+            ("ABCDEFG1!", "lowercase"),
+            ("Abcdefgh!", "digit"),
+            ("Abcdefgh1", "special character"),
+        ],
+    )
+    def test_reports_first_missing_class(self, password, message):
+        with pytest.raises(ValidationError, match=message):
+            UserCreate(email="u@example.com", password=password)
+
+    def test_non_ascii_decimal_digit_counts_as_digit(self):
+        assert _accepted("Abcdefgh!٣")
+
+    def test_matches_regex_rules(self):
+        rng = random.Random(0)
+        alphabet = string.ascii_letters + string.digits + "!@#$%^&*()_+-=[]{}|;:,.<>?~ é٣"
+        for _ in range(2000):
+            password = "".join(rng.choice(alphabet) for _ in range(rng.randint(8, 16)))
+            expected = all(re.search(rule, password) for rule in _REGEX_RULES)
+            assert _accepted(password) == expected, password